@@ -0,0 +1,132 @@
+import asyncio
+import hashlib
+import math
+import os
+
+from sqlalchemy import select
+
+from src.infrastructure.cache.invalidation import WORKER_ID, invalidation_bus
+from src.infrastructure.database.connection import async_session
+from src.infrastructure.database.models import UserModel
+
+# 존재하지 않는 사용자 ID를 DB 조회 없이 걸러내는 Bloom 필터 (opt-in)
+USER_BLOOM_FILTER = os.getenv("USER_BLOOM_FILTER", "false").lower() == "true"
+USER_BLOOM_CAPACITY = int(os.getenv("USER_BLOOM_CAPACITY", "1000000"))
+USER_BLOOM_ERROR_RATE = float(os.getenv("USER_BLOOM_ERROR_RATE", "0.01"))
+
+
+class CountingBloomFilter:
+    """Counting Bloom 필터 (8bit 카운터 -> 삭제 지원)
+
+    - "없음" 판정은 확실, "있음" 판정은 error_rate 확률로 오탐 (DB로 확인)
+    - 카운터가 255에 도달하면 고정 (이후 삭제해도 감소시키지 않음 -> 오탐 방향으로만 안전)
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(1, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._counters = bytearray(self.size)
+
+    def _positions(self, key: int) -> list[int]:
+        # double hashing: h1 + i * h2 (해시 1회로 k개 위치 생성)
+        digest = hashlib.blake2b(str(key).encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key: int) -> None:
+        for pos in self._positions(key):
+            if self._counters[pos] < 255:
+                self._counters[pos] += 1
+
+    def remove(self, key: int) -> None:
+        """반드시 add된 키에만 호출 (아니면 다른 키가 "없음"으로 오판될 수 있음)"""
+        positions = self._positions(key)
+        if not all(self._counters[pos] for pos in positions):
+            return
+        for pos in positions:
+            if self._counters[pos] < 255:
+                self._counters[pos] -= 1
+
+    def __contains__(self, key: int) -> bool:
+        return all(self._counters[pos] for pos in self._positions(key))
+
+
+class UserBloomGuard:
+    """users.id 존재 여부 사전 필터
+
+    - lifespan 시작 시 DB의 모든 id로 구축
+    - create/delete는 해당 워커에서 즉시 반영 + 무효화 버스로 다른 워커에 전파
+    - 구축 전/비활성화 상태에서는 항상 "있을 수 있음" (DB 조회로 진행)
+    """
+
+    def __init__(self, enabled: bool = USER_BLOOM_FILTER):
+        # 버스 없이 켜면 다른 워커에서 생성된 사용자를 "없음"으로 판정 -> 버스 필수
+        self.enabled = enabled and invalidation_bus.enabled
+        self._filter: CountingBloomFilter | None = None
+        # 재구축 중 들어온 변경도 새 필터에 반영
+        self._building: CountingBloomFilter | None = None
+        self._rebuild_task: asyncio.Task | None = None
+        # 첫 구독 연결은 lifespan의 초기 구축으로 충분 -> 재연결부터 재구축
+        self._subscribed = False
+
+    @property
+    def ready(self) -> bool:
+        return self._filter is not None
+
+    def might_exist(self, user_id: int) -> bool:
+        if not self.enabled or self._filter is None:
+            return True
+        return user_id in self._filter
+
+    def add(self, user_id: int) -> None:
+        for bloom in (self._filter, self._building):
+            if bloom is not None:
+                bloom.add(user_id)
+
+    def remove(self, user_id: int) -> None:
+        for bloom in (self._filter, self._building):
+            if bloom is not None:
+                bloom.remove(user_id)
+
+    async def rebuild(self) -> None:
+        if not self.enabled:
+            return
+
+        bloom = CountingBloomFilter(USER_BLOOM_CAPACITY, USER_BLOOM_ERROR_RATE)
+        self._building = bloom
+        try:
+            async with async_session() as db:
+                result = await db.stream_scalars(
+                    select(UserModel.id).execution_options(yield_per=10000)
+                )
+                async for user_id in result:
+                    bloom.add(user_id)
+            self._filter = bloom
+        finally:
+            self._building = None
+
+    async def on_invalidation(self, event: dict) -> None:
+        """무효화 버스 핸들러 - 다른 워커의 create/delete 반영"""
+        if not self.enabled:
+            return
+
+        if event["entity"] == "*":
+            # 구독 재연결 (그 사이 이벤트 유실 가능) -> 백그라운드 재구축
+            if not self._subscribed:
+                self._subscribed = True
+            elif self._rebuild_task is None or self._rebuild_task.done():
+                self._rebuild_task = asyncio.create_task(self.rebuild())
+            return
+
+        if event["entity"] != "user" or event.get("origin") == WORKER_ID:
+            return  # 자기 워커의 변경은 요청 처리 중 이미 반영됨
+        if event["op"] == "create":
+            self.add(event["id"])
+        elif event["op"] == "delete":
+            self.remove(event["id"])
+
+
+# 워커당 싱글톤
+user_bloom = UserBloomGuard()
+invalidation_bus.subscribe(user_bloom.on_invalidation)
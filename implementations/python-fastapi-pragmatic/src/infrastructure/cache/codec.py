@@ -0,0 +1,108 @@
+import json
+import os
+import pickle
+import struct
+from typing import Any, Literal
+
+import msgpack
+import orjson
+
+CodecName = Literal["json", "orjson", "msgpack", "pickle", "struct"]
+
+# 요청에서 codec 미지정 시 사용할 기본값
+CACHE_CODEC = os.getenv("CACHE_CODEC", "json")
+
+
+class CacheCodec:
+    """캐시 값 직렬화 인터페이스 (dict <-> bytes)"""
+
+    name: str
+
+    def encode(self, value: dict[str, Any]) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        raise NotImplementedError
+
+
+class JsonCodec(CacheCodec):
+    """표준 라이브러리 json (기존 캐시 값과 동일한 바이트)"""
+
+    name = "json"
+
+    def encode(self, value: dict[str, Any]) -> bytes:
+        return json.dumps(value).encode()
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        return json.loads(data)
+
+
+class OrjsonCodec(CacheCodec):
+    name = "orjson"
+
+    def encode(self, value: dict[str, Any]) -> bytes:
+        return orjson.dumps(value)
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        return orjson.loads(data)
+
+
+class MsgpackCodec(CacheCodec):
+    name = "msgpack"
+
+    def encode(self, value: dict[str, Any]) -> bytes:
+        return msgpack.packb(value)
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        return msgpack.unpackb(data)
+
+
+class PickleCodec(CacheCodec):
+    """신뢰할 수 있는 내부 Redis 전용 (외부 입력을 unpickle하면 안 됨)"""
+
+    name = "pickle"
+
+    def encode(self, value: dict[str, Any]) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        return pickle.loads(data)
+
+
+class StructCodec(CacheCodec):
+    """고정 레이아웃 (id, name, email) - 필드명 없이 값만 저장
+
+    [id: uint32][name 길이: uint16][email 길이: uint16][name][email]
+    """
+
+    name = "struct"
+    _header = struct.Struct("<IHH")
+
+    def encode(self, value: dict[str, Any]) -> bytes:
+        name = value["name"].encode()
+        email = value["email"].encode()
+        return self._header.pack(value["id"], len(name), len(email)) + name + email
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        user_id, name_len, email_len = self._header.unpack_from(data)
+        offset = self._header.size
+        name = data[offset : offset + name_len].decode()
+        email = data[offset + name_len : offset + name_len + email_len].decode()
+        return {"id": user_id, "name": name, "email": email}
+
+
+CODECS: dict[str, CacheCodec] = {
+    codec.name: codec
+    for codec in (
+        JsonCodec(),
+        OrjsonCodec(),
+        MsgpackCodec(),
+        PickleCodec(),
+        StructCodec(),
+    )
+}
+
+
+def get_codec(name: str | None = None) -> CacheCodec:
+    """이름으로 codec 조회 (미지정 시 CACHE_CODEC 환경변수)"""
+    return CODECS[name or CACHE_CODEC]
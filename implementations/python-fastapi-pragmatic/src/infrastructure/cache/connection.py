@@ -5,6 +5,8 @@ REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
 # Redis 클라이언트 (싱글톤)
 redis_client: Redis | None = None
+# 바이너리 값(codec 직렬화)용 클라이언트 - 응답을 str로 디코딩하지 않음
+redis_binary_client: Redis | None = None
 
 
 async def get_redis() -> Redis:
@@ -15,9 +17,20 @@ async def get_redis() -> Redis:
     return redis_client
 
 
+async def get_redis_binary() -> Redis:
+    """FastAPI 의존성 주입용 (bytes 응답)"""
+    global redis_binary_client
+    if redis_binary_client is None:
+        redis_binary_client = Redis.from_url(REDIS_URL, decode_responses=False)
+    return redis_binary_client
+
+
 async def close_redis():
     """앱 종료 시 연결 정리"""
-    global redis_client
+    global redis_client, redis_binary_client
     if redis_client:
         await redis_client.close()
         redis_client = None
+    if redis_binary_client:
+        await redis_binary_client.close()
+        redis_binary_client = None
@@ -0,0 +1,183 @@
+import asyncio
+import json
+import os
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import asyncpg
+from redis.asyncio import Redis
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.cache.connection import REDIS_URL
+from src.infrastructure.database.connection import DATABASE_URL, async_session
+
+# 무효화 전달 방식: postgres (LISTEN/NOTIFY) | redis (pub/sub) | off (기본)
+# 켜면 /users 쓰기마다 pg_notify 1회 + 워커마다 구독 연결 1개 -> 04 등 쓰기 벤치마크 수치가 달라짐
+CACHE_INVALIDATION_BUS = os.getenv("CACHE_INVALIDATION_BUS", "off")
+
+INVALIDATION_CHANNEL = "cache_invalidation"
+RECONNECT_DELAY = 1  # 초
+
+# 구독 연결이 끊겼다 다시 붙은 경우 (그 사이 메시지 유실 가능) -> 전체 비우기
+RESET_EVENT = {"entity": "*"}
+
+# 이벤트 발신 워커 식별자 (자기 변경을 이미 반영한 핸들러가 중복 처리를 건너뛸 때 사용)
+WORKER_ID = uuid.uuid4().hex
+
+Handler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class InvalidationBus:
+    """워커 간 캐시 무효화 버스
+
+    - postgres: 쓰기 트랜잭션 안에서 pg_notify -> 커밋될 때만 전달 (롤백 시 전달 안 됨)
+    - redis: 커밋 후 PUBLISH (Postgres 알림을 쓸 수 없는 환경용 대체 경로)
+    - 각 워커는 lifespan 시작 시 구독, 자기 자신이 보낸 이벤트도 수신
+    """
+
+    def __init__(self, backend: str = CACHE_INVALIDATION_BUS):
+        self.backend = backend
+        self._handlers: list[Handler] = []
+        self._task: asyncio.Task | None = None
+        # 실행 중인 Task가 GC되지 않도록 참조 유지
+        self._pending: set[asyncio.Task] = set()
+        self._redis: Redis | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend in ("postgres", "redis")
+
+    def subscribe(self, handler: Handler) -> None:
+        """이벤트 수신 시 호출할 핸들러 등록 (로컬/Redis 캐시 제거 등)"""
+        self._handlers.append(handler)
+
+    async def publish(self, db: AsyncSession, event_data: dict[str, Any]) -> None:
+        """쓰기 트랜잭션 커밋 전에 호출"""
+        payload = json.dumps({**event_data, "origin": WORKER_ID})
+
+        if self.backend == "postgres":
+            # NOTIFY는 트랜잭션에 묶여 커밋 시점에 전달됨
+            await db.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": INVALIDATION_CHANNEL, "payload": payload},
+            )
+        elif self.backend == "redis":
+            self._publish_after_commit(db, [payload])
+
+    async def publish_many(
+        self, db: AsyncSession, events: list[dict[str, Any]]
+    ) -> None:
+        """여러 이벤트를 문장 1회로 전달 (그룹 커밋 등 배치 쓰기용)"""
+        if not events:
+            return
+        payloads = [json.dumps({**e, "origin": WORKER_ID}) for e in events]
+
+        if self.backend == "postgres":
+            await db.execute(
+                text(
+                    "SELECT pg_notify(:channel, payload) "
+                    "FROM unnest(CAST(:payloads AS text[])) AS payload"
+                ),
+                {"channel": INVALIDATION_CHANNEL, "payloads": payloads},
+            )
+        elif self.backend == "redis":
+            self._publish_after_commit(db, payloads)
+
+    async def notify(self, event_data: dict[str, Any]) -> None:
+        """쓰기 트랜잭션 없이 바로 전달 (캐시 수동 삭제 등), 버스가 꺼져 있으면 무시"""
+        if self.backend == "postgres":
+            async with async_session() as db:
+                await self.publish(db, event_data)
+                await db.commit()
+        elif self.backend == "redis":
+            await self._redis_publish(json.dumps({**event_data, "origin": WORKER_ID}))
+
+    def _publish_after_commit(self, db: AsyncSession, payloads: list[str]) -> None:
+        # 커밋 이후에 PUBLISH (커밋 전에 보내면 다른 워커가 옛 값을 다시 캐시할 수 있음)
+        def after_commit(_session):
+            for payload in payloads:
+                self._spawn(self._redis_publish(payload))
+
+        event.listen(db.sync_session, "after_commit", after_commit, once=True)
+
+    async def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def _run(self) -> None:
+        listen = (
+            self._listen_postgres if self.backend == "postgres" else self._listen_redis
+        )
+        while True:
+            try:
+                await listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                await asyncio.sleep(RECONNECT_DELAY)
+
+    async def _listen_postgres(self) -> None:
+        dsn = DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
+        conn = await asyncpg.connect(dsn)
+        closed = asyncio.Event()
+        try:
+            conn.add_termination_listener(lambda _conn: closed.set())
+            await conn.add_listener(
+                INVALIDATION_CHANNEL,
+                lambda _conn, _pid, _channel, payload: self._spawn(
+                    self._dispatch(json.loads(payload))
+                ),
+            )
+            await self._dispatch(RESET_EVENT)
+            await closed.wait()
+        finally:
+            await conn.close()
+
+    async def _listen_redis(self) -> None:
+        client = Redis.from_url(REDIS_URL, decode_responses=True)
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            await self._dispatch(RESET_EVENT)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    await self._dispatch(json.loads(message["data"]))
+        finally:
+            await pubsub.aclose()
+            await client.aclose()
+
+    async def _redis_publish(self, payload: str) -> None:
+        if self._redis is None:
+            self._redis = Redis.from_url(REDIS_URL, decode_responses=True)
+        await self._redis.publish(INVALIDATION_CHANNEL, payload)
+
+    async def _dispatch(self, event_data: dict[str, Any]) -> None:
+        for handler in self._handlers:
+            try:
+                await handler(event_data)
+            except Exception:
+                # 핸들러 하나의 실패(예: Redis 일시 장애)가 다른 핸들러를 막지 않도록
+                pass
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+
+# 워커당 싱글톤
+invalidation_bus = InvalidationBus()
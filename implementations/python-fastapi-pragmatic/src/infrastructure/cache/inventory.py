@@ -0,0 +1,248 @@
+import asyncio
+import os
+import socket
+import time
+from dataclasses import dataclass
+
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+from sqlalchemy import select, text
+
+from src.infrastructure.cache.connection import get_redis
+from src.infrastructure.database.connection import async_session
+from src.infrastructure.database.models import ProductModel
+
+# Redis 재고 + 비동기 Postgres 반영 사용 여부 (opt-in, Redis 필요)
+REDIS_INVENTORY = os.getenv("REDIS_INVENTORY", "false").lower() == "true"
+WRITEBACK_BATCH = int(os.getenv("INVENTORY_WRITEBACK_BATCH", "500"))
+WRITEBACK_INTERVAL_MS = float(os.getenv("INVENTORY_WRITEBACK_INTERVAL_MS", "50"))
+
+STOCK_KEY = "inventory:stock:{}"
+PENDING_KEY = "inventory:pending"  # hash: product_id -> Postgres 미반영 차감 합계
+STREAM_KEY = "inventory:decrements"
+GROUP = "inventory-writeback"
+WRITEBACK_LOCK = "lock:inventory:writeback"
+# 프로세스(워커)마다 고유한 이름 -> 다른 살아있는 워커의 미확인 메시지를 다시 읽지 않음
+# 재시작으로 사라진 consumer의 미확인 메시지는 XAUTOCLAIM으로 회수 (_claim_stale)
+CONSUMER = f"{socket.gethostname()}-{os.getpid()}"
+
+CLAIM_IDLE_MS = 30000  # 이 시간 이상 미확인인 메시지만 회수 (처리 중인 워커와 경합 방지)
+CLAIM_INTERVAL = 30  # 초
+RECONNECT_DELAY = 1  # 초
+
+# 재고 확인 + 차감 + 미반영 합계 + 스트림 기록을 원자적으로 (단일 스레드 실행)
+# 반환: {1, 차감 후 재고} | {0, 현재 재고(부족)} | {-1, 0} (로드 안 됨)
+DECREMENT_LUA = """
+local stock = tonumber(redis.call('GET', KEYS[1]))
+if not stock then
+    return {-1, 0}
+end
+local quantity = tonumber(ARGV[2])
+if stock < quantity then
+    return {0, stock}
+end
+local new_stock = redis.call('DECRBY', KEYS[1], quantity)
+redis.call('HINCRBY', KEYS[2], ARGV[1], quantity)
+redis.call('XADD', KEYS[3], '*', 'product_id', ARGV[1], 'quantity', ARGV[2])
+return {1, new_stock}
+"""
+
+APPLY_SQL = text("""
+    UPDATE products AS p
+    SET stock = p.stock - v.quantity, updated_at = NOW()
+    FROM unnest(CAST(:ids AS integer[]), CAST(:quantities AS integer[]))
+        AS v(id, quantity)
+    WHERE p.id = v.id
+    """)
+
+
+@dataclass
+class DecrementStatus:
+    loaded: bool
+    success: bool
+    stock: int  # 성공 시 차감 후 재고, 실패 시 현재 재고
+
+
+class RedisInventory:
+    """Redis 재고 카운터 + 스트림 기반 Postgres write-back
+
+    - 요청 경로: Lua 1회 (Postgres 락 없음)
+    - 백그라운드: XREADGROUP으로 모아 상품별 합계를 UPDATE 1회 -> 커밋 후 XACK
+      (at-least-once: 커밋과 XACK 사이 장애 시 재처리 -> 중복 차감 가능, reconcile로 감지)
+    - Redis 장애(AOF 미사용) 시 미반영 차감은 유실 -> 내구성 트레이드오프
+    """
+
+    def __init__(self, enabled: bool = REDIS_INVENTORY):
+        self.enabled = enabled
+        self.applied = 0  # 이 워커가 Postgres에 반영한 메시지 수
+        self._task: asyncio.Task | None = None
+
+    async def load(self) -> int:
+        """Postgres 재고를 Redis로 복사 (미반영 차감/스트림은 폐기)"""
+        redis = await get_redis()
+        async with async_session() as db:
+            rows = (await db.execute(select(ProductModel.id, ProductModel.stock))).all()
+
+        async with redis.lock(WRITEBACK_LOCK, timeout=10):
+            pipe = redis.pipeline(transaction=True)
+            pipe.delete(PENDING_KEY, STREAM_KEY)
+            for product_id, stock in rows:
+                pipe.set(STOCK_KEY.format(product_id), stock)
+            pipe.xgroup_create(STREAM_KEY, GROUP, id="0", mkstream=True)
+            await pipe.execute()
+        return len(rows)
+
+    async def decrement(self, product_id: int, quantity: int) -> DecrementStatus:
+        redis = await get_redis()
+        status, stock = await redis.eval(
+            DECREMENT_LUA,
+            3,
+            STOCK_KEY.format(product_id),
+            PENDING_KEY,
+            STREAM_KEY,
+            product_id,
+            quantity,
+        )
+        return DecrementStatus(loaded=status != -1, success=status == 1, stock=stock)
+
+    async def reconcile(self) -> dict:
+        """Redis 재고 + 미반영 합계 == Postgres 재고 인지 상품별 확인
+
+        write-back 락을 잡은 상태에서 스냅샷 -> 반영 도중의 일시적 불일치 제외
+        """
+        redis = await get_redis()
+        async with redis.lock(WRITEBACK_LOCK, timeout=10):
+            async with async_session() as db:
+                rows = (
+                    await db.execute(select(ProductModel.id, ProductModel.stock))
+                ).all()
+            pipe = redis.pipeline(transaction=True)
+            for product_id, _ in rows:
+                pipe.get(STOCK_KEY.format(product_id))
+            pipe.hgetall(PENDING_KEY)
+            pipe.xlen(STREAM_KEY)
+            *stocks, pending, stream_length = await pipe.execute()
+
+        products = []
+        for (product_id, pg_stock), redis_stock in zip(rows, stocks, strict=True):
+            if redis_stock is None:
+                continue  # 로드 안 된 상품
+            unapplied = int(pending.get(str(product_id), 0))
+            products.append(
+                {
+                    "product_id": product_id,
+                    "redis_stock": int(redis_stock),
+                    "pending": unapplied,
+                    "postgres_stock": pg_stock,
+                    "drift": pg_stock - unapplied - int(redis_stock),
+                }
+            )
+
+        return {
+            "in_sync": all(p["drift"] == 0 for p in products),
+            "products": products,
+            "stream_length": stream_length,
+        }
+
+    async def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._consume()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Redis/Postgres 일시 장애 -> 잠시 후 재시도 (미확인 메시지부터)
+                await asyncio.sleep(RECONNECT_DELAY)
+
+    async def _consume(self) -> None:
+        redis = await get_redis()
+        try:
+            await redis.xgroup_create(STREAM_KEY, GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+        # 재연결 시 이 프로세스의 미확인 메시지부터 처리 ("0"), 이후 새 메시지 (">")
+        cursor = "0"
+        next_claim = 0.0
+        while True:
+            if time.monotonic() >= next_claim:
+                await self._claim_stale(redis)
+                next_claim = time.monotonic() + CLAIM_INTERVAL
+
+            response = await redis.xreadgroup(
+                GROUP,
+                CONSUMER,
+                {STREAM_KEY: cursor},
+                count=WRITEBACK_BATCH,
+                block=1000 if cursor == ">" else None,
+            )
+            messages = response[0][1] if response else []
+            if not messages:
+                cursor = ">"
+                continue
+
+            await self._apply(redis, messages)
+            if len(messages) < WRITEBACK_BATCH:
+                # 다음 배치가 모일 시간
+                await asyncio.sleep(WRITEBACK_INTERVAL_MS / 1000)
+
+    async def _claim_stale(self, redis: Redis) -> None:
+        """종료/장애로 사라진 consumer의 미확인 메시지를 가져와 처리 (min-idle 기준)"""
+        start_id = "0-0"
+        while True:
+            start_id, messages, *_ = await redis.xautoclaim(
+                STREAM_KEY,
+                GROUP,
+                CONSUMER,
+                CLAIM_IDLE_MS,
+                start_id,
+                count=WRITEBACK_BATCH,
+            )
+            if messages:
+                await self._apply(redis, messages)
+            if start_id == "0-0":
+                return
+
+    async def _apply(self, redis: Redis, messages: list) -> None:
+        """상품별 합계로 UPDATE 1회 -> 커밋 후 미반영 합계 감소 + XACK"""
+        totals: dict[int, int] = {}
+        for _, fields in messages:
+            if not fields:
+                continue  # 이미 삭제된 항목 (pending 목록에만 남은 경우)
+            product_id = int(fields["product_id"])
+            totals[product_id] = totals.get(product_id, 0) + int(fields["quantity"])
+
+        async with redis.lock(WRITEBACK_LOCK, timeout=10):
+            async with async_session() as db:
+                await db.execute(
+                    APPLY_SQL,
+                    {"ids": list(totals), "quantities": list(totals.values())},
+                )
+                await db.commit()
+
+            pipe = redis.pipeline(transaction=True)
+            for product_id, quantity in totals.items():
+                pipe.hincrby(PENDING_KEY, str(product_id), -quantity)
+            pipe.xack(STREAM_KEY, GROUP, *[message_id for message_id, _ in messages])
+            pipe.xdel(STREAM_KEY, *[message_id for message_id, _ in messages])
+            await pipe.execute()
+
+        self.applied += len(messages)
+
+
+# 워커당 싱글톤
+redis_inventory = RedisInventory()
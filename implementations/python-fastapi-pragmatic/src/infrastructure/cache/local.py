@@ -0,0 +1,81 @@
+import os
+import sys
+import time
+from collections import OrderedDict
+from typing import Any
+
+L1_CACHE_MAX_SIZE = int(os.getenv("L1_CACHE_MAX_SIZE", "10000"))
+L1_CACHE_TTL = float(os.getenv("L1_CACHE_TTL", "30"))  # 초 (Redis TTL보다 짧게)
+
+
+class LocalCache:
+    """프로세스 내 LRU 캐시 (크기 제한 + TTL)
+
+    - 워커마다 독립적으로 존재 (워커 간 공유 없음)
+    - 다른 워커의 변경은 무효화 버스(CACHE_INVALIDATION_BUS)가 켜진 경우에만 제거,
+      꺼져 있으면 TTL 만료까지 이전 값 유지
+    - asyncio 단일 스레드에서만 사용하므로 락 불필요
+    """
+
+    def __init__(self, max_size: int = L1_CACHE_MAX_SIZE, ttl: float = L1_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        # key -> (만료 시각, 값), 순서 = 최근 사용 순
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.evictions = 0  # 용량 초과로 제거된 항목 수
+        self.expirations = 0  # TTL 만료로 제거된 항목 수
+
+    def get(self, key: str) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            # 만료된 항목은 조회 시점에 제거 (lazy expiration)
+            del self._data[key]
+            self.expirations += 1
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+
+        # 용량 초과 시 가장 오래 사용하지 않은 항목부터 제거
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def memory_bytes(self) -> int:
+        """대략적인 메모리 사용량 (키 + 값 + 컨테이너, 전체 순회 -> 조회 시에만 호출)"""
+        total = sys.getsizeof(self._data)
+        for key, entry in self._data.items():
+            total += sys.getsizeof(key) + sys.getsizeof(entry) + _deep_sizeof(entry[1])
+        return total
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _deep_sizeof(value: Any) -> int:
+    """캐시 값(dict/list/str 등 JSON 형태)의 재귀 크기"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_sizeof(k) + _deep_sizeof(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(_deep_sizeof(v) for v in value)
+    return size
+
+
+# L1 캐시 (워커당 싱글톤)
+local_cache = LocalCache()
@@ -0,0 +1,231 @@
+import bisect
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from src.infrastructure.cache.local import LocalCache
+
+T = TypeVar("T")
+
+# 지연 히스토그램 버킷 (초) - 로컬 Redis 왕복(~0.1ms)부터 느린 DB 조회까지
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus histogram과 같은 구조)"""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """버킷 상한 기준 근사 분위수 (초)"""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+        return self.buckets[-1]
+
+    def copy(self) -> "Histogram":
+        clone = Histogram(self.buckets)
+        clone.counts = list(self.counts)
+        clone.sum = self.sum
+        clone.count = self.count
+        return clone
+
+    def since(self, base: "Histogram | None") -> "Histogram":
+        """base 시점 이후 관측분만 담은 히스토그램"""
+        if base is None:
+            return self
+        delta = Histogram(self.buckets)
+        delta.counts = [now - then for now, then in zip(self.counts, base.counts)]
+        delta.sum = self.sum - base.sum
+        delta.count = self.count - base.count
+        return delta
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.sum / self.count * 1000, 4) if self.count else 0.0,
+            "p50_ms": self.quantile(0.5) * 1000,
+            "p95_ms": self.quantile(0.95) * 1000,
+            "p99_ms": self.quantile(0.99) * 1000,
+        }
+
+
+class CacheMetrics:
+    """캐시 계층 메트릭 (워커별, 프로세스 메모리)
+
+    - events: (tier, event) 카운터 - tier: l1 | near | redis | swr,
+      event: hit | miss | stale | negative_hit | error
+    - latency: 단계별 히스토그램 - redis | db | serialize | deserialize
+    - local_tiers: 프로세스 내 캐시의 항목 수/메모리/eviction (조회 시점에 계산)
+    - events/latency는 누적값 (Prometheus 카운터), JSON 통계는 reset() 이후 증가분
+    """
+
+    def __init__(self):
+        self.events: defaultdict[tuple[str, str], int] = defaultdict(int)
+        self.latency: defaultdict[str, Histogram] = defaultdict(Histogram)
+        self.local_tiers: dict[str, LocalCache] = {}
+        # reset() 시점의 누적값 (JSON 통계 기준점)
+        self._events_base: dict[tuple[str, str], int] = {}
+        self._latency_base: dict[str, Histogram] = {}
+
+    def inc(self, tier: str, event: str, amount: int = 1) -> None:
+        self.events[(tier, event)] += amount
+
+    def observe(self, phase: str, seconds: float) -> None:
+        self.latency[phase].observe(seconds)
+
+    @contextmanager
+    def timer(self, phase: str) -> Iterator[None]:
+        """동기 구간 측정 (직렬화 등)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - start)
+
+    async def timed(self, phase: str, awaitable: Awaitable[T]) -> T:
+        """비동기 호출 측정 (Redis/DB), 예외는 (phase, error)로 집계 후 전파"""
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        except Exception:
+            self.inc(phase, "error")
+            raise
+        finally:
+            self.observe(phase, time.perf_counter() - start)
+
+    def register_local(self, tier: str, cache: LocalCache) -> None:
+        self.local_tiers[tier] = cache
+
+    def reset(self) -> None:
+        """JSON 통계만 0부터 다시 집계
+
+        Prometheus 카운터는 그대로 (값이 줄면 rate()가 카운터 리셋으로 보고 튐)
+        """
+        self._events_base = dict(self.events)
+        self._latency_base = {
+            phase: hist.copy() for phase, hist in self.latency.items()
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        events: dict[str, dict[str, int]] = defaultdict(dict)
+        for (tier, event), value in sorted(self.events.items()):
+            value -= self._events_base.get((tier, event), 0)
+            if value:
+                events[tier][event] = value
+
+        hit_ratio = {}
+        for tier, counts in events.items():
+            lookups = sum(counts.get(e, 0) for e in ("hit", "miss", "stale"))
+            if lookups:
+                hit_ratio[tier] = round(counts.get("hit", 0) / lookups, 4)
+
+        return {
+            "events": dict(events),
+            "hit_ratio": hit_ratio,
+            "latency": {
+                phase: since.to_dict()
+                for phase, hist in sorted(self.latency.items())
+                if (since := hist.since(self._latency_base.get(phase))).count
+            },
+            "local": {
+                tier: {
+                    "entries": len(cache),
+                    "max_size": cache.max_size,
+                    "memory_bytes": cache.memory_bytes(),
+                    "evictions": cache.evictions,
+                    "expirations": cache.expirations,
+                }
+                for tier, cache in self.local_tiers.items()
+            },
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        lines = [
+            "# HELP cache_events_total Cache lookups and errors by tier and event",
+            "# TYPE cache_events_total counter",
+        ]
+        for (tier, event), value in sorted(self.events.items()):
+            lines.append(f'cache_events_total{{tier="{tier}",event="{event}"}} {value}')
+
+        lines += [
+            "# HELP cache_operation_seconds Cache path latency by phase",
+            "# TYPE cache_operation_seconds histogram",
+        ]
+        for phase, hist in sorted(self.latency.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(
+                (*hist.buckets, "+Inf"), hist.counts, strict=True
+            ):
+                cumulative += bucket_count
+                lines.append(
+                    f'cache_operation_seconds_bucket{{phase="{phase}",le="{bound}"}} '
+                    f"{cumulative}"
+                )
+            lines.append(f'cache_operation_seconds_sum{{phase="{phase}"}} {hist.sum}')
+            lines.append(
+                f'cache_operation_seconds_count{{phase="{phase}"}} {hist.count}'
+            )
+
+        local_metrics = (
+            ("cache_local_entries", "gauge", "Entries in in-process cache", len),
+            (
+                "cache_local_memory_bytes",
+                "gauge",
+                "Approximate memory used by in-process cache",
+                LocalCache.memory_bytes,
+            ),
+            (
+                "cache_local_evictions_total",
+                "counter",
+                "Entries evicted by LRU capacity limit",
+                lambda cache: cache.evictions,
+            ),
+            (
+                "cache_local_expirations_total",
+                "counter",
+                "Entries dropped after TTL expiry",
+                lambda cache: cache.expirations,
+            ),
+        )
+        for name, metric_type, help_text, getter in local_metrics:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+            for tier, cache in self.local_tiers.items():
+                lines.append(f'{name}{{tier="{tier}"}} {getter(cache)}')
+
+        return "\n".join(lines) + "\n"
+
+
+# 워커당 싱글톤
+cache_metrics = CacheMetrics()
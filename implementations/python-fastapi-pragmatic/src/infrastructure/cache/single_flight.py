@@ -0,0 +1,38 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class SingleFlight:
+    """키별 진행 중 작업 레지스트리 (요청 병합, stampede 방지)
+
+    - 같은 키로 동시에 들어온 호출은 첫 호출(leader)의 작업 결과를 공유
+    - 작업은 별도 Task로 실행 -> leader 요청이 취소되어도 대기자에게 영향 없음
+    - 워커(프로세스) 내부에서만 동작, 워커 간 병합은 Redis 락으로 별도 처리
+    """
+
+    def __init__(self):
+        self._in_flight: dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """(결과, 공유 여부) 반환 - 공유 여부가 True면 다른 호출의 결과를 받은 것"""
+        task = self._in_flight.get(key)
+        shared = task is not None
+
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+
+        # shield: 대기 중인 요청이 취소되어도 공유 작업은 계속 진행
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # 모든 대기자가 취소된 경우에도 "exception was never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
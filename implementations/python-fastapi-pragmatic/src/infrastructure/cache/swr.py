@@ -0,0 +1,131 @@
+import asyncio
+import json
+import math
+import os
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+from redis.asyncio import Redis
+
+# 논리 만료 후 stale 값 제공을 허용하는 시간 (초)
+SWR_STALE_TTL = int(os.getenv("SWR_STALE_TTL", "60"))
+XFETCH_BETA = float(os.getenv("XFETCH_BETA", "1.0"))  # 클수록 조기 갱신이 빨라짐
+
+Loader = Callable[[], Awaitable[dict[str, Any] | None]]
+
+T = TypeVar("T")
+# (phase, awaitable) -> 결과: Redis 호출 시간 측정 훅 (예: cache_metrics.timed)
+Timed = Callable[[str, Awaitable[T]], Awaitable[T]]
+
+
+async def _untimed(phase: str, awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
+@dataclass
+class SwrStats:
+    """SWR 카운터 (워커별)"""
+
+    misses: int = 0
+    fresh_hits: int = 0
+    stale_serves: int = 0
+    early_refreshes: int = 0  # XFetch로 만료 전에 시작한 갱신
+    background_refreshes: int = 0  # 완료된 백그라운드 갱신
+    refresh_errors: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class StaleWhileRevalidateCache:
+    """Stale-While-Revalidate + XFetch 확률적 조기 만료
+
+    Redis 값 = {"v": 값, "exp": 논리 만료 시각, "delta": 재계산 소요 시간}
+    - Redis TTL = 논리 TTL + SWR_STALE_TTL -> 논리 만료 후에도 stale 값 제공 가능
+    - 논리 만료 전: XFetch 조건 충족 시 백그라운드 조기 갱신 (만료 시점 분산)
+    - 논리 만료 후: stale 값을 즉시 반환하고 백그라운드 갱신
+    """
+
+    def __init__(
+        self,
+        stale_ttl: int = SWR_STALE_TTL,
+        beta: float = XFETCH_BETA,
+        timed: Timed = _untimed,
+    ):
+        self.stale_ttl = stale_ttl
+        self.beta = beta
+        # Redis 호출만 "redis"로 측정 (loader의 DB 시간은 loader가 따로 측정)
+        self.timed = timed
+        self.stats = SwrStats()
+        self._refreshing: set[str] = set()
+        # 실행 중인 Task가 GC되지 않도록 참조 유지
+        self._tasks: set[asyncio.Task] = set()
+
+    async def get(
+        self, redis: Redis, key: str, ttl: int, loader: Loader
+    ) -> tuple[dict[str, Any] | None, str]:
+        """(값, source) 반환 - source: "cache" | "stale" | "database" """
+        cached = await self.timed("redis", redis.get(key))
+        if cached is None:
+            self.stats.misses += 1
+            return await self._load(redis, key, ttl, loader), "database"
+
+        envelope = json.loads(cached)
+        now = time.time()
+
+        if now >= envelope["exp"]:
+            self.stats.stale_serves += 1
+            self._refresh_in_background(redis, key, ttl, loader)
+            return envelope["v"], "stale"
+
+        # XFetch: 재계산이 오래 걸릴수록, 만료에 가까울수록 조기 갱신 확률 증가
+        gap = -envelope["delta"] * self.beta * math.log(1.0 - random.random())
+        if now + gap >= envelope["exp"]:
+            if self._refresh_in_background(redis, key, ttl, loader):
+                self.stats.early_refreshes += 1
+
+        self.stats.fresh_hits += 1
+        return envelope["v"], "cache"
+
+    async def _load(
+        self, redis: Redis, key: str, ttl: int, loader: Loader
+    ) -> dict[str, Any] | None:
+        start = time.perf_counter()
+        value = await loader()
+        delta = time.perf_counter() - start
+
+        if value is None:
+            await self.timed("redis", redis.delete(key))
+            return None
+
+        envelope = {"v": value, "exp": time.time() + ttl, "delta": delta}
+        await self.timed(
+            "redis", redis.setex(key, ttl + self.stale_ttl, json.dumps(envelope))
+        )
+        return value
+
+    def _refresh_in_background(
+        self, redis: Redis, key: str, ttl: int, loader: Loader
+    ) -> bool:
+        """키당 갱신 1개만 실행 (이미 진행 중이면 False)"""
+        if key in self._refreshing:
+            return False
+
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh(redis, key, ttl, loader))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _refresh(self, redis: Redis, key: str, ttl: int, loader: Loader) -> None:
+        try:
+            await self._load(redis, key, ttl, loader)
+            self.stats.background_refreshes += 1
+        except Exception:
+            # 갱신 실패 시 기존 stale 값을 계속 제공 (다음 요청에서 재시도)
+            self.stats.refresh_errors += 1
+        finally:
+            self._refreshing.discard(key)
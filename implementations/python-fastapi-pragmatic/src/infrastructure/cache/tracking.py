@@ -0,0 +1,116 @@
+import asyncio
+import os
+from typing import Any
+
+from redis.asyncio import Redis
+
+from src.infrastructure.cache.connection import REDIS_URL
+from src.infrastructure.cache.local import LocalCache
+
+# 서버 지원 클라이언트 캐시 사용 여부 (opt-in)
+REDIS_CLIENT_TRACKING = os.getenv("REDIS_CLIENT_TRACKING", "false").lower() == "true"
+
+INVALIDATE_CHANNEL = "__redis__:invalidate"
+HEALTH_CHECK_INTERVAL = 5  # 초, 무효화 메시지가 없을 때 PING으로 연결 확인
+RECONNECT_DELAY = 1  # 초
+
+
+class TrackingNearCache:
+    """Redis CLIENT TRACKING 기반 near-cache (서버 지원 무효화)
+
+    - 전용 연결 1개: CLIENT TRACKING ON REDIRECT <자기 자신> BCAST PREFIX ...
+      + SUBSCRIBE __redis__:invalidate
+    - prefix에 해당하는 키가 어느 클라이언트(다른 워커 포함)에서든 변경되면
+      서버가 무효화 메시지를 보내고, 수신 즉시 로컬 항목 제거
+    - 연결이 끊기면 로컬 캐시를 비우고 비활성화 (재연결 전까지 Redis 직접 조회)
+    """
+
+    def __init__(self, url: str, prefixes: list[str], local: LocalCache | None = None):
+        self.url = url
+        self.prefixes = prefixes
+        self.local = local or LocalCache()
+        # 무효화 수신 시 증가 -> GET 도중 무효화가 오면 로컬 저장 생략 (경쟁 조건 방지)
+        self.epoch = 0
+        self._connected = False
+        self._task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._connected
+
+    def get(self, key: str) -> Any | None:
+        if not self._connected:
+            return None
+        return self.local.get(key)
+
+    def set(self, key: str, value: Any, epoch: int) -> None:
+        """Redis 조회 전에 읽은 epoch가 그대로일 때만 저장"""
+        if self._connected and epoch == self.epoch:
+            self.local.set(key, value)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # 연결 끊김 등 -> 잠시 후 재연결
+                await asyncio.sleep(RECONNECT_DELAY)
+
+    async def _listen(self) -> None:
+        client = Redis.from_url(
+            self.url, decode_responses=True, single_connection_client=True
+        )
+        try:
+            client_id = await client.client_id()
+            await client.client_tracking_on(
+                clientid=client_id, bcast=True, prefix=self.prefixes
+            )
+
+            conn = client.connection
+            await conn.send_command("SUBSCRIBE", INVALIDATE_CHANNEL)
+            await conn.read_response()  # ["subscribe", channel, 1]
+
+            # 추적 시작 이전에 저장된 항목은 신뢰할 수 없으므로 비움
+            self._invalidate(None)
+            self._connected = True
+
+            while True:
+                message = await conn.read_response(timeout=HEALTH_CHECK_INTERVAL)
+                if message is None:
+                    # 구독 모드에서도 PING 허용 -> 응답 없으면 다음 read에서 예외
+                    await conn.send_command("PING")
+                    continue
+                if message[0] == "message":
+                    self._invalidate(message[2])
+        finally:
+            self._connected = False
+            self._invalidate(None)
+            await client.aclose()
+
+    def _invalidate(self, keys: list[str] | None) -> None:
+        """keys=None: FLUSHDB/FLUSHALL 또는 연결 상태 변경 -> 전체 제거"""
+        self.epoch += 1
+        if keys is None:
+            self.local.clear()
+            return
+        for key in keys:
+            self.local.delete(key)
+
+
+# user:* 키 near-cache (워커당 싱글톤)
+near_cache = TrackingNearCache(REDIS_URL, prefixes=["user:"])
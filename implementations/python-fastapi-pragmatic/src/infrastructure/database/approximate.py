@@ -0,0 +1,160 @@
+import asyncio
+import math
+import os
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import select, text
+
+from src.infrastructure.database.connection import async_session
+from src.infrastructure.database.models import UserWideModel
+from src.infrastructure.sketch.hyperloglog import HyperLogLog
+
+# ?accuracy=approx 카운트: 백그라운드에서 갱신한 값을 메모리에서 바로 응답
+APPROX_REFRESH_INTERVAL_MS = float(os.getenv("APPROX_REFRESH_INTERVAL_MS", "1000"))
+# HLL은 삭제/UPDATE를 반영하지 못함 -> 주기적으로 전체 재구축
+APPROX_REBUILD_INTERVAL = float(os.getenv("APPROX_REBUILD_INTERVAL", "300"))  # 초
+APPROX_SCAN_BATCH = 10000
+RECONNECT_DELAY = 1  # 초
+
+# 오차 범위 = 약 95% 신뢰구간 (2 sigma)
+CONFIDENCE_SIGMAS = 2
+
+# 플래너 통계: reltuples(마지막 VACUUM/ANALYZE 시점 행 수)
+# + n_live_tup(그 시점 값에서 이후 INSERT/DELETE만큼 증감한 통계 수집기 추정치)
+PLANNER_STATS_SQL = text(
+    """
+    SELECT c.reltuples, s.n_live_tup
+    FROM pg_class c
+    LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+    WHERE c.oid = 'users_wide'::regclass
+    """
+)
+
+# 통계가 없을 때 (reltuples = -1: 한 번도 VACUUM/ANALYZE 안 됨)
+EXACT_COUNT_SQL = text("SELECT count(*) FROM users_wide")
+
+
+@dataclass
+class ApproxCounts:
+    count_star: int
+    count_star_error: int  # ± 행 수
+    count_distinct_status: int
+    count_distinct_status_error: int
+    as_of_ms: float  # 마지막 갱신 이후 경과 시간
+
+
+class ApproxUserWideStats:
+    """users_wide 근사 카운트 (워커별)
+
+    - 행 수: pg_class.reltuples, 오차 = 그 이후 순증감 행 수 |n_live_tup - reltuples|
+      (UPDATE는 행 수를 바꾸지 않으므로 오차에 포함하지 않음)
+    - 통계가 없는 테이블(reltuples = -1)은 정확한 count(*)로 대체 (오차 0)
+    - status 고유값 수: HyperLogLog, id 워터마크 이후 새 행만 추가 (증분)
+    - 첫 요청 시 1회 동기 갱신 후 백그라운드 루프 시작 -> 이후 요청은 DB 조회 없음
+    """
+
+    def __init__(
+        self,
+        refresh_interval_ms: float = APPROX_REFRESH_INTERVAL_MS,
+        rebuild_interval: float = APPROX_REBUILD_INTERVAL,
+    ):
+        self.refresh_interval = refresh_interval_ms / 1000
+        self.rebuild_interval = rebuild_interval
+        self.row_estimate = 0
+        self.row_error = 0
+        self.status_sketch = HyperLogLog()
+        self._last_id = 0
+        self._refreshed_at: float | None = None
+        self._rebuilt_at = 0.0
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    async def snapshot(self) -> ApproxCounts:
+        if self._refreshed_at is None:
+            async with self._lock:
+                if self._refreshed_at is None:
+                    await self.refresh()
+                    self._task = asyncio.create_task(self._run())
+
+        distinct = self.status_sketch.count()
+        return ApproxCounts(
+            count_star=self.row_estimate,
+            count_star_error=self.row_error,
+            count_distinct_status=round(distinct),
+            count_distinct_status_error=math.ceil(
+                CONFIDENCE_SIGMAS * self.status_sketch.relative_error * distinct
+            ),
+            as_of_ms=(time.perf_counter() - self._refreshed_at) * 1000,
+        )
+
+    async def refresh(self) -> None:
+        async with async_session() as db:
+            reltuples, n_live_tup = (await db.execute(PLANNER_STATS_SQL)).one()
+            if reltuples >= 0:
+                self.row_estimate = round(reltuples)
+                # 마지막 VACUUM/ANALYZE 이후 INSERT - DELETE
+                self.row_error = abs(round(reltuples) - (n_live_tup or 0))
+            else:
+                # n_live_tup만으로는 오차를 알 수 없음 (통계 초기화 등) -> 정확한 값
+                self.row_estimate = (await db.execute(EXACT_COUNT_SQL)).scalar_one()
+                self.row_error = 0
+
+            if time.perf_counter() - self._rebuilt_at >= self.rebuild_interval:
+                sketch, last_id = HyperLogLog(), 0
+                self._rebuilt_at = time.perf_counter()
+            else:
+                sketch, last_id = self.status_sketch, self._last_id
+
+            # 워터마크 이후 새 행만 스캔 (PK 범위 조회)
+            while True:
+                rows = (
+                    await db.execute(
+                        select(UserWideModel.id, UserWideModel.status)
+                        .where(UserWideModel.id > last_id)
+                        .order_by(UserWideModel.id)
+                        .limit(APPROX_SCAN_BATCH)
+                    )
+                ).all()
+                for _, status in rows:
+                    sketch.add(status)
+                if rows:
+                    last_id = rows[-1].id
+                if len(rows) < APPROX_SCAN_BATCH:
+                    break
+
+        self.status_sketch, self._last_id = sketch, last_id
+        self._refreshed_at = time.perf_counter()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.sleep(self.refresh_interval)
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                await asyncio.sleep(RECONNECT_DELAY)
+
+
+def sample_error(block_sum_sq: float, fraction: float) -> float:
+    """TABLESAMPLE SYSTEM 추정 개수의 ± 오차 (블록 간 분산, 2 sigma)
+
+    SYSTEM은 페이지(블록)를 확률 fraction으로 독립 선택 -> 행이 아니라 블록이 표본 단위
+    추정치 = sum(y_b) / f, 분산 추정 = sum(y_b^2) * (1 - f) / f^2 (y_b: 표본 블록별 개수)
+    같은 값이 특정 블록에 몰려 있을수록(clustering) sum(y_b^2)가 커져 오차 범위도 넓어짐
+    """
+    return CONFIDENCE_SIGMAS * math.sqrt(block_sum_sq * (1 - fraction)) / fraction
+
+
+# 워커당 싱글톤
+approx_user_wide = ApproxUserWideStats()
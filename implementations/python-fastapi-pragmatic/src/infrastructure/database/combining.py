@@ -0,0 +1,164 @@
+import asyncio
+import os
+from dataclasses import dataclass, field
+
+from sqlalchemy import select, update
+
+from src.infrastructure.database.connection import async_session
+from src.infrastructure.database.models import ProductModel
+from src.infrastructure.database.profiling import TransactionProfile
+
+# 같은 상품의 차감 요청을 모으는 시간 / 최대 병합 건수
+COMBINE_WINDOW_MS = float(os.getenv("COMBINE_WINDOW_MS", "1"))
+COMBINE_MAX_BATCH = int(os.getenv("COMBINE_MAX_BATCH", "500"))
+
+
+@dataclass
+class DecrementOutcome:
+    """병합된 차감 중 호출자 1명분 결과"""
+
+    success: bool
+    old_stock: int
+    new_stock: int
+    batch_size: int  # 함께 처리된 요청 수
+    # 배치 트랜잭션 1개의 시간 분해 (pool_wait/lock_wait/query/commit, 배치 내 공통)
+    timings: dict[str, float | None] = field(default_factory=dict)
+
+
+class DecrementCombiner:
+    """상품별 재고 차감 병합 (flat combining)
+
+    - 상품당 처리 루프 1개: window 동안 모인 요청의 수량 합계로 조건부 UPDATE 1회
+      -> N번의 행 락 획득이 1번으로 줄어듦
+    - 처리 중 들어온 요청은 다음 배치로 (상품당 DB 작업은 항상 1개)
+    - 합계가 재고를 넘으면: FOR UPDATE로 재고를 읽고 도착 순서대로 가능한 요청만 반영
+      (stock >= 0 보장, 개별 요청 단위로 성공/실패)
+    """
+
+    def __init__(
+        self, window_ms: float = COMBINE_WINDOW_MS, max_batch: int = COMBINE_MAX_BATCH
+    ):
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._pending: dict[int, list[tuple[int, asyncio.Future]]] = {}
+        self._active: set[int] = set()
+        # 실행 중인 Task가 GC되지 않도록 참조 유지
+        self._tasks: set[asyncio.Task] = set()
+
+    async def decrement(
+        self, product_id: int, quantity: int
+    ) -> DecrementOutcome | None:
+        """None = 상품 없음"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(product_id, []).append((quantity, future))
+
+        if product_id not in self._active:
+            self._active.add(product_id)
+            task = asyncio.create_task(self._drain(product_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        return await future
+
+    async def _drain(self, product_id: int) -> None:
+        try:
+            while self._pending.get(product_id):
+                # 같은 상품의 동시 요청이 모일 시간
+                await asyncio.sleep(self.window)
+                pending = self._pending.pop(product_id)
+                batch = pending[: self.max_batch]
+                if len(pending) > self.max_batch:
+                    self._pending[product_id] = pending[self.max_batch :]
+
+                try:
+                    outcomes = await self._apply(product_id, batch)
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for (_, future), outcome in zip(batch, outcomes, strict=True):
+                    if not future.done():
+                        future.set_result(outcome)
+        finally:
+            self._active.discard(product_id)
+
+    async def _apply(
+        self, product_id: int, batch: list[tuple[int, asyncio.Future]]
+    ) -> list[DecrementOutcome | None]:
+        quantities = [quantity for quantity, _ in batch]
+        total = sum(quantities)
+
+        async with async_session() as db:
+            # 배치 단위 프로파일 -> /transactions/stats에는 배치 1건으로 기록
+            profile = await TransactionProfile.begin("combined", db)
+
+            # 1. 합계로 조건부 UPDATE 1회 (일반적인 경우)
+            result = await db.execute(
+                update(ProductModel)
+                .where(ProductModel.id == product_id, ProductModel.stock >= total)
+                .values(stock=ProductModel.stock - total)
+                .returning(ProductModel.stock)
+                .execution_options(synchronize_session=False)
+            )
+            new_stock = result.scalar_one_or_none()
+            if new_stock is not None:
+                await profile.commit(db)
+                return self._slices(
+                    new_stock + total,
+                    quantities,
+                    [True] * len(batch),
+                    profile.finish(),
+                )
+
+            # 2. 재고 부족(또는 상품 없음) -> 락을 잡고 도착 순서대로 가능한 만큼만 반영
+            stock = await db.scalar(
+                select(ProductModel.stock)
+                .where(ProductModel.id == product_id)
+                .with_for_update()
+            )
+            if stock is None:
+                await db.rollback()
+                profile.finish()
+                return [None] * len(batch)
+
+            accepted = []
+            remaining = stock
+            for quantity in quantities:
+                ok = quantity <= remaining
+                accepted.append(ok)
+                if ok:
+                    remaining -= quantity
+
+            if remaining != stock:
+                await db.execute(
+                    update(ProductModel)
+                    .where(ProductModel.id == product_id)
+                    .values(stock=remaining)
+                    .execution_options(synchronize_session=False)
+                )
+            await profile.commit(db)
+            return self._slices(stock, quantities, accepted, profile.finish())
+
+    def _slices(
+        self,
+        old_stock: int,
+        quantities: list[int],
+        accepted: list[bool],
+        timings: dict[str, float | None],
+    ) -> list[DecrementOutcome]:
+        """도착 순서대로 각 호출자의 old/new 구간 계산"""
+        outcomes = []
+        current = old_stock
+        for quantity, ok in zip(quantities, accepted, strict=True):
+            new = current - quantity if ok else current
+            outcomes.append(
+                DecrementOutcome(ok, current, new, len(quantities), timings)
+            )
+            current = new
+        return outcomes
+
+
+# 재고 차감 병합기 (워커당 싱글톤)
+stock_combiner = DecrementCombiner()
@@ -0,0 +1,77 @@
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.connection import async_session
+
+# 서브쿼리: 세션을 받아 결과를 반환하는 읽기 전용 함수
+Subquery = Callable[[AsyncSession], Awaitable[Any]]
+
+# 동시 실행 서브쿼리가 워커 전체에서 동시에 쓰는 연결 수 상한
+# 기본 = SQLAlchemy 기본 pool_size(5) -> 대시보드 요청이 몰려도 overflow(10)는 다른 API용으로 남음
+# 상한이 없으면 요청 1건이 5개 연결 -> 동시 3건이면 풀 소진, 병렬화 효과 대신 풀 대기를 측정하게 됨
+COMPOSITE_MAX_CONNECTIONS = int(os.getenv("COMPOSITE_MAX_CONNECTIONS", "5"))
+_connection_slots = asyncio.Semaphore(COMPOSITE_MAX_CONNECTIONS)
+
+
+@dataclass
+class CompositeResult:
+    values: dict[str, Any]
+    subquery_ms: dict[str, float] = field(default_factory=dict)
+    wall_ms: float = 0.0
+    mode: str = "concurrent"
+
+    @property
+    def sum_ms(self) -> float:
+        """서브쿼리 시간 합계 (직렬 실행 시 예상 시간)"""
+        return sum(self.subquery_ms.values())
+
+
+async def _timed(
+    name: str, query: Subquery, db: AsyncSession
+) -> tuple[str, Any, float]:
+    start = time.perf_counter()
+    value = await query(db)
+    return name, value, (time.perf_counter() - start) * 1000
+
+
+async def _on_own_session(name: str, query: Subquery) -> tuple[str, Any, float]:
+    # 연결 획득(상한/풀 대기) 시간도 서브쿼리 시간에 포함
+    start = time.perf_counter()
+    async with _connection_slots, async_session() as db:
+        _, value, _ = await _timed(name, query, db)
+    return name, value, (time.perf_counter() - start) * 1000
+
+
+async def run_composite(
+    queries: dict[str, Subquery], db: AsyncSession | None = None
+) -> CompositeResult:
+    """독립적인 읽기 쿼리 여러 개를 실행해 결과를 이름별로 합침
+
+    - db 없음: 쿼리마다 별도 세션(풀 연결)에서 asyncio.gather로 동시 실행
+      -> wall ≈ 가장 느린 쿼리 (대신 요청 1건이 연결을 쿼리 수만큼 사용,
+      워커 전체 합계는 COMPOSITE_MAX_CONNECTIONS로 제한)
+    - db 지정: 같은 세션에서 순서대로 실행 (비교 기준, wall ≈ 합계)
+    서로 다른 트랜잭션이므로 쿼리 간 스냅샷은 일치하지 않음
+    """
+    start = time.perf_counter()
+    if db is None:
+        results = await asyncio.gather(
+            *(_on_own_session(name, query) for name, query in queries.items())
+        )
+        mode = "concurrent"
+    else:
+        results = [await _timed(name, query, db) for name, query in queries.items()]
+        mode = "serial"
+
+    return CompositeResult(
+        values={name: value for name, value, _ in results},
+        subquery_ms={name: ms for name, _, ms in results},
+        wall_ms=(time.perf_counter() - start) * 1000,
+        mode=mode,
+    )
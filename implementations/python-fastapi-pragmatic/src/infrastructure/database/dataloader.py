@@ -0,0 +1,129 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import Integer, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import PostModel, UserModel
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# 배치 함수: 키 목록 -> {키: 값} (없는 키는 생략 -> default)
+BatchFn = Callable[[list[K]], Awaitable[dict[K, V]]]
+
+
+class DataLoader(Generic[K, V]):
+    """요청 스코프 배치 로더 (DataLoader 패턴)
+
+    - 같은 이벤트 루프 tick 안의 load(key) 호출을 모아 배치 함수 1번으로 조회
+      -> 접근 패턴을 쿼리 작성 시점에 몰라도 N+1 대신 1번의 ANY 쿼리
+    - 키별 결과 memoize (같은 요청 안에서 같은 키는 다시 조회하지 않음)
+    - 배치는 순서대로 실행 (AsyncSession은 동시 execute 불가)
+    """
+
+    def __init__(
+        self,
+        batch_fn: BatchFn,
+        default: Callable[[], V | None] = lambda: None,
+        max_batch: int = 1000,
+    ):
+        self.batch_fn = batch_fn
+        self.default = default
+        self.max_batch = max_batch
+        self.batches = 0  # 실행된 배치 쿼리 수
+        self._cache: dict[K, asyncio.Future] = {}
+        self._queue: list[tuple[K, asyncio.Future]] = []
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    def load(self, key: K) -> Awaitable[V]:
+        future = self._cache.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._cache[key] = future
+            if not self._queue:
+                # 현재 tick의 다른 load() 호출이 모두 큐에 들어간 뒤 실행
+                asyncio.get_running_loop().call_soon(self._dispatch)
+            self._queue.append((key, future))
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> list[V]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def clear(self, key: K) -> None:
+        """memoize 제거 (같은 요청에서 쓰기 후 다시 읽을 때)
+
+        이미 대기/실행 중인 배치의 future는 그대로 결과를 받음
+        """
+        self._cache.pop(key, None)
+
+    def _dispatch(self) -> None:
+        batch, self._queue = self._queue, []
+        for i in range(0, len(batch), self.max_batch):
+            task = asyncio.create_task(self._run(batch[i : i + self.max_batch]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[K, asyncio.Future]]) -> None:
+        # 큐에 넣을 때의 (key, future)로 결과 전달 -> clear()와 무관하게 모두 완료
+        try:
+            async with self._lock:
+                self.batches += 1
+                values = await self.batch_fn([key for key, _ in batch])
+        except BaseException as exc:
+            for key, future in batch:
+                # 실패는 memoize하지 않음 -> 다음 load()에서 재시도
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+                if future.done():
+                    continue
+                if isinstance(exc, Exception):
+                    future.set_exception(exc)
+                else:
+                    future.cancel()  # 배치 task 취소 -> 대기 중인 load()도 취소
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        for key, future in batch:
+            if not future.done():
+                future.set_result(values.get(key, self.default()))
+
+
+def _int_array(keys: list[int]) -> Any:
+    # 키 수와 무관하게 같은 SQL ($1 배열 1개) -> asyncpg prepared statement 재사용
+    return any_(bindparam("keys", keys, type_=ARRAY(Integer)))
+
+
+class Loaders:
+    """요청 1건에서 공유하는 로더 모음 (같은 세션 사용)"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.users: DataLoader[int, UserModel | None] = DataLoader(self._load_users)
+        self.posts_by_author: DataLoader[int, list[PostModel]] = DataLoader(
+            self._load_posts_by_author, default=list
+        )
+
+    async def _load_users(self, ids: list[int]) -> dict[int, UserModel]:
+        result = await self.db.execute(
+            select(UserModel).where(UserModel.id == _int_array(ids))
+        )
+        return {user.id: user for user in result.scalars()}
+
+    async def _load_posts_by_author(
+        self, author_ids: list[int]
+    ) -> dict[int, list[PostModel]]:
+        result = await self.db.execute(
+            select(PostModel)
+            .where(PostModel.author_id == _int_array(author_ids))
+            .order_by(PostModel.id)
+        )
+        posts: defaultdict[int, list[PostModel]] = defaultdict(list)
+        for post in result.scalars():
+            posts[post.author_id].append(post)
+        return posts
@@ -0,0 +1,157 @@
+import asyncio
+import os
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from sqlalchemy import Row, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.connection import async_session
+from src.infrastructure.database.models import UserModel
+
+# POST /users 그룹 커밋 (opt-in)
+GROUP_COMMIT = os.getenv("GROUP_COMMIT", "false").lower() == "true"
+GROUP_COMMIT_INTERVAL_MS = float(os.getenv("GROUP_COMMIT_INTERVAL_MS", "2"))
+GROUP_COMMIT_MAX_BATCH = int(os.getenv("GROUP_COMMIT_MAX_BATCH", "100"))
+
+# 커밋 직전, 같은 트랜잭션에서 실행할 훅 (무효화 이벤트 발행 등)
+FlushHook = Callable[[AsyncSession, list[Row]], Awaitable[None]]
+
+
+@dataclass
+class GroupCommitStats:
+    """그룹 커밋 카운터 (워커별)"""
+
+    flushes: int = 0
+    rows: int = 0
+    fallbacks: int = 0  # 배치 실패 -> 행별 INSERT로 재시도한 횟수
+    largest_batch: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["avg_batch"] = round(self.rows / self.flushes, 2) if self.flushes else 0.0
+        return data
+
+
+class GroupCommitter:
+    """동시 INSERT 요청을 모아 multi-row INSERT ... RETURNING + commit 1회로 처리
+
+    - 첫 요청 도착 후 interval_ms 경과 또는 max_batch 도달 시 flush
+    - flush 중 들어온 요청은 다음 배치로 (flush는 한 번에 1개)
+    - 배치 중 한 행이라도 실패(예: email 중복)하면 행별 트랜잭션으로 재시도
+      -> 실패한 요청만 예외를 받음
+    """
+
+    def __init__(
+        self,
+        model: type,
+        interval_ms: float = GROUP_COMMIT_INTERVAL_MS,
+        max_batch: int = GROUP_COMMIT_MAX_BATCH,
+    ):
+        self.model = model
+        self.interval = interval_ms / 1000
+        self.max_batch = max_batch
+        self.stats = GroupCommitStats()
+        self._pending: list[tuple[dict[str, Any], asyncio.Future]] = []
+        self._hooks: list[FlushHook] = []
+        self._has_pending = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def on_flush(self, hook: FlushHook) -> None:
+        self._hooks.append(hook)
+
+    async def submit(self, values: dict[str, Any]) -> Row:
+        """INSERT 요청 -> 커밋된 행 (RETURNING 결과) 반환"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((values, future))
+        self._has_pending.set()
+        if len(self._pending) >= self.max_batch:
+            self._batch_full.set()
+        return await future
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # 남은 요청은 종료 전에 처리
+        while self._pending:
+            await self._flush(self._take_batch())
+
+    async def _run(self) -> None:
+        while True:
+            await self._has_pending.wait()
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), self.interval)
+            except TimeoutError:
+                pass
+            await self._flush(self._take_batch())
+
+    def _take_batch(self) -> list[tuple[dict[str, Any], asyncio.Future]]:
+        batch = self._pending[: self.max_batch]
+        self._pending = self._pending[self.max_batch :]
+        if not self._pending:
+            self._has_pending.clear()
+        if len(self._pending) < self.max_batch:
+            self._batch_full.clear()
+        return batch
+
+    async def _flush(self, batch: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        if not batch:
+            return
+
+        stmt = insert(self.model).returning(
+            *self.model.__table__.columns, sort_by_parameter_order=True
+        )
+        try:
+            async with async_session() as db:
+                result = await db.execute(stmt, [values for values, _ in batch])
+                rows = result.all()
+                await self._run_hooks(db, rows)
+                await db.commit()
+        except Exception:
+            self.stats.fallbacks += 1
+            await self._flush_individually(batch)
+            return
+
+        self.stats.flushes += 1
+        self.stats.rows += len(rows)
+        self.stats.largest_batch = max(self.stats.largest_batch, len(rows))
+        for (_, future), row in zip(batch, rows, strict=True):
+            if not future.done():
+                future.set_result(row)
+
+    async def _flush_individually(
+        self, batch: list[tuple[dict[str, Any], asyncio.Future]]
+    ) -> None:
+        stmt = insert(self.model).returning(*self.model.__table__.columns)
+        for values, future in batch:
+            try:
+                async with async_session() as db:
+                    row = (await db.execute(stmt, values)).one()
+                    await self._run_hooks(db, [row])
+                    await db.commit()
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            self.stats.rows += 1
+            if not future.done():
+                future.set_result(row)
+
+    async def _run_hooks(self, db: AsyncSession, rows: list[Row]) -> None:
+        for hook in self._hooks:
+            await hook(db, rows)
+
+
+# users INSERT 그룹 커밋 (워커당 싱글톤)
+user_group_commit = GroupCommitter(UserModel)
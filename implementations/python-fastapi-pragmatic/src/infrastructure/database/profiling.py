@@ -0,0 +1,263 @@
+import asyncio
+import os
+import time
+from collections import defaultdict
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.infrastructure.cache.metrics import LATENCY_BUCKETS, Histogram
+from src.infrastructure.database.connection import engine
+
+# 트랜잭션 시간 분해 (opt-in) - 끄면 SQL 이벤트 리스너 미등록, 분해 필드 = None
+TX_PROFILING = os.getenv("TX_PROFILING", "false").lower() == "true"
+# 락 대기 샘플링 (pg_stat_activity 폴링, opt-in) - 끄면 lock_wait_ms = None
+TX_LOCK_SAMPLING = os.getenv("TX_LOCK_SAMPLING", "false").lower() == "true"
+PROFILING_ENABLED = TX_PROFILING or TX_LOCK_SAMPLING
+TX_LOCK_SAMPLE_INTERVAL_MS = float(os.getenv("TX_LOCK_SAMPLE_INTERVAL_MS", "5"))
+RECONNECT_DELAY = 1  # 초
+
+# 락 대기는 수 초까지 늘어날 수 있음
+TX_LATENCY_BUCKETS = (*LATENCY_BUCKETS, 2.5, 5.0, 10.0)
+PHASES = ("total", "pool_wait", "lock_wait", "query", "commit")
+
+# session.info / connection record info 키
+PROFILE_KEY = "tx_profile"
+QUERY_START_KEY = "tx_query_start"
+PID_KEY = "tx_backend_pid"
+
+# 행 락(tuple/transactionid), advisory 락 등 Lock 대기 중인 백엔드
+LOCK_WAITERS_SQL = """
+    SELECT pid, wait_event FROM pg_stat_activity
+    WHERE wait_event_type = 'Lock' AND datname = current_database()
+"""
+
+
+class LockWaitSampler:
+    """pg_stat_activity를 주기적으로 조회해 백엔드(pid)별 누적 락 대기 시간 계산
+
+    - 샘플 시점에 Lock 대기 중인 pid에 직전 샘플 이후 경과 시간을 더함
+      -> 해상도 = 샘플 간격 (짧은 대기는 0 또는 간격 단위로 반올림)
+    - 전용 연결 1개 사용 (풀/SQL 로그와 무관하게 드라이버로 직접 조회)
+    """
+
+    def __init__(self, interval_ms: float = TX_LOCK_SAMPLE_INTERVAL_MS):
+        self.interval = interval_ms / 1000
+        self.waited: defaultdict[int, float] = defaultdict(float)  # pid -> ms
+        self.events: defaultdict[str, float] = defaultdict(float)  # wait_event -> ms
+        self.samples = 0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with engine.connect() as conn:
+                    raw = (await conn.get_raw_connection()).driver_connection
+                    last = time.perf_counter()
+                    while True:
+                        rows = await raw.fetch(LOCK_WAITERS_SQL)
+                        now = time.perf_counter()
+                        dt = (now - last) * 1000
+                        last = now
+                        self.samples += 1
+                        for pid, wait_event in rows:
+                            self.waited[pid] += dt
+                            self.events[wait_event] += dt
+                        await asyncio.sleep(self.interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                await asyncio.sleep(RECONNECT_DELAY)
+
+
+class TransactionProfile:
+    """요청 1건의 트랜잭션 시간 분해
+
+    - pool_wait: 풀에서 연결을 받기까지
+    - query: SQL 실행 (cursor execute 이벤트 합계, commit 중 flush 포함 안 함)
+    - lock_wait: query 중 락 대기 (샘플러가 켜진 경우만, query에 포함되는 값)
+    - commit: COMMIT 왕복 (fsync 포함)
+    재시도(rollback 후 재연결)로 연결이 바뀌어도 세션 단위로 누적
+    PROFILING_ENABLED가 아니면 측정/기록 없이 commit만 수행 (분해 필드 = None)
+    """
+
+    def __init__(
+        self, method: str, sampler: LockWaitSampler, enabled: bool = PROFILING_ENABLED
+    ):
+        self.method = method
+        self.sampler = sampler
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.pool_wait_ms = 0.0
+        self.query_ms = 0.0
+        self.commit_ms = 0.0
+        self.lock_wait_ms = 0.0
+        self._pids: dict[int, float] = {}  # 사용 중인 pid -> 시작 시점 누적 대기
+
+    @classmethod
+    async def begin(cls, method: str, db: AsyncSession) -> "TransactionProfile":
+        profile = cls(method, lock_sampler)
+        if not profile.enabled:
+            return profile
+        db.info[PROFILE_KEY] = profile
+        start = time.perf_counter()
+        await db.connection()
+        profile.pool_wait_ms = (time.perf_counter() - start) * 1000
+        return profile
+
+    async def commit(self, db: AsyncSession) -> None:
+        """commit 시간 측정 (flush로 실행된 SQL은 query로 분리)"""
+        if not self.enabled:
+            await db.commit()
+            return
+        query_before = self.query_ms
+        start = time.perf_counter()
+        await db.commit()
+        elapsed = (time.perf_counter() - start) * 1000
+        self.commit_ms += elapsed - (self.query_ms - query_before)
+
+    def attach(self, pid: int) -> None:
+        # 샘플러가 꺼져 있으면 pid별 누적값을 만들지 않음 (waited가 계속 커지지 않도록)
+        if self.sampler.running:
+            self._pids.setdefault(pid, self.sampler.waited[pid])
+
+    def detach(self, pid: int) -> None:
+        mark = self._pids.pop(pid, None)
+        if mark is not None:
+            self.lock_wait_ms += self.sampler.waited[pid] - mark
+
+    def finish(self) -> dict[str, float | None]:
+        """응답 필드 반환 + /transactions/stats 히스토그램에 기록"""
+        if not self.enabled:
+            return dict.fromkeys(
+                ("pool_wait_ms", "lock_wait_ms", "query_ms", "commit_ms")
+            )
+        for pid in list(self._pids):
+            self.detach(pid)
+        total_ms = (time.perf_counter() - self.start) * 1000
+        fields = {
+            "pool_wait_ms": self.pool_wait_ms,
+            "lock_wait_ms": self.lock_wait_ms if self.sampler.running else None,
+            "query_ms": self.query_ms,
+            "commit_ms": self.commit_ms,
+        }
+        transaction_stats.record(self.method, total_ms, fields)
+        return fields
+
+
+class TransactionStats:
+    """전략별 단계 히스토그램 (워커별)"""
+
+    def __init__(self):
+        self.latency: defaultdict[tuple[str, str], Histogram] = defaultdict(
+            lambda: Histogram(TX_LATENCY_BUCKETS)
+        )
+
+    def record(
+        self, method: str, total_ms: float, fields: dict[str, float | None]
+    ) -> None:
+        self.latency[(method, "total")].observe(total_ms / 1000)
+        for name, value in fields.items():
+            if value is not None:
+                self.latency[(method, name.removesuffix("_ms"))].observe(value / 1000)
+
+    def reset(self) -> None:
+        self.latency.clear()
+        lock_sampler.events.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        methods: dict[str, dict[str, Any]] = defaultdict(dict)
+        for phase in PHASES:
+            for (method, name), hist in sorted(self.latency.items()):
+                if name == phase:
+                    methods[method][phase] = hist.to_dict()
+        return {
+            "profiling": PROFILING_ENABLED,
+            "lock_sampling": lock_sampler.running,
+            "sample_interval_ms": lock_sampler.interval * 1000,
+            "methods": dict(methods),
+            # wait_event별 누적 락 대기 (tuple, transactionid, advisory 등)
+            "lock_wait_events_ms": {
+                name: round(ms, 2) for name, ms in sorted(lock_sampler.events.items())
+            },
+        }
+
+
+# ============================================
+# SQLAlchemy 이벤트: 세션에 연결된 프로파일로 SQL 시간 / pid 추적
+# (PROFILING_ENABLED일 때만 등록 -> 끄면 앱 전체 쿼리에 리스너 비용 없음)
+# ============================================
+def _attach_profile(session, transaction, connection) -> None:
+    profile = session.info.get(PROFILE_KEY)
+    if profile is None:
+        return
+    pid = connection.connection.driver_connection.get_server_pid()
+    connection.info[PROFILE_KEY] = profile
+    connection.info[PID_KEY] = pid
+    profile.attach(pid)
+
+
+def _detach_profile(dbapi_connection, connection_record) -> None:
+    profile = connection_record.info.pop(PROFILE_KEY, None)
+    pid = connection_record.info.pop(PID_KEY, None)
+    if profile is not None and pid is not None:
+        profile.detach(pid)
+
+
+def _query_start(conn, cursor, statement, parameters, context, executemany) -> None:
+    if PROFILE_KEY in conn.info:
+        conn.info[QUERY_START_KEY] = time.perf_counter()
+
+
+def _query_end(conn, cursor, statement, parameters, context, executemany) -> None:
+    _add_query_time(conn)
+
+
+def _query_error(context) -> None:
+    # 실패한 문장(직렬화 실패, lock_timeout 등)의 시간도 query에 포함
+    if context.connection is not None:
+        _add_query_time(context.connection)
+
+
+def _add_query_time(conn) -> None:
+    start = conn.info.pop(QUERY_START_KEY, None)
+    if start is not None:
+        conn.info[PROFILE_KEY].query_ms += (time.perf_counter() - start) * 1000
+
+
+def install_listeners() -> None:
+    if event.contains(Session, "after_begin", _attach_profile):
+        return
+    event.listen(Session, "after_begin", _attach_profile)
+    event.listen(engine.sync_engine, "checkin", _detach_profile)
+    event.listen(engine.sync_engine, "before_cursor_execute", _query_start)
+    event.listen(engine.sync_engine, "after_cursor_execute", _query_end)
+    event.listen(engine.sync_engine, "handle_error", _query_error)
+
+
+if PROFILING_ENABLED:
+    install_listeners()
+
+
+# 워커당 싱글톤
+lock_sampler = LockWaitSampler()
+transaction_stats = TransactionStats()
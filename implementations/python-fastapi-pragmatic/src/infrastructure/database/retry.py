@@ -0,0 +1,136 @@
+import asyncio
+import os
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy.exc import DBAPIError
+
+# 재시도 backoff: min(cap, base * 2^n) 범위에서 full jitter
+RETRY_BASE_MS = float(os.getenv("RETRY_BASE_MS", "2"))
+RETRY_CAP_MS = float(os.getenv("RETRY_CAP_MS", "100"))
+# 첫 시도부터 이 시간을 넘기면 다음 재시도 없이 포기
+RETRY_DEADLINE_MS = float(os.getenv("RETRY_DEADLINE_MS", "1000"))
+
+# 40001 serialization_failure, 40P01 deadlock_detected
+RETRYABLE_SQLSTATES = {"40001", "40P01"}
+
+T = TypeVar("T")
+
+
+class RetryableConflict(Exception):
+    """재시도하면 성공할 수 있는 충돌 (버전 불일치, 직렬화 실패 등)"""
+
+
+def is_retryable(error: DBAPIError) -> bool:
+    return getattr(error.orig, "sqlstate", None) in RETRYABLE_SQLSTATES
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 5
+    base_ms: float = RETRY_BASE_MS
+    cap_ms: float = RETRY_CAP_MS
+    deadline_ms: float = RETRY_DEADLINE_MS
+
+    def backoff_ms(self, retry: int) -> float:
+        """retry번째 재시도 전 대기 시간 (full jitter -> 동시 재시도 분산)"""
+        return random.uniform(0, min(self.cap_ms, self.base_ms * 2**retry))
+
+
+@dataclass
+class RetryOutcome(Generic[T]):
+    value: T | None
+    retries: int
+    wasted_ms: float  # 실패한 시도 + backoff 대기에 쓴 시간
+    error: str | None = None  # 포기한 경우 사유
+
+
+@dataclass
+class RetryStats:
+    """전략별 재시도 카운터 (워커별)"""
+
+    calls: int = 0
+    attempts: int = 0
+    conflicts: int = 0  # 충돌로 abort된 시도
+    gave_up: int = 0  # 최대 시도/deadline 초과로 실패한 호출
+    wasted_ms: float = 0.0
+    backoff_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["abort_rate"] = (
+            round(self.conflicts / self.attempts, 4) if self.attempts else 0.0
+        )
+        data["avg_retries"] = (
+            round((self.attempts - self.calls) / self.calls, 3) if self.calls else 0.0
+        )
+        data["wasted_ms"] = round(self.wasted_ms, 2)
+        data["backoff_ms"] = round(self.backoff_ms, 2)
+        return data
+
+
+class RetryRunner:
+    """충돌 시 rollback -> backoff -> 재시도
+
+    attempt는 트랜잭션 1회 (성공 시 commit까지), 충돌 시 RetryableConflict
+    on_conflict(rollback)는 대기 전에 호출 -> 락/스냅샷을 잡은 채로 기다리지 않음
+    """
+
+    def __init__(self):
+        self.stats: dict[str, RetryStats] = {}
+
+    async def run(
+        self,
+        method: str,
+        attempt: Callable[[], Awaitable[T]],
+        on_conflict: Callable[[], Awaitable[None]],
+        policy: RetryPolicy,
+    ) -> RetryOutcome[T]:
+        stats = self.stats.setdefault(method, RetryStats())
+        stats.calls += 1
+        start = time.perf_counter()
+        wasted = 0.0
+        retries = 0
+
+        while True:
+            stats.attempts += 1
+            attempt_start = time.perf_counter()
+            try:
+                value = await attempt()
+                stats.wasted_ms += wasted
+                return RetryOutcome(value, retries, wasted)
+            except RetryableConflict as e:
+                await on_conflict()
+                stats.conflicts += 1
+                wasted += (time.perf_counter() - attempt_start) * 1000
+                error = str(e) or "Conflict"
+
+            elapsed = (time.perf_counter() - start) * 1000
+            delay = policy.backoff_ms(retries)
+            if retries + 1 >= policy.max_attempts:
+                reason = "Max retries exceeded"
+            elif elapsed + delay > policy.deadline_ms:
+                reason = "Retry deadline exceeded"
+            else:
+                await asyncio.sleep(delay / 1000)
+                stats.backoff_ms += delay
+                wasted += delay
+                retries += 1
+                continue
+
+            stats.gave_up += 1
+            stats.wasted_ms += wasted
+            return RetryOutcome(None, retries, wasted, f"{reason}: {error}")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {method: stats.to_dict() for method, stats in self.stats.items()}
+
+    def reset(self) -> None:
+        self.stats.clear()
+
+
+# 재고 차감 재시도 (워커당 싱글톤)
+transaction_retry = RetryRunner()
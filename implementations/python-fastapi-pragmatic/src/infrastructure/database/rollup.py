@@ -0,0 +1,238 @@
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.connection import async_session
+
+# 롤업 delta 반영 루프 (opt-in, 테이블/트리거는 scripts/init_db.sql 18-aggregation 섹션)
+# 켜면 시작 시 delta 트리거 활성화 (init_db.sql은 비활성으로 생성)
+# 끄면 트리거도 비활성 -> 쓰기 비용 없음, 롤업 조회는 마지막 rebuild 시점 값
+ROLLUP_APPLIER = os.getenv("ROLLUP_APPLIER", "false").lower() == "true"
+ROLLUP_APPLY_INTERVAL_MS = float(os.getenv("ROLLUP_APPLY_INTERVAL_MS", "500"))
+ROLLUP_APPLY_BATCH = int(os.getenv("ROLLUP_APPLY_BATCH", "50000"))
+RECONNECT_DELAY = 1  # 초
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RollupTable:
+    """롤업 1개: delta 테이블 -> 롤업 테이블 반영 규칙"""
+
+    name: str
+    rollup: str
+    delta: str
+    key: str
+    measures: tuple[str, ...]
+    source_sql: str  # 전체 재계산 (rebuild)
+    source: str  # delta 트리거가 걸린 원본 테이블
+    triggers: tuple[str, ...]
+
+    @property
+    def apply_sql(self) -> str:
+        """delta를 잠그고(SKIP LOCKED -> 워커 간 중복 반영 없음) 키별 합계를 롤업에 더함"""
+        cols = ", ".join(self.measures)
+        sums = ", ".join(f"SUM({m}) AS {m}" for m in self.measures)
+        updates = ", ".join(f"{m} = r.{m} + EXCLUDED.{m}" for m in self.measures)
+        return f"""
+            WITH batch AS (
+                DELETE FROM {self.delta}
+                WHERE id IN (
+                    SELECT id FROM {self.delta}
+                    ORDER BY id
+                    LIMIT :batch
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING {self.key}, {cols}
+            )
+            INSERT INTO {self.rollup} AS r ({self.key}, {cols}, updated_at)
+            SELECT {self.key}, {sums}, NOW() FROM batch GROUP BY {self.key}
+            ON CONFLICT ({self.key}) DO UPDATE
+            SET {updates}, updated_at = NOW()
+        """
+
+    @property
+    def enable_triggers_sql(self) -> str:
+        actions = ", ".join(f"ENABLE TRIGGER {t}" for t in self.triggers)
+        return f"ALTER TABLE {self.source} {actions}"
+
+    @property
+    def pending_sql(self) -> str:
+        """미반영 delta 수 + 가장 오래된 delta 시각 (staleness)"""
+        return f"""
+            SELECT pending, oldest,
+                COALESCE(
+                    EXTRACT(EPOCH FROM LOCALTIMESTAMP - oldest) * 1000, 0
+                ) AS staleness_ms
+            FROM (
+                SELECT
+                    (SELECT COUNT(*) FROM {self.delta}) AS pending,
+                    (SELECT created_at FROM {self.delta} ORDER BY id LIMIT 1) AS oldest
+            ) AS d
+        """
+
+
+COUNTRY_ROLLUP = RollupTable(
+    name="country",
+    rollup="country_stats_rollup",
+    delta="country_stats_delta",
+    key="country",
+    measures=("user_count", "total_logins"),
+    source_sql="""
+        SELECT COALESCE(country, ''), COUNT(*), COALESCE(SUM(login_count), 0), NOW()
+        FROM users_wide
+        GROUP BY COALESCE(country, '')
+    """,
+    source="users_wide",
+    triggers=("trg_users_wide_stats_delta", "trg_users_wide_stats_delta_update"),
+)
+
+AUTHOR_ROLLUP = RollupTable(
+    name="author",
+    rollup="author_stats_rollup",
+    delta="author_stats_delta",
+    key="author_id",
+    measures=("post_count", "total_views"),
+    source_sql="""
+        SELECT author_id, COUNT(*), COALESCE(SUM(view_count), 0), NOW()
+        FROM posts
+        GROUP BY author_id
+    """,
+    source="posts",
+    triggers=("trg_posts_stats_delta", "trg_posts_stats_delta_update"),
+)
+
+ROLLUPS = (COUNTRY_ROLLUP, AUTHOR_ROLLUP)
+
+# 비활성('D') delta 트리거 수
+DISABLED_TRIGGERS_SQL = text(
+    "SELECT COUNT(*) FROM pg_trigger WHERE tgname = ANY(:names) AND tgenabled = 'D'"
+)
+
+
+@dataclass
+class RollupStaleness:
+    pending_deltas: int
+    oldest_pending_at: datetime | None
+    staleness_ms: float  # 가장 오래된 미반영 delta의 나이 (0 = 최신)
+
+
+class RollupApplier:
+    """트리거가 쌓은 delta를 주기적으로 롤업에 반영 (워커마다 실행, SKIP LOCKED로 분담)"""
+
+    def __init__(
+        self,
+        interval_ms: float = ROLLUP_APPLY_INTERVAL_MS,
+        batch: int = ROLLUP_APPLY_BATCH,
+    ):
+        self.interval = interval_ms / 1000
+        self.batch = batch
+        self.applied_batches = 0
+        self.last_applied_at: datetime | None = None
+        self._task: asyncio.Task | None = None
+        self._logged_errors: set[type[Exception]] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        triggers_enabled = False
+        while True:
+            try:
+                if not triggers_enabled:
+                    await self.enable_triggers()
+                    triggers_enabled = True
+                await self.apply_once()
+                await asyncio.sleep(self.interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 테이블 없음(init_db.sql 미적용) / DB 일시 장애 -> 잠시 후 재시도
+                # 같은 종류의 오류는 1번만 로그 (반복 로그로 벤치마크 출력을 덮지 않도록)
+                if type(e) not in self._logged_errors:
+                    self._logged_errors.add(type(e))
+                    logger.warning(
+                        "rollup applier failed (init_db.sql 18-aggregation 섹션 확인): %s",
+                        e,
+                    )
+                await asyncio.sleep(RECONNECT_DELAY)
+
+    async def enable_triggers(self) -> bool:
+        """delta 트리거 활성화 (이미 켜져 있으면 아무것도 하지 않음)
+
+        꺼져 있던 동안의 쓰기는 delta가 없음 -> 같은 트랜잭션에서 전체 재계산
+        ALTER TABLE 잠금이 커밋까지 원본 쓰기를 막음 -> 재계산과 트리거 사이 누락 없음
+        """
+        names = [t for rollup in ROLLUPS for t in rollup.triggers]
+        async with async_session() as db:
+            disabled = (
+                await db.execute(DISABLED_TRIGGERS_SQL, {"names": names})
+            ).scalar_one()
+            if not disabled:
+                return False
+            for rollup in ROLLUPS:
+                await db.execute(text(rollup.enable_triggers_sql))
+            await self.rebuild(db)
+        logger.info("rollup delta triggers enabled (rollups rebuilt)")
+        return True
+
+    async def apply_once(self) -> None:
+        async with async_session() as db:
+            for rollup in ROLLUPS:
+                await db.execute(text(rollup.apply_sql), {"batch": self.batch})
+            await db.commit()
+        self.applied_batches += 1
+        self.last_applied_at = datetime.now()
+
+    async def staleness(self, db: AsyncSession, rollup: RollupTable) -> RollupStaleness:
+        row = (await db.execute(text(rollup.pending_sql))).one()
+        return RollupStaleness(
+            row.pending, row.oldest, max(0.0, float(row.staleness_ms))
+        )
+
+    async def rebuild(self, db: AsyncSession) -> dict[str, int]:
+        """원본 테이블에서 전체 재계산 (롤업 불일치 복구용)
+
+        delta 테이블을 EXCLUSIVE로 잠가 트리거(쓰기)와 applier를 잠시 막음
+        -> 잠금 이후 커밋된 변경은 재계산에 포함, 대기 중인 쓰기는 delta로 이어서 반영
+        """
+        deltas = ", ".join(rollup.delta for rollup in ROLLUPS)
+        await db.execute(text(f"LOCK TABLE {deltas} IN EXCLUSIVE MODE"))
+
+        counts = {}
+        for rollup in ROLLUPS:
+            await db.execute(text(f"DELETE FROM {rollup.delta}"))
+            await db.execute(text(f"DELETE FROM {rollup.rollup}"))
+            cols = ", ".join(rollup.measures)
+            result = await db.execute(
+                text(
+                    f"INSERT INTO {rollup.rollup} ({rollup.key}, {cols}, updated_at) "
+                    f"{rollup.source_sql}"
+                )
+            )
+            counts[rollup.name] = result.rowcount  # type: ignore[attr-defined]
+        await db.commit()
+        return counts
+
+
+# 워커당 싱글톤
+rollup_applier = RollupApplier()
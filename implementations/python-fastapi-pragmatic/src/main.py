@@ -2,9 +2,17 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from src.infrastructure.cache.bloom import user_bloom
 from src.infrastructure.cache.connection import close_redis
+from src.infrastructure.cache.inventory import redis_inventory
+from src.infrastructure.cache.invalidation import invalidation_bus
+from src.infrastructure.cache.tracking import REDIS_CLIENT_TRACKING, near_cache
+from src.infrastructure.database.approximate import approx_user_wide
 from src.infrastructure.database.connection import engine
+from src.infrastructure.database.group_commit import GROUP_COMMIT, user_group_commit
 from src.infrastructure.database.models import Base
+from src.infrastructure.database.profiling import TX_LOCK_SAMPLING, lock_sampler
+from src.infrastructure.database.rollup import ROLLUP_APPLIER, rollup_applier
 from src.presentation.api.v1.router import router as v1_router
 
 
@@ -13,8 +21,33 @@ async def lifespan(_app: FastAPI):
     # Startup: Create tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    # Startup: Redis 클라이언트 캐시 무효화 구독 (opt-in)
+    if REDIS_CLIENT_TRACKING:
+        await near_cache.start()
+    # Startup: 워커 간 캐시 무효화 구독 (CACHE_INVALIDATION_BUS)
+    await invalidation_bus.start()
+    # Startup: 존재하는 사용자 ID Bloom 필터 구축 (USER_BLOOM_FILTER, opt-in)
+    await user_bloom.rebuild()
+    # Startup: POST /users 그룹 커밋 flush 루프 (opt-in)
+    if GROUP_COMMIT:
+        await user_group_commit.start()
+    # Startup: Redis 재고 -> Postgres 반영 consumer (REDIS_INVENTORY, opt-in)
+    await redis_inventory.start()
+    # Startup: 트랜잭션 락 대기 샘플링 (pg_stat_activity 폴링, opt-in)
+    if TX_LOCK_SAMPLING:
+        await lock_sampler.start()
+    # Startup: 집계 롤업 delta 반영 루프 (ROLLUP_APPLIER, opt-in)
+    if ROLLUP_APPLIER:
+        await rollup_applier.start()
     yield
-    # Shutdown: Close connections
+    # Shutdown: 대기 중인 그룹 커밋 처리 후 연결 종료
+    await user_group_commit.stop()
+    await redis_inventory.stop()
+    await lock_sampler.stop()
+    await rollup_applier.stop()
+    await approx_user_wide.stop()
+    await invalidation_bus.stop()
+    await near_cache.stop()
     await close_redis()
     await engine.dispose()
 
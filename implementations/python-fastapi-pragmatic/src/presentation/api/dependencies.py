@@ -0,0 +1,10 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.connection import get_db
+from src.infrastructure.database.dataloader import Loaders
+
+
+async def get_loaders(db: AsyncSession = Depends(get_db)) -> Loaders:
+    """요청 스코프 DataLoader 모음 (get_db는 요청당 1번 -> 엔드포인트와 같은 세션)"""
+    return Loaders(db)
@@ -1,56 +1,145 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy import select, func, text
+import time
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select, func, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.infrastructure.database.approximate import approx_user_wide, sample_error
+from src.infrastructure.database.composite import CompositeResult, run_composite
 from src.infrastructure.database.connection import get_db
 from src.infrastructure.database.models import UserWideModel, AuthorModel, PostModel
+from src.infrastructure.database.rollup import (
+    AUTHOR_ROLLUP,
+    COUNTRY_ROLLUP,
+    RollupTable,
+    rollup_applier,
+)
 from src.presentation.schemas.aggregation import (
+    AggregationWriteResponse,
+    AuthorStatsRollupResponse,
     CountComparisonResponse,
+    CountComparisonTimedResponse,
     CountryStatsResponse,
+    DashboardResponse,
+    QueryTimings,
     AuthorStatsResponse,
+    CountryStatsRollupResponse,
+    RollupRebuildResponse,
+    RollupStatus,
 )
 
 
 router = APIRouter(prefix="/aggregation", tags=["aggregation"])
 
+# exact: 전체 스캔 / approx: 통계·표본·스케치 기반 근사 (오차 범위 포함)
+Accuracy = Literal["exact", "approx"]
+
 
 # ============================================
 # A. 단순 집계 비교: COUNT(*) vs COUNT(id) vs COUNT(DISTINCT)
 # ============================================
+async def _count_star(db: AsyncSession) -> int:
+    result = await db.execute(select(func.count()).select_from(UserWideModel))
+    return result.scalar() or 0
+
+
+async def _count_id(db: AsyncSession) -> int:
+    result = await db.execute(select(func.count(UserWideModel.id)))
+    return result.scalar() or 0
+
+
+async def _count_distinct_status(db: AsyncSession) -> int:
+    result = await db.execute(select(func.count(func.distinct(UserWideModel.status))))
+    return result.scalar() or 0
+
+
+# 서로 독립적인 COUNT 3개 (composite 실행 단위)
+COUNT_QUERIES = {
+    "count_star": _count_star,
+    "count_id": _count_id,
+    "count_distinct_status": _count_distinct_status,
+}
+
+
+def _timings(result: CompositeResult) -> QueryTimings:
+    return QueryTimings(
+        mode=result.mode,
+        wall_ms=result.wall_ms,
+        sum_ms=result.sum_ms,
+        subqueries=result.subquery_ms,
+    )
+
+
+async def _approx_counts() -> CountComparisonResponse:
+    """근사 COUNT: 메모리의 플래너 통계 + HLL (DB 조회 없음)"""
+    approx = await approx_user_wide.snapshot()
+    return CountComparisonResponse(
+        count_star=approx.count_star,
+        count_id=approx.count_star,  # id는 NOT NULL -> COUNT(*)와 동일
+        count_distinct_status=approx.count_distinct_status,
+        accuracy="approx",
+        error_bounds={
+            "count_star": approx.count_star_error,
+            "count_id": approx.count_star_error,
+            "count_distinct_status": approx.count_distinct_status_error,
+        },
+        as_of_ms=approx.as_of_ms,
+    )
+
+
 @router.get("/count/orm", response_model=CountComparisonResponse)
-async def count_comparison_orm(db: AsyncSession = Depends(get_db)):
+async def count_comparison_orm(
+    accuracy: Accuracy = "exact",
+    db: AsyncSession = Depends(get_db),
+):
     """
     ORM을 사용한 COUNT 비교
     - COUNT(*): 전체 행 수
     - COUNT(id): NULL 제외 행 수 (id는 NOT NULL이므로 동일)
     - COUNT(DISTINCT status): 고유 status 수
+    - accuracy=approx: reltuples + HyperLogLog 근사값 (error_bounds 포함)
     """
-    # COUNT(*)
-    result_star = await db.execute(select(func.count()).select_from(UserWideModel))
-    count_star = result_star.scalar() or 0
+    if accuracy == "approx":
+        return await _approx_counts()
 
-    # COUNT(id)
-    result_id = await db.execute(select(func.count(UserWideModel.id)))
-    count_id = result_id.scalar() or 0
-
-    # COUNT(DISTINCT status)
-    result_distinct = await db.execute(
-        select(func.count(func.distinct(UserWideModel.status)))
+    return CountComparisonResponse(
+        count_star=await _count_star(db),
+        count_id=await _count_id(db),
+        count_distinct_status=await _count_distinct_status(db),
     )
-    count_distinct = result_distinct.scalar() or 0
 
-    return CountComparisonResponse(
-        count_star=count_star,
-        count_id=count_id,
-        count_distinct_status=count_distinct,
+
+@router.get("/count/concurrent", response_model=CountComparisonTimedResponse)
+async def count_comparison_concurrent(
+    serial: bool = False,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    COUNT 3개를 별도 연결에서 동시 실행 (asyncio.gather)
+    - serial=true: 같은 세션에서 순서대로 (비교 기준)
+    - timings: 서브쿼리별 시간 / wall-clock / 합계
+    """
+    result = await run_composite(COUNT_QUERIES, db if serial else None)
+
+    return CountComparisonTimedResponse(
+        **result.values,
+        timings=_timings(result),
     )
 
 
 @router.get("/count/raw", response_model=CountComparisonResponse)
-async def count_comparison_raw(db: AsyncSession = Depends(get_db)):
+async def count_comparison_raw(
+    accuracy: Accuracy = "exact",
+    db: AsyncSession = Depends(get_db),
+):
     """
     Raw SQL을 사용한 COUNT 비교
+    - accuracy=approx: reltuples + HyperLogLog 근사값 (error_bounds 포함)
     """
+    if accuracy == "approx":
+        return await _approx_counts()
+
     query = text("""
         SELECT
             COUNT(*) as count_star,
@@ -114,14 +203,7 @@ async def country_stats_orm(
     ]
 
 
-@router.get("/stats/country/raw", response_model=list[CountryStatsResponse])
-async def country_stats_raw(
-    limit: int = 10,
-    db: AsyncSession = Depends(get_db),
-):
-    """
-    Raw SQL을 사용한 국가별 통계
-    """
+async def _country_stats(db: AsyncSession, limit: int) -> list[CountryStatsResponse]:
     query = text("""
         SELECT
             country,
@@ -148,6 +230,66 @@ async def country_stats_raw(
     ]
 
 
+async def _country_stats_sampled(
+    db: AsyncSession, limit: int, sample_percent: float
+) -> list[CountryStatsResponse]:
+    """TABLESAMPLE SYSTEM으로 일부 블록만 읽고 개수/합계를 확대
+
+    블록(ctid의 페이지 번호)별로 먼저 집계 -> 블록 간 분산으로 오차 범위 계산
+    """
+    query = text("""
+        WITH blocks AS (
+            SELECT
+                country,
+                (ctid::text::point)[0]::bigint AS block,
+                COUNT(*) AS n,
+                SUM(login_count) AS logins
+            FROM users_wide TABLESAMPLE SYSTEM (:percent)
+            GROUP BY country, block
+        )
+        SELECT
+            country,
+            SUM(n)::bigint AS user_count,
+            SUM(logins)::bigint AS total_logins,
+            SUM(logins)::float / SUM(n) AS avg_logins,
+            SUM(n * n)::float AS block_sum_sq
+        FROM blocks
+        GROUP BY country
+        ORDER BY user_count DESC
+        LIMIT :limit
+    """)
+    result = await db.execute(query, {"percent": sample_percent, "limit": limit})
+    rows = result.all()
+
+    fraction = sample_percent / 100
+    return [
+        CountryStatsResponse(
+            country=row.country or "",
+            user_count=round(row.user_count / fraction),
+            total_logins=round((row.total_logins or 0) / fraction),
+            avg_logins=float(row.avg_logins or 0),
+            error_bound=sample_error(row.block_sum_sq, fraction),
+        )
+        for row in rows
+    ]
+
+
+@router.get("/stats/country/raw", response_model=list[CountryStatsResponse])
+async def country_stats_raw(
+    limit: int = 10,
+    accuracy: Accuracy = "exact",
+    sample_percent: float = Query(1.0, gt=0, le=100),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Raw SQL을 사용한 국가별 통계
+    - accuracy=approx: sample_percent% 블록만 표본 추출 (user_count ± error_bound)
+    """
+    if accuracy == "approx":
+        return await _country_stats_sampled(db, limit, sample_percent)
+    return await _country_stats(db, limit)
+
+
 # ============================================
 # C. 다중 테이블 집계: 작가별 게시글 통계
 # ============================================
@@ -188,14 +330,7 @@ async def author_stats_orm(
     ]
 
 
-@router.get("/stats/author/raw", response_model=list[AuthorStatsResponse])
-async def author_stats_raw(
-    limit: int = 10,
-    db: AsyncSession = Depends(get_db),
-):
-    """
-    Raw SQL을 사용한 작가별 게시글 통계
-    """
+async def _author_stats(db: AsyncSession, limit: int) -> list[AuthorStatsResponse]:
     query = text("""
         SELECT
             a.id as author_id,
@@ -222,3 +357,194 @@ async def author_stats_raw(
         )
         for row in rows
     ]
+
+
+@router.get("/stats/author/raw", response_model=list[AuthorStatsResponse])
+async def author_stats_raw(
+    limit: int = 10,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Raw SQL을 사용한 작가별 게시글 통계
+    """
+    return await _author_stats(db, limit)
+
+
+# ============================================
+# D. 롤업 집계: 요약 테이블 조회 (원본 스캔 없음)
+# ============================================
+async def _rollup_status(db: AsyncSession, rollup: RollupTable) -> RollupStatus:
+    staleness = await rollup_applier.staleness(db, rollup)
+    return RollupStatus(
+        pending_deltas=staleness.pending_deltas,
+        oldest_pending_at=staleness.oldest_pending_at,
+        staleness_ms=staleness.staleness_ms,
+        last_applied_at=rollup_applier.last_applied_at,
+        applier_running=rollup_applier.running,
+    )
+
+
+@router.get("/stats/country/rollup", response_model=CountryStatsRollupResponse)
+async def country_stats_rollup(
+    limit: int = 10,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    롤업 테이블을 사용한 국가별 통계
+    - users_wide 쓰기 -> 트리거가 delta 기록 -> applier가 주기적으로 반영
+    - 결과는 최대 staleness_ms 만큼 늦을 수 있음
+    """
+    query = text("""
+        SELECT country, user_count, total_logins
+        FROM country_stats_rollup
+        WHERE user_count > 0
+        ORDER BY user_count DESC
+        LIMIT :limit
+    """)
+    result = await db.execute(query, {"limit": limit})
+    rows = result.all()
+
+    return CountryStatsRollupResponse(
+        items=[
+            CountryStatsResponse(
+                country=row.country,
+                user_count=row.user_count,
+                total_logins=row.total_logins,
+                avg_logins=row.total_logins / row.user_count,
+            )
+            for row in rows
+        ],
+        rollup=await _rollup_status(db, COUNTRY_ROLLUP),
+    )
+
+
+@router.get("/stats/author/rollup", response_model=AuthorStatsRollupResponse)
+async def author_stats_rollup(
+    limit: int = 10,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    롤업 테이블을 사용한 작가별 게시글 통계
+    - 상위 limit명만 authors와 PK JOIN (이름)
+    """
+    query = text("""
+        SELECT
+            r.author_id,
+            a.name as author_name,
+            r.post_count,
+            r.total_views
+        FROM author_stats_rollup r
+        JOIN authors a ON a.id = r.author_id
+        WHERE r.post_count > 0
+        ORDER BY r.post_count DESC
+        LIMIT :limit
+    """)
+    result = await db.execute(query, {"limit": limit})
+    rows = result.all()
+
+    return AuthorStatsRollupResponse(
+        items=[
+            AuthorStatsResponse(
+                author_id=row.author_id,
+                author_name=row.author_name,
+                post_count=row.post_count,
+                total_views=row.total_views,
+                avg_views=row.total_views / row.post_count,
+            )
+            for row in rows
+        ],
+        rollup=await _rollup_status(db, AUTHOR_ROLLUP),
+    )
+
+
+@router.post("/stats/rollup/rebuild", response_model=RollupRebuildResponse)
+async def rebuild_stats_rollup(db: AsyncSession = Depends(get_db)):
+    """
+    롤업 전체 재계산 (원본 테이블 GROUP BY)
+    - 재계산 동안 delta 테이블 잠금 -> 쓰기가 잠시 대기
+    """
+    start = time.perf_counter()
+    counts = await rollup_applier.rebuild(db)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    return RollupRebuildResponse(
+        country_rows=counts["country"],
+        author_rows=counts["author"],
+        elapsed_ms=elapsed,
+    )
+
+
+# ============================================
+# E. 집계 대상 쓰기 (롤업 delta 발생 - 읽기/쓰기 혼합 시나리오용)
+# ============================================
+@router.post("/writes/login", response_model=AggregationWriteResponse)
+async def write_login(user_id: int, db: AsyncSession = Depends(get_db)):
+    """users_wide 로그인 카운트 증가 (country 롤업 total_logins 변경)"""
+    result = await db.execute(
+        update(UserWideModel)
+        .where(UserWideModel.id == user_id)
+        .values(
+            login_count=UserWideModel.login_count + 1,
+            last_login=func.now(),
+        )
+        .returning(UserWideModel.login_count)
+    )
+    login_count = result.scalar_one_or_none()
+    if login_count is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    await db.commit()
+
+    return AggregationWriteResponse(operation="login", id=user_id, value=login_count)
+
+
+@router.post("/writes/view", response_model=AggregationWriteResponse)
+async def write_post_view(post_id: int, db: AsyncSession = Depends(get_db)):
+    """게시글 조회수 증가 (author 롤업 total_views 변경)"""
+    result = await db.execute(
+        update(PostModel)
+        .where(PostModel.id == post_id)
+        .values(view_count=PostModel.view_count + 1)
+        .returning(PostModel.view_count)
+    )
+    view_count = result.scalar_one_or_none()
+    if view_count is None:
+        raise HTTPException(status_code=404, detail="Post not found")
+    await db.commit()
+
+    return AggregationWriteResponse(operation="view", id=post_id, value=view_count)
+
+
+# ============================================
+# F. 대시보드: 독립 집계 여러 개를 한 번에 (동시 실행)
+# ============================================
+@router.get("/dashboard", response_model=DashboardResponse)
+async def dashboard(
+    limit: int = 10,
+    serial: bool = False,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    국가별 통계 + 작가별 통계 + COUNT 3개를 한 번에
+    - 기본: 서브쿼리 5개를 별도 연결에서 동시 실행 -> wall ≈ 가장 느린 쿼리
+    - serial=true: 같은 세션에서 순서대로 -> wall ≈ 합계
+    """
+    result = await run_composite(
+        {
+            "country_stats": lambda s: _country_stats(s, limit),
+            "author_stats": lambda s: _author_stats(s, limit),
+            **COUNT_QUERIES,
+        },
+        db if serial else None,
+    )
+    values = result.values
+
+    return DashboardResponse(
+        counts=CountComparisonResponse(
+            count_star=values["count_star"],
+            count_id=values["count_id"],
+            count_distinct_status=values["count_distinct_status"],
+        ),
+        country_stats=values["country_stats"],
+        author_stats=values["author_stats"],
+        timings=_timings(result),
+    )
@@ -1,16 +1,71 @@
+import csv
+import json
+import os
+import struct
 import time
-from fastapi import APIRouter, Depends, Query
+from collections.abc import AsyncIterator
+from typing import Literal
+
+import asyncpg
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy import text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.database.connection import get_db
 from src.infrastructure.database.models import BulkItemModel
-from src.presentation.schemas.bulk_operations import BulkOperationResult
+from src.presentation.schemas.bulk_operations import (
+    BulkIngestResult,
+    BulkOperationResult,
+)
 
 router = APIRouter(prefix="/bulk-operations", tags=["bulk-operations"])
 
 # 기본 건수
 DEFAULT_COUNT = 1000
+MAX_COPY_COUNT = 1_000_000  # COPY 모드 최대 건수
+MAX_BULK_UPDATE_COUNT = 100_000  # 단일 문장 UPDATE/UPSERT 최대 건수
+
+# 바이너리 COPY 스트림을 나눠 보내는 단위 (행)
+COPY_CHUNK_ROWS = 10000
+
+# PGCOPY 바이너리 포맷: 시그니처 + flags(int32) + 헤더 확장 길이(int32) / 종료 = -1(int16)
+PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+PGCOPY_TRAILER = struct.pack("!h", -1)
+
+# batch_size 지정 시 청크별 소요 시간 기록 (WAL/fsync 비용 곡선용)
+BATCH_SIZE_QUERY = Query(None, ge=1, le=10000, description="N행마다 commit")
+
+# 스트리밍 ingest: 줄바꿈 없이 이 크기를 넘는 입력은 거부 (버퍼 상한)
+MAX_INGEST_LINE_BYTES = 1024 * 1024
+# bulk_items 컬럼 범위 (name VARCHAR(100), value INTEGER) - COPY 전에 줄 단위로 검증
+INGEST_NAME_MAX_LENGTH = 100
+INT32_MIN, INT32_MAX = -(2**31), 2**31 - 1
+
+
+def _batches(start: int, stop: int, batch_size: int) -> list[range]:
+    """[start, stop) 구간을 batch_size 단위 range로 분할"""
+    return [range(i, min(i + batch_size, stop)) for i in range(start, stop, batch_size)]
+
+
+def _batch_result(
+    operation: str,
+    count: int,
+    elapsed_ms: float,
+    batch_size: int | None,
+    chunk_ms: list[float],
+) -> BulkOperationResult:
+    if batch_size is None:
+        return BulkOperationResult(
+            operation=operation, count=count, elapsed_ms=elapsed_ms
+        )
+    return BulkOperationResult(
+        operation=operation,
+        count=count,
+        elapsed_ms=elapsed_ms,
+        batch_size=batch_size,
+        commits=len(chunk_ms),
+        chunk_ms=[round(ms, 3) for ms in chunk_ms],
+    )
 
 
 @router.delete("/cleanup")
@@ -27,20 +82,27 @@ async def cleanup(db: AsyncSession = Depends(get_db)):
 @router.post("/insert-individual", response_model=BulkOperationResult)
 async def insert_individual(
     count: int = Query(DEFAULT_COUNT, ge=1, le=10000),
+    batch_size: int | None = BATCH_SIZE_QUERY,
     db: AsyncSession = Depends(get_db),
 ):
-    """1건씩 개별 INSERT + commit (가장 느림)"""
+    """1건씩 개별 INSERT + commit (가장 느림)
+
+    batch_size=N: INSERT는 1건씩 그대로, commit만 N건마다 (fsync 횟수만 변화)
+    """
     start = time.perf_counter()
+    chunk_ms = []
 
-    for i in range(count):
-        item = BulkItemModel(name=f"item_{i}", value=i)
-        db.add(item)
+    for batch in _batches(0, count, batch_size or 1):
+        t0 = time.perf_counter()
+        for i in batch:
+            item = BulkItemModel(name=f"item_{i}", value=i)
+            db.add(item)
+            await db.flush()
         await db.commit()
+        chunk_ms.append((time.perf_counter() - t0) * 1000)
 
     elapsed = (time.perf_counter() - start) * 1000
-    return BulkOperationResult(
-        operation="insert-individual", count=count, elapsed_ms=elapsed
-    )
+    return _batch_result("insert-individual", count, elapsed, batch_size, chunk_ms)
 
 
 # ============================================
@@ -49,19 +111,22 @@ async def insert_individual(
 @router.post("/insert-batch", response_model=BulkOperationResult)
 async def insert_batch(
     count: int = Query(DEFAULT_COUNT, ge=1, le=10000),
+    batch_size: int | None = BATCH_SIZE_QUERY,
     db: AsyncSession = Depends(get_db),
 ):
-    """add_all로 모아서 1회 commit"""
+    """add_all로 모아서 1회 commit (batch_size=N: N건씩 add_all + commit)"""
     start = time.perf_counter()
+    chunk_ms = []
 
-    items = [BulkItemModel(name=f"item_{i}", value=i) for i in range(count)]
-    db.add_all(items)
-    await db.commit()
+    for batch in _batches(0, count, batch_size or count):
+        t0 = time.perf_counter()
+        items = [BulkItemModel(name=f"item_{i}", value=i) for i in batch]
+        db.add_all(items)
+        await db.commit()
+        chunk_ms.append((time.perf_counter() - t0) * 1000)
 
     elapsed = (time.perf_counter() - start) * 1000
-    return BulkOperationResult(
-        operation="insert-batch", count=count, elapsed_ms=elapsed
-    )
+    return _batch_result("insert-batch", count, elapsed, batch_size, chunk_ms)
 
 
 # ============================================
@@ -91,20 +156,25 @@ async def insert_raw(
 @router.post("/update-individual", response_model=BulkOperationResult)
 async def update_individual(
     count: int = Query(DEFAULT_COUNT, ge=1, le=10000),
+    batch_size: int | None = BATCH_SIZE_QUERY,
     db: AsyncSession = Depends(get_db),
 ):
-    """1건씩 개별 UPDATE"""
+    """1건씩 개별 UPDATE (batch_size=N: UPDATE는 1건씩, commit만 N건마다)"""
     start = time.perf_counter()
+    chunk_ms = []
 
-    for i in range(1, count + 1):
-        stmt = update(BulkItemModel).where(BulkItemModel.id == i).values(value=i * 10)
-        await db.execute(stmt)
+    for batch in _batches(1, count + 1, batch_size or 1):
+        t0 = time.perf_counter()
+        for i in batch:
+            stmt = (
+                update(BulkItemModel).where(BulkItemModel.id == i).values(value=i * 10)
+            )
+            await db.execute(stmt)
         await db.commit()
+        chunk_ms.append((time.perf_counter() - t0) * 1000)
 
     elapsed = (time.perf_counter() - start) * 1000
-    return BulkOperationResult(
-        operation="update-individual", count=count, elapsed_ms=elapsed
-    )
+    return _batch_result("update-individual", count, elapsed, batch_size, chunk_ms)
 
 
 # ============================================
@@ -112,7 +182,7 @@ async def update_individual(
 # ============================================
 @router.post("/update-bulk", response_model=BulkOperationResult)
 async def update_bulk(
-    count: int = Query(DEFAULT_COUNT, ge=1, le=10000),
+    count: int = Query(DEFAULT_COUNT, ge=1, le=MAX_BULK_UPDATE_COUNT),
     db: AsyncSession = Depends(get_db),
 ):
     """Bulk UPDATE (CASE WHEN 사용)"""
@@ -133,3 +203,307 @@ async def update_bulk(
 
     elapsed = (time.perf_counter() - start) * 1000
     return BulkOperationResult(operation="update-bulk", count=count, elapsed_ms=elapsed)
+
+
+async def _driver_connection(db: AsyncSession):
+    """세션이 사용하는 asyncpg 연결 (COPY 등 드라이버 전용 API용)"""
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    return raw.driver_connection
+
+
+# ============================================
+# F. COPY INSERT (copy_records_to_table)
+# ============================================
+@router.post("/insert-copy", response_model=BulkOperationResult)
+async def insert_copy(
+    count: int = Query(DEFAULT_COUNT, ge=1, le=MAX_COPY_COUNT),
+    db: AsyncSession = Depends(get_db),
+):
+    """COPY FROM STDIN (asyncpg copy_records_to_table) - SQL 파싱/행별 왕복 없음"""
+    start = time.perf_counter()
+
+    conn = await _driver_connection(db)
+    # 제너레이터로 전달 -> 100만 건도 전체 리스트를 만들지 않음
+    records = ((f"item_{i}", i) for i in range(count))
+    await conn.copy_records_to_table(
+        "bulk_items", records=records, columns=["name", "value"]
+    )
+    await db.commit()
+
+    elapsed = (time.perf_counter() - start) * 1000
+    return BulkOperationResult(operation="insert-copy", count=count, elapsed_ms=elapsed)
+
+
+async def _pgcopy_binary_chunks(count: int) -> AsyncIterator[bytes]:
+    """(name text, value int4) 행을 PGCOPY 바이너리로 직접 인코딩 (청크 단위)"""
+    yield PGCOPY_HEADER
+    for chunk_start in range(0, count, COPY_CHUNK_ROWS):
+        buf = bytearray()
+        for i in range(chunk_start, min(chunk_start + COPY_CHUNK_ROWS, count)):
+            name = f"item_{i}".encode()
+            # 필드 수(int16) + [길이(int32) + 값] * 2
+            buf += struct.pack("!hi", 2, len(name))
+            buf += name
+            buf += struct.pack("!ii", 4, i)
+        yield bytes(buf)
+    yield PGCOPY_TRAILER
+
+
+# ============================================
+# G. Binary COPY INSERT (PGCOPY 스트림 직접 생성)
+# ============================================
+@router.post("/insert-copy-binary", response_model=BulkOperationResult)
+async def insert_copy_binary(
+    count: int = Query(DEFAULT_COUNT, ge=1, le=MAX_COPY_COUNT),
+    db: AsyncSession = Depends(get_db),
+):
+    """COPY FROM STDIN (FORMAT binary) - 행 인코딩을 드라이버 대신 직접 수행
+
+    copy_records_to_table도 바이너리 COPY지만 행마다 타입 codec을 거침
+    -> 고정 스키마를 struct로 한 번에 인코딩해 청크 단위로 스트리밍
+    """
+    start = time.perf_counter()
+
+    conn = await _driver_connection(db)
+    await conn.copy_to_table(
+        "bulk_items",
+        source=_pgcopy_binary_chunks(count),
+        columns=["name", "value"],
+        format="binary",
+    )
+    await db.commit()
+
+    elapsed = (time.perf_counter() - start) * 1000
+    return BulkOperationResult(
+        operation="insert-copy-binary", count=count, elapsed_ms=elapsed
+    )
+
+
+# ============================================
+# H. UNNEST UPDATE (배열 바인드 파라미터)
+# ============================================
+# SQL 텍스트가 건수와 무관하게 고정 -> asyncpg prepared statement 캐시로 재사용
+UPDATE_UNNEST_SQL = text(
+    """
+    UPDATE bulk_items AS b
+    SET value = v.value
+    FROM unnest(CAST(:ids AS integer[]), CAST(:values AS integer[])) AS v(id, value)
+    WHERE b.id = v.id
+    """
+)
+
+
+@router.post("/update-unnest", response_model=BulkOperationResult)
+async def update_unnest(
+    count: int = Query(DEFAULT_COUNT, ge=1, le=MAX_BULK_UPDATE_COUNT),
+    batch_size: int | None = BATCH_SIZE_QUERY,
+    db: AsyncSession = Depends(get_db),
+):
+    """Bulk UPDATE (UPDATE ... FROM unnest) - CASE WHEN과 달리 파싱 비용이 건수와 무관
+
+    batch_size=N: N건씩 나눠 UPDATE + commit (같은 prepared statement 재사용)
+    """
+    start = time.perf_counter()
+    chunk_ms = []
+
+    for batch in _batches(1, count + 1, batch_size or count):
+        t0 = time.perf_counter()
+        ids = list(batch)
+        values = [i * 10 for i in ids]
+        await db.execute(UPDATE_UNNEST_SQL, {"ids": ids, "values": values})
+        await db.commit()
+        chunk_ms.append((time.perf_counter() - t0) * 1000)
+
+    elapsed = (time.perf_counter() - start) * 1000
+    return _batch_result("update-unnest", count, elapsed, batch_size, chunk_ms)
+
+
+# ============================================
+# I. UPSERT (INSERT ... SELECT unnest ... ON CONFLICT)
+# ============================================
+UPSERT_UNNEST_SQL = text(
+    """
+    INSERT INTO bulk_items (id, name, value)
+    SELECT * FROM unnest(
+        CAST(:ids AS integer[]),
+        CAST(:names AS varchar[]),
+        CAST(:values AS integer[])
+    )
+    ON CONFLICT (id) DO UPDATE
+    SET name = EXCLUDED.name, value = EXCLUDED.value
+    """
+)
+
+# id를 직접 지정해 INSERT -> 이후 SERIAL 기본값이 충돌하지 않도록 시퀀스 보정
+SYNC_BULK_ITEMS_SEQUENCE_SQL = text(
+    """
+    SELECT setval(
+        pg_get_serial_sequence('bulk_items', 'id'),
+        GREATEST((SELECT MAX(id) FROM bulk_items), 1)
+    )
+    """
+)
+
+
+@router.post("/upsert", response_model=BulkOperationResult)
+async def upsert(
+    count: int = Query(DEFAULT_COUNT, ge=1, le=MAX_BULK_UPDATE_COUNT),
+    db: AsyncSession = Depends(get_db),
+):
+    """Bulk UPSERT - id 1..count 중 있는 행은 UPDATE, 없는 행은 INSERT (문장 1회)"""
+    start = time.perf_counter()
+
+    ids = list(range(1, count + 1))
+    names = [f"item_{i}" for i in ids]
+    values = [i * 10 for i in ids]
+    await db.execute(UPSERT_UNNEST_SQL, {"ids": ids, "names": names, "values": values})
+    await db.execute(SYNC_BULK_ITEMS_SEQUENCE_SQL)
+    await db.commit()
+
+    elapsed = (time.perf_counter() - start) * 1000
+    return BulkOperationResult(operation="upsert", count=count, elapsed_ms=elapsed)
+
+
+# ============================================
+# J. Streaming INGEST (NDJSON/CSV 요청 본문 -> 청크 COPY)
+# ============================================
+def _current_rss_mb() -> float | None:
+    """현재 RSS (Linux /proc/self/statm, 없으면 None)
+
+    ru_maxrss는 프로세스 전체 수명의 최대값 -> 요청 단위 비교에 쓸 수 없음
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+async def _iter_lines(
+    chunks: AsyncIterator[bytes], stats: dict[str, int]
+) -> AsyncIterator[bytes]:
+    """요청 본문 청크를 줄 단위로 분리 (미완성 마지막 줄만 버퍼에 유지)"""
+    buffer = b""
+    async for chunk in chunks:
+        stats["bytes"] += len(chunk)
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        if len(buffer) > MAX_INGEST_LINE_BYTES:
+            raise HTTPException(status_code=413, detail="Line too long")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+def _check_row(name: str, value: int) -> tuple[str, int]:
+    """컬럼 범위 검증 (COPY 도중 DataError -> 500 대신 줄 번호와 함께 400)"""
+    if len(name) > INGEST_NAME_MAX_LENGTH:
+        raise ValueError(f"name longer than {INGEST_NAME_MAX_LENGTH} characters")
+    if not INT32_MIN <= value <= INT32_MAX:
+        raise ValueError(f"value {value} out of int32 range")
+    return name, value
+
+
+def _parse_ndjson(line: bytes) -> tuple[str, int]:
+    row = json.loads(line)
+    return _check_row(str(row["name"]), int(row.get("value", 0)))
+
+
+def _parse_csv(line: bytes) -> tuple[str, int]:
+    # 한 줄 = 한 행 (따옴표 안의 줄바꿈은 지원하지 않음)
+    name, value = next(csv.reader([line.decode()]))
+    return _check_row(name, int(value))
+
+
+async def _copy_chunk(
+    conn, records: list[tuple[str, int]], first_line: int, last_line: int
+) -> None:
+    """청크 COPY - 검증을 통과했지만 DB가 거부한 값(NUL 문자 등)도 400으로 변환"""
+    try:
+        await conn.copy_records_to_table(
+            "bulk_items", records=records, columns=["name", "value"]
+        )
+    except (asyncpg.DataError, OverflowError) as e:
+        raise HTTPException(
+            status_code=400, detail=f"lines {first_line}-{last_line}: {e!r}"
+        )
+
+
+@router.post("/ingest", response_model=BulkIngestResult)
+async def ingest(
+    request: Request,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    chunk_rows: int = Query(5000, ge=1, le=100000),
+    db: AsyncSession = Depends(get_db),
+):
+    """요청 본문을 스트리밍으로 읽어 chunk_rows 단위로 COPY (전체 본문을 메모리에 올리지 않음)
+
+    - ndjson: 줄마다 {"name": ..., "value": ...}
+    - csv: 첫 줄 헤더(name,value) + 줄마다 name,value
+    - COPY가 끝나야 다음 본문을 읽음 -> DB가 느리면 클라이언트 전송도 느려짐 (backpressure)
+    - 전체가 1개 트랜잭션 (중간에 잘못된 줄이 있으면 400 + 전체 롤백)
+    """
+    start = time.perf_counter()
+    parse = _parse_ndjson if format == "ndjson" else _parse_csv
+    # 요청 중 RSS 샘플링 (시작 + COPY 청크마다) -> 본문 크기와 무관하게 평탄한지 확인
+    rss_start = _current_rss_mb()
+    rss_peak = rss_start
+
+    conn = await _driver_connection(db)
+    stats = {"bytes": 0}
+    records: list[tuple[str, int]] = []
+    count = 0
+    chunks = 0
+    line_no = 0
+    chunk_first_line = 1
+
+    # 드라이버 연결에 직접 트랜잭션 (세션은 첫 SQL 실행 전까지 BEGIN을 보내지 않음)
+    async with conn.transaction():
+        async for line in _iter_lines(request.stream(), stats):
+            line_no += 1
+            if not line.strip() or (format == "csv" and line_no == 1):
+                continue
+            try:
+                records.append(parse(line))
+            except (ValueError, KeyError, TypeError) as e:
+                raise HTTPException(status_code=400, detail=f"line {line_no}: {e!r}")
+
+            if len(records) >= chunk_rows:
+                await _copy_chunk(conn, records, chunk_first_line, line_no)
+                count += len(records)
+                chunks += 1
+                records = []
+                chunk_first_line = line_no + 1
+                rss = _current_rss_mb()
+                if rss is not None and rss_peak is not None:
+                    rss_peak = max(rss_peak, rss)
+
+        if records:
+            await _copy_chunk(conn, records, chunk_first_line, line_no)
+            count += len(records)
+            chunks += 1
+
+    elapsed = time.perf_counter() - start
+    rss_end = _current_rss_mb()
+    if rss_end is not None and rss_peak is not None:
+        rss_peak = max(rss_peak, rss_end)
+
+    return BulkIngestResult(
+        operation="ingest",
+        format=format,
+        count=count,
+        chunks=chunks,
+        bytes_received=stats["bytes"],
+        elapsed_ms=elapsed * 1000,
+        rows_per_sec=round(count / elapsed, 2) if elapsed > 0 else 0.0,
+        rss_start_mb=None if rss_start is None else round(rss_start, 2),
+        rss_peak_mb=None if rss_peak is None else round(rss_peak, 2),
+        rss_growth_mb=(
+            None
+            if rss_start is None or rss_peak is None
+            else round(rss_peak - rss_start, 2)
+        ),
+    )
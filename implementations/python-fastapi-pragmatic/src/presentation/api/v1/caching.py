@@ -1,23 +1,85 @@
+import asyncio
 import json
 import time
+from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
 from redis.asyncio import Redis
+from redis.exceptions import LockError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.cache.connection import get_redis
-from src.infrastructure.database.connection import get_db
-from src.infrastructure.database.models import UserModel
+from src.infrastructure.cache.bloom import user_bloom
+from src.infrastructure.cache.codec import CODECS, CodecName, get_codec
+from src.infrastructure.cache.connection import get_redis, get_redis_binary
+from src.infrastructure.cache.invalidation import invalidation_bus
+from src.infrastructure.cache.local import local_cache
+from src.infrastructure.cache.metrics import cache_metrics
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.infrastructure.cache.swr import StaleWhileRevalidateCache
+from src.infrastructure.cache.tracking import near_cache
+from src.infrastructure.database.connection import async_session, get_db
+from src.infrastructure.database.models import UserModel, UserPaginationModel
 from src.presentation.schemas.caching import (
+    CacheBulkWarmupResult,
     CacheResult,
+    CacheStats,
     CacheWarmupResult,
+    CodecCacheResult,
 )
 
 
 router = APIRouter(prefix="/cache", tags=["caching"])
 
 CACHE_TTL = 300  # 5분
+NEGATIVE_CACHE_TTL = 30  # 초, "없는 사용자" 결과 캐시 (사용자 생성 시 즉시 제거)
+
+# 요청 병합 (stampede 방지)
+user_loads = SingleFlight()
+LOCK_TIMEOUT = 2  # 초, 워커 간 락 최대 보유 시간 (DB 조회가 이보다 길면 자동 해제)
+LOCK_WAIT = 0.5  # 초, 다른 워커의 캐시 적재를 기다리는 최대 시간
+LOCK_POLL_INTERVAL = 0.01  # 초
+
+# Stale-While-Revalidate (+ XFetch 조기 갱신)
+swr_cache = StaleWhileRevalidateCache(timed=cache_metrics.timed)
+SWR_EVENTS = {"cache": "hit", "stale": "stale", "database": "miss"}
+
+# 프로세스 내 캐시 계층 -> 항목 수/메모리/eviction 메트릭
+cache_metrics.register_local("l1", local_cache)
+cache_metrics.register_local("near", near_cache.local)
+
+# 벌크 워밍업 대상 테이블 -> (모델, 캐시 키 prefix)
+WARMUP_TABLES = {
+    "users": (UserModel, "user"),
+    "users_pagination": (UserPaginationModel, "user_pagination"),
+}
+
+
+def _user_cache_keys(user_id: int) -> list[str]:
+    """사용자 1명에 대한 모든 캐시 키 (cached/tiered/near, swr, codec별)"""
+    keys = [f"user:{user_id}", f"user:swr:{user_id}", f"user:missing:{user_id}"]
+    keys += [_codec_key("user", codec, user_id) for codec in CODECS if codec != "json"]
+    return keys
+
+
+async def _on_invalidation(event: dict) -> None:
+    """무효화 버스 핸들러 - 모든 워커에서 실행"""
+    if event["entity"] == "*":
+        # 구독 재연결 (그 사이 이벤트 유실 가능) -> 로컬 캐시 전체 비움
+        local_cache.clear()
+        return
+
+    if event["entity"] == "user":
+        keys = _user_cache_keys(event["id"])
+        for key in keys:
+            local_cache.delete(key)
+        # near-cache는 Redis DEL로 발생하는 무효화 메시지로 함께 제거됨
+        redis = await get_redis()
+        await redis.delete(*keys)
+
+
+invalidation_bus.subscribe(_on_invalidation)
 
 
 @router.get("/users/{user_id}/no-cache", response_model=CacheResult)
@@ -54,11 +116,21 @@ async def get_user_cached(
     """캐시 우선 조회 (미스 시 DB -> 캐시 저장)"""
     start = time.perf_counter()
     cache_key = f"user:{user_id}"
+    negative_key = f"user:missing:{user_id}"
 
-    # 1. 캐시 조회
-    cached = await redis.get(cache_key)
+    # 0. Bloom 필터 (USER_BLOOM_FILTER=true): 확실히 없는 ID는 Redis/DB 조회 없이 404
+    if not user_bloom.might_exist(user_id):
+        cache_metrics.inc("bloom", "reject")
+        raise HTTPException(status_code=404, detail="User not found")
+
+    # 1. 캐시 조회 (값 + 음성 캐시를 한 번의 왕복으로)
+    cached, missing = await cache_metrics.timed(
+        "redis", redis.mget(cache_key, negative_key)
+    )
     if cached:
-        data = json.loads(cached)
+        cache_metrics.inc("redis", "hit")
+        with cache_metrics.timer("deserialize"):
+            data = json.loads(cached)
         elapsed = (time.perf_counter() - start) * 1000
         return CacheResult(
             source="cache",
@@ -67,16 +139,28 @@ async def get_user_cached(
             email=data["email"],
             elapsed_ms=round(elapsed, 2),
         )
+    if missing:
+        cache_metrics.inc("redis", "negative_hit")
+        raise HTTPException(status_code=404, detail="User not found")
 
     # 2. 캐시 미스 -> DB 조회
-    result = await db.execute(select(UserModel).where(UserModel.id == user_id))
+    cache_metrics.inc("redis", "miss")
+    result = await cache_metrics.timed(
+        "db", db.execute(select(UserModel).where(UserModel.id == user_id))
+    )
     user = result.scalar_one_or_none()
     if not user:
+        # 음성 캐시: 짧은 TTL 동안 같은 ID의 반복 조회가 DB로 가지 않도록
+        await cache_metrics.timed(
+            "redis", redis.setex(negative_key, NEGATIVE_CACHE_TTL, "1")
+        )
         raise HTTPException(status_code=404, detail="User not found")
 
     # 3. 캐시 저장
     user_data = {"id": user.id, "name": user.name, "email": user.email}
-    await redis.setex(cache_key, CACHE_TTL, json.dumps(user_data))
+    with cache_metrics.timer("serialize"):
+        payload = json.dumps(user_data)
+    await cache_metrics.timed("redis", redis.setex(cache_key, CACHE_TTL, payload))
 
     elapsed = (time.perf_counter() - start) * 1000
 
@@ -89,6 +173,341 @@ async def get_user_cached(
     )
 
 
+@router.get("/users/{user_id}/tiered", response_model=CacheResult)
+async def get_user_tiered(
+    user_id: int,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+):
+    """2단 캐시 조회 (L1 프로세스 메모리 -> L2 Redis -> DB)"""
+    start = time.perf_counter()
+    cache_key = f"user:{user_id}"
+
+    # 1. L1 조회 (네트워크 왕복 없음)
+    data = local_cache.get(cache_key)
+    source = "l1"
+    cache_metrics.inc("l1", "hit" if data is not None else "miss")
+
+    # 2. L1 미스 -> L2(Redis) 조회 후 L1 채움
+    if data is None:
+        cached = await cache_metrics.timed("redis", redis.get(cache_key))
+        if cached:
+            cache_metrics.inc("redis", "hit")
+            with cache_metrics.timer("deserialize"):
+                data = json.loads(cached)
+            local_cache.set(cache_key, data)
+            source = "l2"
+
+    # 3. L2 미스 -> DB 조회 후 L2, L1 모두 채움
+    if data is None:
+        cache_metrics.inc("redis", "miss")
+        result = await cache_metrics.timed(
+            "db", db.execute(select(UserModel).where(UserModel.id == user_id))
+        )
+        user = result.scalar_one_or_none()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        data = {"id": user.id, "name": user.name, "email": user.email}
+        with cache_metrics.timer("serialize"):
+            payload = json.dumps(data)
+        await cache_metrics.timed("redis", redis.setex(cache_key, CACHE_TTL, payload))
+        local_cache.set(cache_key, data)
+        source = "database"
+
+    elapsed = (time.perf_counter() - start) * 1000
+
+    return CacheResult(
+        source=source,
+        user_id=data["id"],
+        name=data["name"],
+        email=data["email"],
+        elapsed_ms=round(elapsed, 2),
+    )
+
+
+@router.get("/users/{user_id}/near", response_model=CacheResult)
+async def get_user_near(
+    user_id: int,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+):
+    """near-cache 조회 (로컬 -> Redis -> DB), Redis 무효화 메시지로 로컬 일관성 유지"""
+    if not near_cache.enabled:
+        raise HTTPException(
+            status_code=503, detail="Client tracking disabled (REDIS_CLIENT_TRACKING)"
+        )
+
+    start = time.perf_counter()
+    cache_key = f"user:{user_id}"
+
+    # 1. 로컬 조회 (무효화 메시지로 관리되므로 네트워크 왕복 없이 신뢰)
+    data = near_cache.get(cache_key)
+    source = "near"
+    cache_metrics.inc("near", "hit" if data is not None else "miss")
+
+    # 2. 로컬 미스 -> Redis 조회 후 로컬 저장 (조회 중 무효화가 오면 저장 생략)
+    if data is None:
+        epoch = near_cache.epoch
+        cached = await cache_metrics.timed("redis", redis.get(cache_key))
+        if cached:
+            cache_metrics.inc("redis", "hit")
+            with cache_metrics.timer("deserialize"):
+                data = json.loads(cached)
+            near_cache.set(cache_key, data, epoch)
+            source = "l2"
+
+    # 3. Redis 미스 -> DB 조회 후 Redis 저장
+    # (SETEX 자체가 무효화 메시지를 발생시키므로 로컬은 다음 조회에서 채움)
+    if data is None:
+        cache_metrics.inc("redis", "miss")
+        result = await cache_metrics.timed(
+            "db", db.execute(select(UserModel).where(UserModel.id == user_id))
+        )
+        user = result.scalar_one_or_none()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        data = {"id": user.id, "name": user.name, "email": user.email}
+        with cache_metrics.timer("serialize"):
+            payload = json.dumps(data)
+        await cache_metrics.timed("redis", redis.setex(cache_key, CACHE_TTL, payload))
+        source = "database"
+
+    elapsed = (time.perf_counter() - start) * 1000
+
+    return CacheResult(
+        source=source,
+        user_id=data["id"],
+        name=data["name"],
+        email=data["email"],
+        elapsed_ms=round(elapsed, 2),
+    )
+
+
+async def _fetch_user(user_id: int) -> dict | None:
+    """DB에서 사용자 조회 (요청 스코프 밖에서도 쓰도록 자체 세션 사용)"""
+    async with async_session() as db:
+        result = await cache_metrics.timed(
+            "db", db.execute(select(UserModel).where(UserModel.id == user_id))
+        )
+        user = result.scalar_one_or_none()
+    if not user:
+        return None
+    return {"id": user.id, "name": user.name, "email": user.email}
+
+
+async def _load_user_into_cache(
+    user_id: int, redis: Redis, distributed: bool
+) -> tuple[dict | None, bool]:
+    """DB 조회 + 캐시 저장 (SingleFlight로 키당 1회만 실행)
+
+    (user_data, 다른 워커가 채운 캐시 사용 여부) 반환
+    - distributed=True: Redis 락으로 워커 간에도 DB 조회를 1회로 제한
+    """
+    cache_key = f"user:{user_id}"
+    lock = redis.lock(f"lock:{cache_key}", timeout=LOCK_TIMEOUT)
+    acquired = False
+
+    if distributed:
+        acquired = await lock.acquire(blocking=False)
+        if not acquired:
+            # 다른 워커가 적재 중 -> 캐시가 채워질 때까지 짧게 폴링
+            deadline = time.monotonic() + LOCK_WAIT
+            while time.monotonic() < deadline:
+                await asyncio.sleep(LOCK_POLL_INTERVAL)
+                cached = await cache_metrics.timed("redis", redis.get(cache_key))
+                if cached:
+                    return json.loads(cached), True
+            # 대기 시간 초과 (락 보유 워커 지연/장애) -> 직접 DB 조회
+
+    try:
+        user_data = await _fetch_user(user_id)
+        if user_data is None:
+            return None, False
+
+        with cache_metrics.timer("serialize"):
+            payload = json.dumps(user_data)
+        await cache_metrics.timed("redis", redis.setex(cache_key, CACHE_TTL, payload))
+        return user_data, False
+    finally:
+        if acquired:
+            try:
+                await lock.release()
+            except LockError:
+                pass  # 이미 만료되어 해제됨
+
+
+@router.get("/users/{user_id}/coalesced", response_model=CacheResult)
+async def get_user_coalesced(
+    user_id: int,
+    distributed: bool = Query(False, description="Redis 락으로 워커 간 병합"),
+    redis: Redis = Depends(get_redis),
+):
+    """캐시 우선 조회 + 미스 병합 (동시 미스는 DB 조회/캐시 저장 1회 공유)"""
+    start = time.perf_counter()
+    cache_key = f"user:{user_id}"
+
+    # 1. 캐시 조회
+    cached = await cache_metrics.timed("redis", redis.get(cache_key))
+    if cached:
+        cache_metrics.inc("redis", "hit")
+        with cache_metrics.timer("deserialize"):
+            data = json.loads(cached)
+        source = "cache"
+    else:
+        # 2. 캐시 미스 -> 같은 키의 진행 중 조회가 있으면 그 결과를 공유
+        cache_metrics.inc("redis", "miss")
+        (data, filled_elsewhere), shared = await user_loads.do(
+            cache_key,
+            lambda: _load_user_into_cache(user_id, redis, distributed),
+        )
+        if data is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        source = "coalesced" if shared or filled_elsewhere else "database"
+
+    elapsed = (time.perf_counter() - start) * 1000
+
+    return CacheResult(
+        source=source,
+        user_id=data["id"],
+        name=data["name"],
+        email=data["email"],
+        elapsed_ms=round(elapsed, 2),
+    )
+
+
+@router.get("/users/{user_id}/swr", response_model=CacheResult)
+async def get_user_swr(
+    user_id: int,
+    redis: Redis = Depends(get_redis),
+):
+    """Stale-While-Revalidate 조회 (만료 직후에도 stale 값을 즉시 반환)"""
+    start = time.perf_counter()
+    cache_key = f"user:swr:{user_id}"
+
+    # Redis GET/SETEX는 swr_cache가, 미스 시 DB 조회는 _fetch_user가 각각 측정
+    data, source = await swr_cache.get(
+        redis, cache_key, CACHE_TTL, lambda: _fetch_user(user_id)
+    )
+    cache_metrics.inc("swr", SWR_EVENTS[source])
+    if data is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    elapsed = (time.perf_counter() - start) * 1000
+
+    return CacheResult(
+        source=source,
+        user_id=data["id"],
+        name=data["name"],
+        email=data["email"],
+        elapsed_ms=round(elapsed, 2),
+    )
+
+
+@router.get("/swr/stats")
+async def get_swr_stats():
+    """SWR 카운터 (현재 워커 기준)"""
+    return swr_cache.stats.to_dict()
+
+
+@router.get("/stats", response_model=CacheStats)
+async def get_cache_stats(redis: Redis = Depends(get_redis)):
+    """캐시 통계 - Redis 키 수/메모리 + 현재 워커의 이벤트, 단계별 지연, L1 메모리"""
+    total_keys = await redis.dbsize()
+    memory = await redis.info("memory")
+
+    return CacheStats(
+        total_keys=total_keys,
+        memory_used=memory["used_memory_human"],
+        swr=swr_cache.stats.to_dict(),
+        **cache_metrics.to_dict(),
+    )
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_cache_metrics():
+    """Prometheus 스크랩용 (monitoring/prometheus/prometheus.yml)"""
+    return PlainTextResponse(
+        cache_metrics.render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+@router.delete("/stats")
+async def reset_cache_stats():
+    """캐시 통계 초기화 (시나리오 시작 전 호출, /cache/metrics 카운터는 유지)"""
+    cache_metrics.reset()
+    return {"message": "Cache stats reset"}
+
+
+def _codec_key(prefix: str, codec: str, key_id: int) -> str:
+    """json은 기존 키와 호환 (user:{id}), 그 외 codec은 키 공간 분리"""
+    if codec == "json":
+        return f"{prefix}:{key_id}"
+    return f"{prefix}:{codec}:{key_id}"
+
+
+@router.get("/users/{user_id}/codec", response_model=CodecCacheResult)
+async def get_user_codec(
+    user_id: int,
+    codec: CodecName | None = Query(None, description="미지정 시 CACHE_CODEC"),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis_binary),
+):
+    """캐시 우선 조회 (값 직렬화 codec 선택 + 크기/인코딩 시간 측정)"""
+    start = time.perf_counter()
+    cache_codec = get_codec(codec)
+    cache_key = _codec_key("user", cache_codec.name, user_id)
+    encode_ms = None
+    decode_ms = None
+
+    # 1. 캐시 조회 -> 역직렬화 시간 측정
+    cached = await cache_metrics.timed("redis", redis.get(cache_key))
+    if cached is not None:
+        cache_metrics.inc("redis", "hit")
+        t0 = time.perf_counter()
+        data = cache_codec.decode(cached)
+        decode_time = time.perf_counter() - t0
+        cache_metrics.observe("deserialize", decode_time)
+        decode_ms = decode_time * 1000
+        encoded_size = len(cached)
+        source = "cache"
+    else:
+        # 2. 캐시 미스 -> DB 조회 -> 직렬화 시간 측정 후 저장
+        cache_metrics.inc("redis", "miss")
+        result = await cache_metrics.timed(
+            "db", db.execute(select(UserModel).where(UserModel.id == user_id))
+        )
+        user = result.scalar_one_or_none()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        data = {"id": user.id, "name": user.name, "email": user.email}
+        t0 = time.perf_counter()
+        encoded = cache_codec.encode(data)
+        encode_time = time.perf_counter() - t0
+        cache_metrics.observe("serialize", encode_time)
+        encode_ms = encode_time * 1000
+        encoded_size = len(encoded)
+        await cache_metrics.timed("redis", redis.setex(cache_key, CACHE_TTL, encoded))
+        source = "database"
+
+    elapsed = (time.perf_counter() - start) * 1000
+
+    return CodecCacheResult(
+        source=source,
+        codec=cache_codec.name,
+        user_id=data["id"],
+        name=data["name"],
+        email=data["email"],
+        encoded_size=encoded_size,
+        encode_ms=round(encode_ms, 4) if encode_ms is not None else None,
+        decode_ms=round(decode_ms, 4) if decode_ms is not None else None,
+        elapsed_ms=round(elapsed, 2),
+    )
+
+
 @router.post("/warmup", response_model=CacheWarmupResult)
 async def warmup_cache(
     count: int = Query(100, ge=1, le=1000),
@@ -114,10 +533,58 @@ async def warmup_cache(
     )
 
 
+@router.post("/warmup/pipeline", response_model=CacheBulkWarmupResult)
+async def warmup_cache_pipeline(
+    table: Literal["users", "users_pagination"] = "users",
+    count: int | None = Query(None, ge=1, description="미지정 시 테이블 전체"),
+    chunk_size: int = Query(1000, ge=1, le=10000),
+    codec: CodecName | None = Query(None, description="미지정 시 CACHE_CODEC"),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis_binary),
+):
+    """벌크 캐시 워밍업 (서버 사이드 커서 스트리밍 + 청크당 Redis 파이프라인 1회)
+
+    - DB: yield_per로 chunk_size씩 가져옴 (전체 결과를 메모리에 올리지 않음)
+    - Redis: 청크의 SETEX를 파이프라인으로 묶어 왕복 1회 (N건 -> N/chunk_size회)
+    """
+    start = time.perf_counter()
+    model, prefix = WARMUP_TABLES[table]
+    cache_codec = get_codec(codec)
+
+    query = select(model.id, model.name, model.email).order_by(model.id)
+    if count is not None:
+        query = query.limit(count)
+
+    warmed = 0
+    chunks = 0
+    result = await db.stream(query.execution_options(yield_per=chunk_size))
+    async for rows in result.partitions():
+        pipe = redis.pipeline(transaction=False)
+        for row in rows:
+            user_data = {"id": row.id, "name": row.name, "email": row.email}
+            cache_key = _codec_key(prefix, cache_codec.name, row.id)
+            pipe.setex(cache_key, CACHE_TTL, cache_codec.encode(user_data))
+        await pipe.execute()
+
+        warmed += len(rows)
+        chunks += 1
+
+    elapsed = time.perf_counter() - start
+
+    return CacheBulkWarmupResult(
+        table=table,
+        warmed_count=warmed,
+        chunks=chunks,
+        elapsed_ms=round(elapsed * 1000, 2),
+        keys_per_sec=round(warmed / elapsed, 2) if elapsed > 0 else 0.0,
+    )
+
+
 @router.delete("/flush")
 async def flush_cache(redis: Redis = Depends(get_redis)):
-    """캐시 전체 삭제"""
+    """캐시 전체 삭제 (L1 포함)"""
     await redis.flushdb()
+    local_cache.clear()
     return {"message": "Cache flushed"}
 
 
@@ -126,7 +593,16 @@ async def delete_user_cache(
     user_id: int,
     redis: Redis = Depends(get_redis),
 ):
-    """특정 사용자 캐시 삭제"""
+    """특정 사용자 캐시 삭제 (현재 워커의 L1 포함)
+
+    무효화 버스가 켜져 있으면 다른 워커의 L1에서도 제거 (버스 없으면 L1 TTL까지 남음)
+    """
     cache_key = f"user:{user_id}"
     deleted = await redis.delete(cache_key)
-    return {"deleted": cache_key, "success": deleted > 0}
+    local_cache.delete(cache_key)
+    await invalidation_bus.notify({"entity": "user", "id": user_id, "op": "evict"})
+    return {
+        "deleted": cache_key,
+        "success": deleted > 0,
+        "broadcast": invalidation_bus.enabled,
+    }
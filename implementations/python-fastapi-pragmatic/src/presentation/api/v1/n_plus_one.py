@@ -1,15 +1,50 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
+import asyncio
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import select, text
 from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.database.connection import get_db
+from src.infrastructure.database.dataloader import Loaders
 from src.infrastructure.database.models import AuthorModel, PostModel
+from src.presentation.api.dependencies import get_loaders
 from src.presentation.schemas.n_plus_one import AuthorWithPostsResponse
 
 
 router = APIRouter(prefix="/n-plus-one", tags=["n-plus-one"])
 
+# authors + posts 중첩 JSON을 Postgres에서 완성 (AuthorWithPostsResponse와 같은 모양)
+# ::text -> 드라이버가 JSON 파싱 없이 문자열 그대로 반환
+AUTHORS_WITH_POSTS_JSON_SQL = text("""
+    SELECT COALESCE(json_agg(
+        json_build_object(
+            'id', a.id,
+            'name', a.name,
+            'email', a.email,
+            'bio', a.bio,
+            'created_at', a.created_at,
+            'posts', p.posts
+        ) ORDER BY a.id
+    ), '[]')::text
+    FROM (
+        SELECT * FROM authors ORDER BY id OFFSET :offset LIMIT :limit
+    ) a
+    CROSS JOIN LATERAL (
+        SELECT COALESCE(json_agg(
+            json_build_object(
+                'id', posts.id,
+                'title', posts.title,
+                'content', posts.content,
+                'view_count', posts.view_count,
+                'created_at', posts.created_at
+            ) ORDER BY posts.id
+        ), '[]') AS posts
+        FROM posts
+        WHERE posts.author_id = a.id
+    ) p
+""")
+
 
 @router.get("/lazy", response_model=list[AuthorWithPostsResponse])
 async def get_authors_lazy(
@@ -98,3 +133,49 @@ async def get_authors_subquery(
     result = await db.execute(query)
     authors = result.scalars().all()
     return authors
+
+
+@router.get("/json-agg", response_model=list[AuthorWithPostsResponse])
+async def get_authors_json_agg(
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    DB에서 JSON 조립 (json_agg + json_build_object) - 1번의 쿼리
+    - ORM 객체 생성 / Pydantic 검증·직렬화 없이 JSON 문자열을 그대로 응답
+    - response_model은 문서용 (Response 직접 반환 시 검증 생략)
+    """
+    result = await db.execute(
+        AUTHORS_WITH_POSTS_JSON_SQL, {"limit": limit, "offset": offset}
+    )
+    return Response(content=result.scalar_one(), media_type="application/json")
+
+
+@router.get("/dataloader", response_model=list[AuthorWithPostsResponse])
+async def get_authors_dataloader(
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+    loaders: Loaders = Depends(get_loaders),
+):
+    """
+    DataLoader - lazy와 같은 author별 코드, 2번의 쿼리
+    - 1번: SELECT * FROM authors
+    - 2번: 같은 tick의 load() 호출을 모아 SELECT * FROM posts WHERE author_id = ANY($1)
+    """
+    result = await db.execute(select(AuthorModel).offset(offset).limit(limit))
+    authors = result.scalars().all()
+
+    async def with_posts(author: AuthorModel) -> dict:
+        posts = await loaders.posts_by_author.load(author.id)
+        return {
+            "id": author.id,
+            "name": author.name,
+            "email": author.email,
+            "bio": author.bio,
+            "created_at": author.created_at,
+            "posts": posts,
+        }
+
+    return await asyncio.gather(*(with_posts(author) for author in authors))
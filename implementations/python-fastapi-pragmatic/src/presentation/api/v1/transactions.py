@@ -1,16 +1,57 @@
+import os
 import time
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select, update, text
+from sqlalchemy import delete, func, select, update, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import OperationalError, DBAPIError
 
+from src.infrastructure.cache.inventory import redis_inventory
+from src.infrastructure.database.combining import stock_combiner
 from src.infrastructure.database.connection import get_db
-from src.infrastructure.database.models import ProductModel
-from src.presentation.schemas.transactions import TransactionResult, ProductResponse
+from src.infrastructure.database.models import ProductModel, ProductStockShardModel
+from src.infrastructure.database.profiling import TransactionProfile, transaction_stats
+from src.infrastructure.database.retry import (
+    RetryableConflict,
+    RetryPolicy,
+    is_retryable,
+    transaction_retry,
+)
+from src.presentation.schemas.transactions import (
+    InventoryLoadResult,
+    InventoryReconcileResult,
+    ProductResponse,
+    ShardedStockResponse,
+    TransactionResult,
+)
 
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
+# Sharded 전략: 리셋 시 상품당 shard 수
+STOCK_SHARDS = int(os.getenv("STOCK_SHARDS", "8"))
+# Advisory Lock 키 (namespace, product_id) - 다른 advisory lock 사용처와 충돌 방지
+ADVISORY_LOCK_NAMESPACE = 13
+
+RESET_SHARDS_SQL = text(
+    """
+    INSERT INTO product_stock_shards (product_id, shard, stock)
+    SELECT p.id, s,
+        :stock / :shards + CASE WHEN s < :stock % :shards THEN 1 ELSE 0 END
+    FROM products p, generate_series(0, :shards - 1) AS s
+    """
+)
+
+# 재고가 충분한 shard 중 잠기지 않은 것 1개를 무작위로 (동시 요청 분산)
+PICK_SHARD_SQL = text(
+    """
+    SELECT shard, stock FROM product_stock_shards
+    WHERE product_id = :product_id AND stock >= :quantity
+    ORDER BY random()
+    LIMIT 1
+    FOR UPDATE SKIP LOCKED
+    """
+)
+
 
 @router.get("/products/{product_id}", response_model=ProductResponse)
 async def get_product(product_id: int, db: AsyncSession = Depends(get_db)):
@@ -22,12 +63,35 @@ async def get_product(product_id: int, db: AsyncSession = Depends(get_db)):
     return product
 
 
+@router.get("/products/{product_id}/shards", response_model=ShardedStockResponse)
+async def get_sharded_stock(product_id: int, db: AsyncSession = Depends(get_db)):
+    """Sharded 재고 조회 (재고 = shard 합계)"""
+    result = await db.execute(
+        select(ProductStockShardModel.stock)
+        .where(ProductStockShardModel.product_id == product_id)
+        .order_by(ProductStockShardModel.shard)
+    )
+    shards = list(result.scalars().all())
+    if not shards:
+        raise HTTPException(status_code=404, detail="Product not found")
+    return ShardedStockResponse(product_id=product_id, stock=sum(shards), shards=shards)
+
+
 @router.post("/reset")
-async def reset_stock(db: AsyncSession = Depends(get_db)):
-    """모든 상품 재고를 1000으로 리셋"""
-    await db.execute(update(ProductModel).values(stock=1000, version=0))
+async def reset_stock(
+    stock: int = 1000,
+    shards: int = STOCK_SHARDS,
+    db: AsyncSession = Depends(get_db),
+):
+    """모든 상품 재고를 stock(기본 1000)으로 리셋 (shard 재고도 shards개로 재분배)"""
+    if shards < 1:
+        raise HTTPException(status_code=400, detail="shards must be >= 1")
+
+    await db.execute(update(ProductModel).values(stock=stock, version=0))
+    await db.execute(delete(ProductStockShardModel))
+    await db.execute(RESET_SHARDS_SQL, {"stock": stock, "shards": shards})
     await db.commit()
-    return {"message": "All stocks reset to 1000"}
+    return {"message": f"All stocks reset to {stock}"}
 
 
 # ============================================
@@ -41,6 +105,7 @@ async def decrement_no_lock(
 ):
     """락 없이 재고 차감 (동시성 문제 발생 가능)"""
     start = time.perf_counter()
+    profile = await TransactionProfile.begin("no-lock", db)
 
     # 1. 현재 재고 조회
     result = await db.execute(select(ProductModel).where(ProductModel.id == product_id))
@@ -53,7 +118,7 @@ async def decrement_no_lock(
     # 2. 재고 차감 (락 없음 - Race Condition 가능)
     new_stock = old_stock - quantity
     product.stock = new_stock
-    await db.commit()
+    await profile.commit(db)
 
     elapsed = (time.perf_counter() - start) * 1000
     return TransactionResult(
@@ -63,6 +128,7 @@ async def decrement_no_lock(
         old_stock=old_stock,
         new_stock=new_stock,
         elapsed_ms=elapsed,
+        **profile.finish(),
     )
 
 
@@ -77,6 +143,7 @@ async def decrement_pessimistic(
 ):
     """Pessimistic Lock으로 재고 차감"""
     start = time.perf_counter()
+    profile = await TransactionProfile.begin("pessimistic", db)
 
     # SELECT ... FOR UPDATE (다른 트랜잭션 대기)
     result = await db.execute(
@@ -89,7 +156,7 @@ async def decrement_pessimistic(
     old_stock = product.stock
     new_stock = old_stock - quantity
     product.stock = new_stock
-    await db.commit()
+    await profile.commit(db)
 
     elapsed = (time.perf_counter() - start) * 1000
     return TransactionResult(
@@ -99,6 +166,7 @@ async def decrement_pessimistic(
         old_stock=old_stock,
         new_stock=new_stock,
         elapsed_ms=elapsed,
+        **profile.finish(),
     )
 
 
@@ -112,11 +180,13 @@ async def decrement_optimistic(
     max_retries: int = 5,
     db: AsyncSession = Depends(get_db),
 ):
-    """Optimistic Lock으로 재고 차감 (충돌 시 재시도)"""
+    """Optimistic Lock으로 재고 차감 (충돌 시 rollback -> backoff 후 재시도)"""
     start = time.perf_counter()
-    retries = 0
+    profile = await TransactionProfile.begin("optimistic", db)
+    last_stock = 0
 
-    while retries < max_retries:
+    async def attempt() -> tuple[int, int]:
+        nonlocal last_stock
         # 1. 현재 상태 조회
         result = await db.execute(
             select(ProductModel).where(ProductModel.id == product_id)
@@ -125,7 +195,7 @@ async def decrement_optimistic(
         if not product:
             raise HTTPException(status_code=404, detail="Product not found")
 
-        old_stock = product.stock
+        old_stock = last_stock = product.stock
         old_version = product.version
         new_stock = old_stock - quantity
 
@@ -136,36 +206,45 @@ async def decrement_optimistic(
             .where(ProductModel.version == old_version)  # 버전 일치 확인
             .values(stock=new_stock, version=old_version + 1)
         )
-        await db.commit()
-
-        # 3. 업데이트 성공 여부 확인
-        if update_result.rowcount == 1:  # type: ignore[union-attr]
-            elapsed = (time.perf_counter() - start) * 1000
-            return TransactionResult(
-                success=True,
-                method="optimistic",
-                product_id=product_id,
-                old_stock=old_stock,
-                new_stock=new_stock,
-                retries=retries,
-                elapsed_ms=elapsed,
-            )
 
-        # 4. 충돌 발생 - 재시도
-        retries += 1
-        await db.rollback()
+        # 3. 충돌 -> 커밋하지 않고 재시도 (rollback은 RetryRunner가 대기 전에 호출)
+        if update_result.rowcount != 1:  # type: ignore[union-attr]
+            raise RetryableConflict("Version conflict")
+
+        await profile.commit(db)
+        return old_stock, new_stock
+
+    outcome = await transaction_retry.run(
+        "optimistic", attempt, db.rollback, RetryPolicy(max_attempts=max_retries)
+    )
 
-    # 최대 재시도 초과
     elapsed = (time.perf_counter() - start) * 1000
+    if outcome.value is None:
+        # 재시도 포기
+        return TransactionResult(
+            success=False,
+            method="optimistic",
+            product_id=product_id,
+            old_stock=last_stock,
+            new_stock=last_stock,  # 변경 안됨
+            retries=outcome.retries,
+            wasted_ms=outcome.wasted_ms,
+            elapsed_ms=elapsed,
+            **profile.finish(),
+            error=outcome.error,
+        )
+
+    old_stock, new_stock = outcome.value
     return TransactionResult(
-        success=False,
+        success=True,
         method="optimistic",
         product_id=product_id,
         old_stock=old_stock,
-        new_stock=new_stock,  # 변경 안됨
-        retries=retries,
+        new_stock=new_stock,
+        retries=outcome.retries,
+        wasted_ms=outcome.wasted_ms,
         elapsed_ms=elapsed,
-        error="Max retries exceeded",
+        **profile.finish(),
     )
 
 
@@ -176,44 +255,396 @@ async def decrement_optimistic(
 async def decrement_serializable(
     product_id: int = 1,
     quantity: int = 1,
+    max_retries: int = 5,
     db: AsyncSession = Depends(get_db),
 ):
-    """Serializable 격리 수준으로 재고 차감"""
+    """Serializable 격리 수준으로 재고 차감 (직렬화 실패 40001 시 backoff 후 재시도)"""
     start = time.perf_counter()
+    profile = await TransactionProfile.begin("serializable", db)
+
+    async def attempt() -> tuple[int, int]:
+        try:
+            # Serializable 격리 수준 설정 (트랜잭션 첫 문장)
+            await db.execute(text("SET TRANSACTION ISOLATION LEVEL SERIALIZABLE"))
+            result = await db.execute(
+                select(ProductModel).where(ProductModel.id == product_id)
+            )
+            product = result.scalar_one_or_none()
+            if not product:
+                raise HTTPException(status_code=404, detail="Product not found")
+
+            old_stock = product.stock
+            new_stock = old_stock - quantity
+            product.stock = new_stock
+            await profile.commit(db)
+            return old_stock, new_stock
+        except DBAPIError as e:
+            if is_retryable(e):
+                raise RetryableConflict("Serialization failure") from e
+            raise
 
     try:
-        # Serializable 격리 수준 설정
-        await db.execute(text("SET TRANSACTION ISOLATION LEVEL SERIALIZABLE"))
-        result = await db.execute(
-            select(ProductModel).where(ProductModel.id == product_id)
+        outcome = await transaction_retry.run(
+            "serializable", attempt, db.rollback, RetryPolicy(max_attempts=max_retries)
         )
-        product = result.scalar_one_or_none()
-        if not product:
-            raise HTTPException(status_code=404, detail="Product not found")
+    except (OperationalError, DBAPIError) as e:
+        # 재시도 대상이 아닌 DB 오류
+        await db.rollback()
+        elapsed = (time.perf_counter() - start) * 1000
+        return TransactionResult(
+            success=False,
+            method="serializable",
+            product_id=product_id,
+            old_stock=0,
+            new_stock=0,
+            elapsed_ms=elapsed,
+            **profile.finish(),
+            error=str(e),
+        )
+
+    elapsed = (time.perf_counter() - start) * 1000
+    if outcome.value is None:
+        return TransactionResult(
+            success=False,
+            method="serializable",
+            product_id=product_id,
+            old_stock=0,
+            new_stock=0,
+            retries=outcome.retries,
+            wasted_ms=outcome.wasted_ms,
+            elapsed_ms=elapsed,
+            **profile.finish(),
+            error=outcome.error,
+        )
+
+    old_stock, new_stock = outcome.value
+    return TransactionResult(
+        success=True,
+        method="serializable",
+        product_id=product_id,
+        old_stock=old_stock,
+        new_stock=new_stock,
+        retries=outcome.retries,
+        wasted_ms=outcome.wasted_ms,
+        elapsed_ms=elapsed,
+        **profile.finish(),
+    )
+
+
+@router.get("/stats")
+async def get_transaction_stats():
+    """전략별 시간 분해 히스토그램 (워커별): total / pool_wait / lock_wait / query / commit"""
+    return transaction_stats.to_dict()
+
+
+@router.delete("/stats")
+async def reset_transaction_stats():
+    """시간 분해 통계 초기화"""
+    transaction_stats.reset()
+    return {"message": "Transaction stats reset"}
+
+
+@router.get("/retry/stats")
+async def get_retry_stats():
+    """전략별 재시도 통계 (워커별): 시도/충돌 수, abort_rate, 재시도에 낭비된 시간"""
+    return transaction_retry.to_dict()
+
+
+@router.delete("/retry/stats")
+async def reset_retry_stats():
+    """재시도 통계 초기화"""
+    transaction_retry.reset()
+    return {"message": "Retry stats reset"}
+
+
+# ============================================
+# D-2. Advisory Lock (pg_advisory_xact_lock)
+# ============================================
+@router.post("/decrement/advisory", response_model=TransactionResult)
+async def decrement_advisory(
+    product_id: int = 1,
+    quantity: int = 1,
+    db: AsyncSession = Depends(get_db),
+):
+    """Advisory Lock으로 재고 차감
+
+    행 락 대신 (namespace, product_id) 키의 트랜잭션 범위 advisory lock으로 직렬화
+    -> commit/rollback 시 자동 해제
+    """
+    start = time.perf_counter()
+    profile = await TransactionProfile.begin("advisory", db)
+
+    await db.execute(
+        select(func.pg_advisory_xact_lock(ADVISORY_LOCK_NAMESPACE, product_id))
+    )
+    result = await db.execute(select(ProductModel).where(ProductModel.id == product_id))
+    product = result.scalar_one_or_none()
+    if not product:
+        raise HTTPException(status_code=404, detail="Product not found")
+
+    old_stock = product.stock
+    new_stock = old_stock - quantity
+    product.stock = new_stock
+    await profile.commit(db)
+
+    elapsed = (time.perf_counter() - start) * 1000
+    return TransactionResult(
+        success=True,
+        method="advisory",
+        product_id=product_id,
+        old_stock=old_stock,
+        new_stock=new_stock,
+        elapsed_ms=elapsed,
+        **profile.finish(),
+    )
+
+
+# ============================================
+# D-3. Sharded (재고를 N개 행으로 분산 + FOR UPDATE SKIP LOCKED)
+# ============================================
+@router.post("/decrement/sharded", response_model=TransactionResult)
+async def decrement_sharded(
+    product_id: int = 1,
+    quantity: int = 1,
+    db: AsyncSession = Depends(get_db),
+):
+    """잠기지 않은 shard 1개를 골라 차감 (동시 요청은 서로 다른 shard를 잠금)
+
+    재고가 충분한 shard가 모두 잠겨 있거나 한 shard로 부족하면
+    전체 shard를 잠그고 여러 shard에서 나눠 차감 (old/new_stock = 합계)
+    """
+    start = time.perf_counter()
+    profile = await TransactionProfile.begin("sharded", db)
 
-        old_stock = product.stock
+    # 1. 일반 경로: 무작위 shard 1개 (잠긴 shard는 건너뜀)
+    picked = (
+        await db.execute(PICK_SHARD_SQL, {"product_id": product_id, "quantity": quantity})
+    ).one_or_none()
+    if picked is not None:
+        shard, old_stock = picked
         new_stock = old_stock - quantity
-        product.stock = new_stock
-        await db.commit()
+        await db.execute(
+            update(ProductStockShardModel)
+            .where(
+                ProductStockShardModel.product_id == product_id,
+                ProductStockShardModel.shard == shard,
+            )
+            .values(stock=new_stock)
+        )
+        await profile.commit(db)
 
         elapsed = (time.perf_counter() - start) * 1000
         return TransactionResult(
             success=True,
-            method="serializable",
+            method="sharded",
             product_id=product_id,
             old_stock=old_stock,
             new_stock=new_stock,
+            shard=shard,
             elapsed_ms=elapsed,
+            **profile.finish(),
         )
-    except (OperationalError, DBAPIError) as e:
+
+    # 2. 대체 경로: 전체 shard를 순서대로 잠그고 합계 기준으로 차감
+    result = await db.execute(
+        select(ProductStockShardModel)
+        .where(ProductStockShardModel.product_id == product_id)
+        .order_by(ProductStockShardModel.shard)
+        .with_for_update()
+    )
+    shards = result.scalars().all()
+    if not shards:
+        raise HTTPException(status_code=404, detail="Product not found")
+
+    old_stock = sum(s.stock for s in shards)
+    if old_stock < quantity:
         await db.rollback()
         elapsed = (time.perf_counter() - start) * 1000
         return TransactionResult(
             success=False,
-            method="serializable",
+            method="sharded",
             product_id=product_id,
-            old_stock=0,
-            new_stock=0,
+            old_stock=old_stock,
+            new_stock=old_stock,  # 변경 안됨
             elapsed_ms=elapsed,
-            error=str(e),
+            **profile.finish(),
+            error="Insufficient stock",
+        )
+
+    remaining = quantity
+    for s in shards:
+        take = min(s.stock, remaining)
+        s.stock -= take
+        remaining -= take
+        if remaining == 0:
+            break
+    await profile.commit(db)
+
+    elapsed = (time.perf_counter() - start) * 1000
+    return TransactionResult(
+        success=True,
+        method="sharded",
+        product_id=product_id,
+        old_stock=old_stock,
+        new_stock=old_stock - quantity,
+        elapsed_ms=elapsed,
+        **profile.finish(),
+    )
+
+
+# ============================================
+# E. Atomic UPDATE (조건부 UPDATE ... RETURNING 1문장)
+# ============================================
+@router.post("/decrement/atomic", response_model=TransactionResult)
+async def decrement_atomic(
+    product_id: int = 1,
+    quantity: int = 1,
+    db: AsyncSession = Depends(get_db),
+):
+    """단일 조건부 UPDATE로 재고 차감 (조회 없음 -> 락 보유 시간 = 문장 1개)
+
+    WHERE stock >= quantity로 재고가 음수가 되지 않음을 DB가 보장
+    """
+    start = time.perf_counter()
+    profile = await TransactionProfile.begin("atomic", db)
+
+    result = await db.execute(
+        update(ProductModel)
+        .where(ProductModel.id == product_id, ProductModel.stock >= quantity)
+        .values(stock=ProductModel.stock - quantity)
+        .returning(ProductModel.stock)
+        .execution_options(synchronize_session=False)
+    )
+    new_stock = result.scalar_one_or_none()
+    await profile.commit(db)
+
+    if new_stock is None:
+        # 실패 경로에서만 추가 조회 (상품 없음 vs 재고 부족 구분)
+        current = await db.scalar(
+            select(ProductModel.stock).where(ProductModel.id == product_id)
+        )
+        if current is None:
+            raise HTTPException(status_code=404, detail="Product not found")
+
+        elapsed = (time.perf_counter() - start) * 1000
+        return TransactionResult(
+            success=False,
+            method="atomic",
+            product_id=product_id,
+            old_stock=current,
+            new_stock=current,  # 변경 안됨
+            elapsed_ms=elapsed,
+            **profile.finish(),
+            error="Insufficient stock",
+        )
+
+    elapsed = (time.perf_counter() - start) * 1000
+    return TransactionResult(
+        success=True,
+        method="atomic",
+        product_id=product_id,
+        old_stock=new_stock + quantity,
+        new_stock=new_stock,
+        elapsed_ms=elapsed,
+        **profile.finish(),
+    )
+
+
+# ============================================
+# F. Combined (동시 차감 요청 병합 -> UPDATE 1회)
+# ============================================
+@router.post("/decrement/combined", response_model=TransactionResult)
+async def decrement_combined(
+    product_id: int = 1,
+    quantity: int = 1,
+):
+    """같은 상품의 동시 차감을 짧은 window 동안 모아 합계로 조건부 UPDATE 1회
+
+    각 호출자는 도착 순서 기준의 자기 몫 old/new 재고를 받음
+    시간 분해는 배치 트랜잭션 기준 (elapsed_ms와의 차이 = 병합 window + 이전 배치 대기)
+    """
+    start = time.perf_counter()
+
+    outcome = await stock_combiner.decrement(product_id, quantity)
+    if outcome is None:
+        raise HTTPException(status_code=404, detail="Product not found")
+
+    elapsed = (time.perf_counter() - start) * 1000
+    return TransactionResult(
+        success=outcome.success,
+        method="combined",
+        product_id=product_id,
+        old_stock=outcome.old_stock,
+        new_stock=outcome.new_stock,
+        batch_size=outcome.batch_size,
+        elapsed_ms=elapsed,
+        error=None if outcome.success else "Insufficient stock",
+        **outcome.timings,
+    )
+
+
+# ============================================
+# G. Redis 재고 (Lua 원자 차감 + 스트림 -> Postgres 비동기 반영)
+# ============================================
+def _require_redis_inventory() -> None:
+    if not redis_inventory.enabled:
+        raise HTTPException(
+            status_code=503, detail="Redis inventory disabled (REDIS_INVENTORY=true)"
+        )
+
+
+@router.post("/redis/load", response_model=InventoryLoadResult)
+async def load_redis_inventory():
+    """Postgres 재고를 Redis로 복사 (미반영 차감은 폐기 -> /reset 이후 호출)"""
+    _require_redis_inventory()
+    start = time.perf_counter()
+
+    products = await redis_inventory.load()
+
+    elapsed = (time.perf_counter() - start) * 1000
+    return InventoryLoadResult(products=products, elapsed_ms=elapsed)
+
+
+@router.post("/decrement/redis", response_model=TransactionResult)
+async def decrement_redis(
+    product_id: int = 1,
+    quantity: int = 1,
+):
+    """Redis Lua 스크립트로 재고 차감 (요청 경로에 Postgres 없음)
+
+    성공한 차감은 스트림에 기록 -> 백그라운드 consumer가 모아서 Postgres에 반영
+    응답 시점에는 Postgres 미반영 (Redis 유실 시 함께 유실)
+    """
+    _require_redis_inventory()
+    start = time.perf_counter()
+
+    status = await redis_inventory.decrement(product_id, quantity)
+    if not status.loaded:
+        raise HTTPException(
+            status_code=404, detail="Product not loaded (POST /redis/load)"
         )
+
+    elapsed = (time.perf_counter() - start) * 1000
+    return TransactionResult(
+        success=status.success,
+        method="redis",
+        product_id=product_id,
+        old_stock=status.stock + quantity if status.success else status.stock,
+        new_stock=status.stock,
+        elapsed_ms=elapsed,
+        error=None if status.success else "Insufficient stock",
+    )
+
+
+@router.get("/redis/reconcile", response_model=InventoryReconcileResult)
+async def reconcile_redis_inventory():
+    """Redis 재고 + 미반영 합계 == Postgres 재고 확인 (drift != 0 이면 불일치)"""
+    _require_redis_inventory()
+    start = time.perf_counter()
+
+    report = await redis_inventory.reconcile()
+
+    elapsed = (time.perf_counter() - start) * 1000
+    return InventoryReconcileResult(
+        **report, applied=redis_inventory.applied, elapsed_ms=elapsed
+    )
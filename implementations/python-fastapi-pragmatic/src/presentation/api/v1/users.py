@@ -2,7 +2,11 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.infrastructure.cache.bloom import user_bloom
+from src.infrastructure.cache.connection import get_redis
+from src.infrastructure.cache.invalidation import invalidation_bus
 from src.infrastructure.database.connection import get_db
+from src.infrastructure.database.group_commit import GROUP_COMMIT, user_group_commit
 from src.infrastructure.database.models import UserModel, UserPaginationModel
 from src.presentation.schemas.user import (
     UserCreate,
@@ -15,6 +19,25 @@ from src.presentation.schemas.user import (
 router = APIRouter(prefix="/users", tags=["users"])
 
 
+async def _publish_created(db: AsyncSession, rows: list) -> None:
+    """그룹 커밋 flush 훅 - 배치 전체의 생성 이벤트를 문장 1회로 발행"""
+    await invalidation_bus.publish_many(
+        db, [{"entity": "user", "id": row.id, "op": "create"} for row in rows]
+    )
+
+
+user_group_commit.on_flush(_publish_created)
+
+
+async def _clear_negative_cache(user_id: int) -> None:
+    """음성 캐시(user:missing:{id}) 즉시 제거 - 버스 설정과 무관
+
+    커밋 후에 실행 (커밋 전에 지우면 그 사이 조회가 다시 음성 캐시를 저장할 수 있음)
+    """
+    redis = await get_redis()
+    await redis.delete(f"user:missing:{user_id}")
+
+
 @router.get("", response_model=list[UserResponse])
 async def get_users(db: AsyncSession = Depends(get_db)):
     """Get all users - DB read performance"""
@@ -26,9 +49,24 @@ async def get_users(db: AsyncSession = Depends(get_db)):
 @router.post("", response_model=UserResponse, status_code=201)
 async def create_user(user: UserCreate, db: AsyncSession = Depends(get_db)):
     """Create user - DB write performance"""
+    if GROUP_COMMIT:
+        # 동시 요청과 함께 multi-row INSERT + commit 1회로 처리
+        row = await user_group_commit.submit(user.model_dump())
+        await _clear_negative_cache(row.id)
+        user_bloom.add(row.id)
+        return UserResponse.model_validate(row)
+
     model = UserModel(**user.model_dump())
     db.add(model)
+    await db.flush()  # id 할당 (무효화 이벤트에 필요)
+
+    # 다른 워커에 생성 이벤트 전달 (L1 무효화 + Bloom 필터에 추가)
+    await invalidation_bus.publish(
+        db, {"entity": "user", "id": model.id, "op": "create"}
+    )
     await db.commit()
+    await _clear_negative_cache(model.id)
+    user_bloom.add(model.id)
     await db.refresh(model)
     return UserResponse.model_validate(model)
 
@@ -46,6 +84,10 @@ async def update_user(
     for field, value in update_data.items():
         setattr(model, field, value)
 
+    # 캐시 무효화 이벤트 (커밋 시 모든 워커에 전달)
+    await invalidation_bus.publish(
+        db, {"entity": "user", "id": user_id, "op": "update"}
+    )
     await db.commit()
     await db.refresh(model)
     return UserResponse.model_validate(model)
@@ -59,7 +101,17 @@ async def delete_user(user_id: int, db: AsyncSession = Depends(get_db)):
         raise HTTPException(status_code=404, detail="User not found")
 
     await db.delete(model)
+    await invalidation_bus.publish(
+        db, {"entity": "user", "id": user_id, "op": "delete"}
+    )
     await db.commit()
+    user_bloom.remove(user_id)
+
+
+@router.get("/group-commit/stats")
+async def get_group_commit_stats():
+    """그룹 커밋 카운터 (현재 워커 기준, GROUP_COMMIT=true일 때만 증가)"""
+    return {"enabled": GROUP_COMMIT, **user_group_commit.stats.to_dict()}
 
 
 # OFFSET 페이지네이션 (09 시나리오용 - users_pagination 테이블 사용)
@@ -131,6 +183,10 @@ async def get_users_cursor(
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(user_id: int, db: AsyncSession = Depends(get_db)):
     """Get user by ID - DB read performance"""
+    # Bloom 필터 (USER_BLOOM_FILTER=true): 확실히 없는 ID는 DB 조회 없이 404
+    if not user_bloom.might_exist(user_id):
+        raise HTTPException(status_code=404, detail="User not found")
+
     model = await db.get(UserModel, user_id)
     if model is None:
         raise HTTPException(status_code=404, detail="User not found")
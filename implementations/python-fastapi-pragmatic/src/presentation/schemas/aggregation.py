@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel
 
 
@@ -16,6 +18,10 @@ class CountComparisonResponse(BaseModel):
     count_star: int  # COUNT(*)
     count_id: int  # COUNT(id)
     count_distinct_status: int  # COUNT(DISTINCT status)
+    accuracy: str = "exact"  # exact | approx
+    # approx: 필드별 ± 오차 (약 95%), exact는 None (오차 0)
+    error_bounds: dict[str, int] | None = None
+    as_of_ms: float | None = None  # approx: 근사값 갱신 후 경과 시간
 
 
 # ============================================
@@ -28,6 +34,7 @@ class CountryStatsResponse(BaseModel):
     user_count: int
     total_logins: int
     avg_logins: float
+    error_bound: float | None = None  # approx(표본): user_count ± 오차 (약 95%)
 
 
 class StatusStatsResponse(BaseModel):
@@ -48,3 +55,73 @@ class AuthorStatsResponse(BaseModel):
     post_count: int
     total_views: int
     avg_views: float
+
+
+# ============================================
+# D. 롤업 집계 결과 (delta 트리거 + 백그라운드 반영)
+# ============================================
+class RollupStatus(BaseModel):
+    """롤업 최신성"""
+
+    pending_deltas: int  # 아직 롤업에 반영되지 않은 변경 수
+    oldest_pending_at: datetime | None
+    staleness_ms: float  # 가장 오래된 미반영 변경의 나이 (0 = 최신)
+    last_applied_at: datetime | None  # 이 워커의 applier 마지막 실행 시각
+    applier_running: bool  # False: ROLLUP_APPLIER 꺼짐 -> 롤업은 마지막 rebuild 시점 값
+
+
+class CountryStatsRollupResponse(BaseModel):
+    """국가별 통계 (롤업)"""
+
+    items: list[CountryStatsResponse]
+    rollup: RollupStatus
+
+
+class AuthorStatsRollupResponse(BaseModel):
+    """작가별 게시글 통계 (롤업)"""
+
+    items: list[AuthorStatsResponse]
+    rollup: RollupStatus
+
+
+class RollupRebuildResponse(BaseModel):
+    """롤업 전체 재계산 결과"""
+
+    country_rows: int
+    author_rows: int
+    elapsed_ms: float
+
+
+class AggregationWriteResponse(BaseModel):
+    """집계 대상 테이블 쓰기 결과 (롤업 delta 발생, 행 수는 변하지 않음)"""
+
+    operation: str
+    id: int
+    value: int  # 변경 후 login_count / view_count
+
+
+# ============================================
+# E. 동시 실행 집계 (서브쿼리별 시간)
+# ============================================
+class QueryTimings(BaseModel):
+    """서브쿼리 실행 시간"""
+
+    mode: str  # concurrent | serial
+    wall_ms: float  # 전체 소요 시간
+    sum_ms: float  # 서브쿼리 시간 합계 (wall_ms보다 크면 겹쳐서 실행된 것)
+    subqueries: dict[str, float]  # 이름 -> ms (concurrent는 연결 대기 포함)
+
+
+class CountComparisonTimedResponse(CountComparisonResponse):
+    """COUNT 비교 + 실행 시간"""
+
+    timings: QueryTimings
+
+
+class DashboardResponse(BaseModel):
+    """대시보드 (COUNT + 국가별 + 작가별 통계)"""
+
+    counts: CountComparisonResponse
+    country_stats: list[CountryStatsResponse]
+    author_stats: list[AuthorStatsResponse]
+    timings: QueryTimings
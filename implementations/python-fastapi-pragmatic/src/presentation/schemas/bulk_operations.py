@@ -22,3 +22,23 @@ class BulkOperationResult(BaseModel):
     operation: str
     count: int
     elapsed_ms: float
+    # batch_size 지정 시에만 채움 (N행마다 commit)
+    batch_size: int | None = None
+    commits: int | None = None
+    chunk_ms: list[float] | None = None  # 청크별 소요 시간 (commit 포함)
+
+
+class BulkIngestResult(BaseModel):
+    """스트리밍 ingest 결과"""
+
+    operation: str
+    format: str  # "ndjson" | "csv"
+    count: int
+    chunks: int  # COPY 호출 횟수
+    bytes_received: int
+    elapsed_ms: float
+    rows_per_sec: float
+    # 이 요청 동안의 RSS (시작 + COPY 청크마다 샘플링, /proc 없는 환경은 None)
+    rss_start_mb: float | None
+    rss_peak_mb: float | None
+    rss_growth_mb: float | None  # peak - start: 본문 크기와 무관하게 작으면 버퍼링 없음
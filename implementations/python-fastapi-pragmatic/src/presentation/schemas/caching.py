@@ -4,18 +4,38 @@ from pydantic import BaseModel
 class CacheResult(BaseModel):
     """캐시 조회 결과"""
 
+    # "cache" | "database" | "l1" | "l2" | "near" | "coalesced" | "stale"
+    source: str
+    user_id: int
+    name: str
+    email: str
+    elapsed_ms: float
+
+
+class CodecCacheResult(BaseModel):
+    """codec별 캐시 조회 결과"""
+
     source: str  # "cache" | "database"
+    codec: str
     user_id: int
     name: str
     email: str
+    encoded_size: int  # 직렬화된 값 크기 (bytes)
+    encode_ms: float | None = None  # 미스 시 직렬화 시간
+    decode_ms: float | None = None  # 히트 시 역직렬화 시간
     elapsed_ms: float
 
 
 class CacheStats(BaseModel):
-    """캐시 통계"""
+    """캐시 통계 (Redis 전체 + 현재 워커의 캐시 계층 메트릭)"""
 
     total_keys: int
     memory_used: str
+    events: dict[str, dict[str, int]]  # tier -> event -> 횟수
+    hit_ratio: dict[str, float]  # tier -> hit / (hit + miss + stale)
+    latency: dict[str, dict[str, float]]  # phase -> count/avg/p50/p95/p99 (ms)
+    local: dict[str, dict[str, int]]  # 프로세스 내 캐시 -> 항목 수/메모리/eviction
+    swr: dict[str, int]
 
 
 class CacheWarmupResult(BaseModel):
@@ -23,3 +43,13 @@ class CacheWarmupResult(BaseModel):
 
     warmed_count: int
     elapsed_ms: float
+
+
+class CacheBulkWarmupResult(BaseModel):
+    """벌크(파이프라인) 워밍업 결과"""
+
+    table: str
+    warmed_count: int
+    chunks: int  # Redis 파이프라인 왕복 횟수
+    elapsed_ms: float
+    keys_per_sec: float
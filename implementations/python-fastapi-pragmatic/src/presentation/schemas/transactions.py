@@ -12,6 +12,14 @@ class ProductResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class ShardedStockResponse(BaseModel):
+    """Sharded 재고 (stock = shard 합계)"""
+
+    product_id: int
+    stock: int
+    shards: list[int]  # shard 순서대로의 재고
+
+
 class StockUpdateRequest(BaseModel):
     """재고 차감 요청"""
 
@@ -27,6 +35,41 @@ class TransactionResult(BaseModel):
     product_id: int
     old_stock: int
     new_stock: int
-    retries: int = 0  # Optimistic Lock 재시도 횟수
+    retries: int = 0  # Optimistic / Serializable 재시도 횟수
+    wasted_ms: float | None = None  # 실패한 시도 + backoff 대기 시간
+    batch_size: int | None = None  # 병합(combined) 모드: 함께 처리된 요청 수
+    shard: int | None = None  # sharded 모드: 차감한 shard (None = 여러 shard 합산)
     elapsed_ms: float
+    # 시간 분해 (DB 세션을 쓰는 전략만): lock_wait는 query에 포함, 샘플링 꺼지면 None
+    pool_wait_ms: float | None = None
+    lock_wait_ms: float | None = None
+    query_ms: float | None = None
+    commit_ms: float | None = None
     error: str | None = None
+
+
+class InventoryLoadResult(BaseModel):
+    """Redis 재고 로드 결과"""
+
+    products: int
+    elapsed_ms: float
+
+
+class InventoryDrift(BaseModel):
+    """상품별 Redis / Postgres 재고 비교"""
+
+    product_id: int
+    redis_stock: int
+    pending: int  # Postgres 미반영 차감 합계
+    postgres_stock: int
+    drift: int  # postgres_stock - pending - redis_stock (0이어야 정상)
+
+
+class InventoryReconcileResult(BaseModel):
+    """Redis 재고 정합성 검사 결과"""
+
+    in_sync: bool
+    products: list[InventoryDrift]
+    stream_length: int  # 아직 반영되지 않은 스트림 메시지 수
+    applied: int  # 이 워커가 반영한 메시지 수
+    elapsed_ms: float
@@ -0,0 +1,129 @@
+"""TrackingNearCache 통합 테스트 (실제 redis-server 필요, 없으면 skip)
+
+TEST_REDIS_URL (기본: REDIS_URL 또는 redis://localhost:6379/0)
+TEST_REDIS_FLUSH_DB (기본: 15) - FLUSHDB 테스트가 비우는 DB 번호
+"""
+
+import asyncio
+import os
+import uuid
+from urllib.parse import urlsplit
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.infrastructure.cache.tracking import TrackingNearCache
+
+REDIS_URL = os.getenv(
+    "TEST_REDIS_URL", os.getenv("REDIS_URL", "redis://localhost:6379/0")
+)
+# URL에 DB 번호가 있으면 from_url(db=...)는 무시됨 -> URL 경로를 바꿔서 지정
+FLUSH_DB_URL = (
+    urlsplit(REDIS_URL)
+    ._replace(path=f"/{os.getenv('TEST_REDIS_FLUSH_DB', '15')}")
+    .geturl()
+)
+WAIT_TIMEOUT = 2  # 초, 무효화 메시지 도착 대기
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _wait_until(condition) -> None:
+    async with asyncio.timeout(WAIT_TIMEOUT):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+@pytest_asyncio.fixture
+async def redis():
+    client = Redis.from_url(REDIS_URL, decode_responses=True)
+    try:
+        await client.ping()
+    except (RedisError, OSError):
+        await client.aclose()
+        pytest.skip(f"redis-server not reachable at {REDIS_URL}")
+    yield client
+    await client.aclose()
+
+
+@pytest_asyncio.fixture
+async def prefix(redis):
+    # 테스트마다 고유 prefix -> 다른 테스트/클라이언트의 키 변경과 섞이지 않음
+    prefix = f"test:{uuid.uuid4().hex}:"
+    yield prefix
+    keys = await redis.keys(f"{prefix}*")
+    if keys:
+        await redis.delete(*keys)
+
+
+@pytest_asyncio.fixture
+async def near(redis, prefix):
+    cache = TrackingNearCache(REDIS_URL, prefixes=[prefix])
+    await cache.start()
+    await _wait_until(lambda: cache.enabled)
+    yield cache
+    await cache.stop()
+
+
+async def test_write_on_other_connection_evicts_entry(redis, prefix, near):
+    key = f"{prefix}1"
+    await redis.set(key, "v1")
+    near.set(key, "v1", near.epoch)
+    assert near.get(key) == "v1"
+
+    # SET (다른 연결) -> 무효화 메시지 -> 로컬 제거
+    epoch = near.epoch
+    await redis.set(key, "v2")
+    await _wait_until(lambda: near.epoch > epoch)
+    assert near.get(key) is None
+
+    # DEL도 동일
+    near.set(key, "v2", near.epoch)
+    epoch = near.epoch
+    await redis.delete(key)
+    await _wait_until(lambda: near.epoch > epoch)
+    assert near.get(key) is None
+
+
+async def test_flushdb_clears_all_entries(redis, prefix, near):
+    # FLUSHDB -> __redis__:invalidate에 null 메시지 (키 목록 없음) -> 전체 제거
+    # 별도 DB(TEST_REDIS_FLUSH_DB)에서 실행 -> 메시지는 DB와 무관하게 전달됨
+    keys = [f"{prefix}{i}" for i in range(3)]
+    for key in keys:
+        near.set(key, key, near.epoch)
+    other = f"{prefix}not-in-redis"
+    near.set(other, "local only", near.epoch)
+
+    flush_db = Redis.from_url(FLUSH_DB_URL, decode_responses=True)
+    try:
+        epoch = near.epoch
+        await flush_db.flushdb()
+        await _wait_until(lambda: near.epoch > epoch)
+    finally:
+        await flush_db.aclose()
+
+    for key in [*keys, other]:
+        assert near.get(key) is None
+
+
+async def test_invalidation_during_fill_is_not_overwritten(redis, prefix, near):
+    key = f"{prefix}race"
+    await redis.set(key, "old")
+
+    # 채우기 시작: epoch 기록 후 Redis 조회
+    epoch = near.epoch
+    stale = await redis.get(key)
+
+    # 조회 결과를 저장하기 전에 다른 연결에서 변경 -> 무효화 도착
+    await redis.set(key, "new")
+    await _wait_until(lambda: near.epoch > epoch)
+
+    # 이전 epoch로 저장 시도 -> 무시 (오래된 값이 로컬에 남지 않음)
+    near.set(key, stale, epoch)
+    assert near.get(key) is None
+
+    # 새 epoch로 다시 채우면 정상 저장
+    near.set(key, await redis.get(key), near.epoch)
+    assert near.get(key) == "new"
@@ -0,0 +1,97 @@
+"""Counting Bloom 필터 / UserBloomGuard 단위 테스트 (DB 불필요)"""
+
+import pytest
+
+from src.infrastructure.cache.bloom import CountingBloomFilter, UserBloomGuard
+from src.infrastructure.cache.invalidation import WORKER_ID
+
+CAPACITY = 10000
+ERROR_RATE = 0.01
+
+
+@pytest.fixture
+def bloom():
+    return CountingBloomFilter(CAPACITY, ERROR_RATE)
+
+
+def test_added_keys_are_always_found(bloom):
+    for key in range(CAPACITY):
+        bloom.add(key)
+    # "없음" 판정은 확실 -> 추가한 키는 절대 누락되지 않음
+    assert all(key in bloom for key in range(CAPACITY))
+
+
+def test_false_positive_rate_near_target(bloom):
+    for key in range(CAPACITY):
+        bloom.add(key)
+    probes = range(CAPACITY, CAPACITY * 11)
+    false_positives = sum(key in bloom for key in probes)
+    assert false_positives / len(probes) < ERROR_RATE * 2
+
+
+def test_remove(bloom):
+    bloom.add(1)
+    bloom.add(2)
+    bloom.remove(1)
+    assert 1 not in bloom
+    assert 2 in bloom
+
+
+def test_duplicate_add_needs_matching_removes(bloom):
+    bloom.add(7)
+    bloom.add(7)
+    bloom.remove(7)
+    assert 7 in bloom
+    bloom.remove(7)
+    assert 7 not in bloom
+
+
+def test_remove_of_absent_key_is_ignored(bloom):
+    bloom.add(1)
+    for key in range(1000, 2000):
+        bloom.remove(key)
+    assert 1 in bloom
+
+
+def test_saturated_counters_stay_set():
+    bloom = CountingBloomFilter(1, 0.5)
+    for _ in range(300):
+        bloom.add(1)
+    for _ in range(300):
+        bloom.remove(1)
+    # 255에서 고정 -> 삭제해도 "있을 수 있음" (오탐 방향으로만)
+    assert 1 in bloom
+
+
+def test_guard_without_filter_allows_everything():
+    guard = UserBloomGuard(enabled=False)
+    assert not guard.enabled
+    assert guard.might_exist(123)
+
+    # 켜져 있어도 구축 전에는 DB 조회로 진행
+    guard.enabled = True
+    assert not guard.ready
+    assert guard.might_exist(123)
+
+
+@pytest.mark.asyncio
+async def test_guard_applies_other_workers_events():
+    guard = UserBloomGuard(enabled=False)
+    guard.enabled = True
+    guard._filter = CountingBloomFilter(CAPACITY, ERROR_RATE)
+
+    await guard.on_invalidation(
+        {"entity": "user", "id": 5, "op": "create", "origin": "other"}
+    )
+    assert guard.might_exist(5)
+
+    # 자기 워커 이벤트는 요청 처리 중 이미 반영 -> 무시
+    await guard.on_invalidation(
+        {"entity": "user", "id": 5, "op": "delete", "origin": WORKER_ID}
+    )
+    assert guard.might_exist(5)
+
+    await guard.on_invalidation(
+        {"entity": "user", "id": 5, "op": "delete", "origin": "other"}
+    )
+    assert not guard.might_exist(5)
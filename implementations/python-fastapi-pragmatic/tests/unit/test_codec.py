@@ -0,0 +1,42 @@
+"""캐시 codec 단위 테스트 (Redis 불필요)"""
+
+import json
+
+import pytest
+
+from src.infrastructure.cache.codec import CACHE_CODEC, CODECS, get_codec
+
+USER = {"id": 42, "name": "홍길동", "email": "hong@example.com"}
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+def test_round_trip(name):
+    codec = CODECS[name]
+    data = codec.encode(USER)
+    assert isinstance(data, bytes)
+    assert codec.decode(data) == USER
+
+
+def test_json_codec_matches_existing_cache_bytes():
+    # 기존 user:{id} 캐시 값(json.dumps)과 호환
+    assert CODECS["json"].encode(USER) == json.dumps(USER).encode()
+
+
+def test_struct_codec_stores_values_only():
+    data = CODECS["struct"].encode(USER)
+    # 헤더(4 + 2 + 2) + UTF-8 name/email, 필드명 없음
+    assert len(data) == 8 + len(USER["name"].encode()) + len(USER["email"].encode())
+    assert b"email" not in data
+
+
+def test_struct_codec_empty_strings():
+    value = {"id": 0, "name": "", "email": ""}
+    codec = CODECS["struct"]
+    assert codec.decode(codec.encode(value)) == value
+
+
+def test_get_codec():
+    assert get_codec("msgpack") is CODECS["msgpack"]
+    assert get_codec() is CODECS[CACHE_CODEC]
+    with pytest.raises(KeyError):
+        get_codec("xml")
@@ -0,0 +1,100 @@
+"""DecrementCombiner 병합/분배 단위 테스트 (DB 대신 가짜 _apply)"""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.database.combining import DecrementCombiner
+
+pytestmark = pytest.mark.asyncio
+
+TIMINGS = {"pool_wait_ms": None, "lock_wait_ms": None, "query_ms": None}
+
+
+class FakeCombiner(DecrementCombiner):
+    """상품별 메모리 재고로 _apply 대체 - 배치(수량 목록)를 기록"""
+
+    def __init__(self, stock: dict[int, int], **kwargs):
+        super().__init__(**kwargs)
+        self.stock = stock
+        self.batches: list[list[int]] = []
+        self.fail: Exception | None = None
+
+    async def _apply(self, product_id, batch):
+        quantities = [quantity for quantity, _ in batch]
+        self.batches.append(quantities)
+        if self.fail is not None:
+            raise self.fail
+        if product_id not in self.stock:
+            return [None] * len(batch)
+
+        old = self.stock[product_id]
+        accepted = []
+        remaining = old
+        for quantity in quantities:
+            ok = quantity <= remaining
+            accepted.append(ok)
+            if ok:
+                remaining -= quantity
+        self.stock[product_id] = remaining
+        return self._slices(old, quantities, accepted, TIMINGS)
+
+
+async def test_concurrent_requests_share_one_batch():
+    combiner = FakeCombiner({1: 100}, window_ms=5)
+    outcomes = await asyncio.gather(*(combiner.decrement(1, 1) for _ in range(10)))
+
+    assert combiner.batches == [[1] * 10]
+    assert all(o.success and o.batch_size == 10 for o in outcomes)
+    # 도착 순서대로 old/new 구간이 이어짐
+    assert [(o.old_stock, o.new_stock) for o in outcomes] == [
+        (100 - i, 99 - i) for i in range(10)
+    ]
+    assert combiner.stock[1] == 90
+
+
+async def test_insufficient_stock_fails_individual_requests():
+    combiner = FakeCombiner({1: 5}, window_ms=5)
+    outcomes = await asyncio.gather(
+        combiner.decrement(1, 3), combiner.decrement(1, 3), combiner.decrement(1, 2)
+    )
+
+    assert [o.success for o in outcomes] == [True, False, True]
+    assert [(o.old_stock, o.new_stock) for o in outcomes] == [(5, 2), (2, 2), (2, 0)]
+    assert combiner.stock[1] == 0
+
+
+async def test_max_batch_splits_requests():
+    combiner = FakeCombiner({1: 100}, window_ms=5, max_batch=4)
+    outcomes = await asyncio.gather(*(combiner.decrement(1, 1) for _ in range(10)))
+
+    assert [len(batch) for batch in combiner.batches] == [4, 4, 2]
+    assert [o.batch_size for o in outcomes] == [4] * 4 + [4] * 4 + [2] * 2
+    assert combiner.stock[1] == 90
+
+
+async def test_products_are_batched_separately():
+    combiner = FakeCombiner({1: 10, 2: 10}, window_ms=5)
+    a, b = await asyncio.gather(combiner.decrement(1, 2), combiner.decrement(2, 3))
+
+    assert sorted(combiner.batches) == [[2], [3]]
+    assert (a.new_stock, b.new_stock) == (8, 7)
+
+
+async def test_missing_product_returns_none():
+    combiner = FakeCombiner({}, window_ms=1)
+    assert await combiner.decrement(9, 1) is None
+
+
+async def test_batch_error_reaches_every_caller_and_loop_recovers():
+    combiner = FakeCombiner({1: 10}, window_ms=5)
+    combiner.fail = RuntimeError("db down")
+    results = await asyncio.gather(
+        combiner.decrement(1, 1), combiner.decrement(1, 1), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    # 실패 후에도 다음 요청은 새 처리 루프에서 정상 처리
+    combiner.fail = None
+    outcome = await combiner.decrement(1, 1)
+    assert outcome.success and outcome.new_stock == 9
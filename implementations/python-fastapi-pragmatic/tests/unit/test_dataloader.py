@@ -0,0 +1,104 @@
+"""DataLoader 배치/memoize 단위 테스트 (DB 대신 가짜 배치 함수)"""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.database.dataloader import DataLoader
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeBatch:
+    """호출된 키 목록을 기록, 짝수 키만 존재"""
+
+    def __init__(self):
+        self.calls: list[list[int]] = []
+        self.fail: Exception | None = None
+
+    async def __call__(self, keys: list[int]) -> dict[int, str]:
+        self.calls.append(list(keys))
+        await asyncio.sleep(0)
+        if self.fail is not None:
+            raise self.fail
+        return {key: f"v{key}" for key in keys if key % 2 == 0}
+
+
+async def test_loads_in_same_tick_share_one_batch():
+    batch = FakeBatch()
+    loader = DataLoader(batch)
+    values = await asyncio.gather(*(loader.load(key) for key in (2, 4, 6)))
+
+    assert values == ["v2", "v4", "v6"]
+    assert batch.calls == [[2, 4, 6]]
+    assert loader.batches == 1
+
+
+async def test_duplicate_keys_are_deduplicated_and_memoized():
+    batch = FakeBatch()
+    loader = DataLoader(batch)
+    assert await loader.load_many([2, 2, 4]) == ["v2", "v2", "v4"]
+    assert batch.calls == [[2, 4]]
+
+    # 같은 요청 안에서 다시 조회 -> 배치 함수 호출 없음
+    assert await loader.load(2) == "v2"
+    assert loader.batches == 1
+
+
+async def test_missing_keys_get_default():
+    loader = DataLoader(FakeBatch())
+    assert await loader.load_many([1, 2]) == [None, "v2"]
+
+    loader = DataLoader(FakeBatch(), default=list)
+    first, second = await loader.load_many([1, 3])
+    assert first == [] and second == []
+    assert first is not second  # 키마다 새 기본값
+
+
+async def test_max_batch_splits_keys():
+    batch = FakeBatch()
+    loader = DataLoader(batch, max_batch=2)
+    await loader.load_many([2, 4, 6, 8, 10])
+    assert batch.calls == [[2, 4], [6, 8], [10]]
+
+
+async def test_failure_is_not_memoized():
+    batch = FakeBatch()
+    batch.fail = RuntimeError("db down")
+    loader = DataLoader(batch)
+    with pytest.raises(RuntimeError):
+        await loader.load(2)
+
+    batch.fail = None
+    assert await loader.load(2) == "v2"
+    assert batch.calls == [[2], [2]]
+
+
+async def test_clear_during_batch_still_resolves_waiters():
+    batch = FakeBatch()
+    loader = DataLoader(batch)
+    pending = loader.load(2)
+    loader.clear(2)  # 배치 실행 전 memoize 제거
+    assert await asyncio.wait_for(pending, timeout=1) == "v2"
+
+    # 제거된 키는 다음 load()에서 다시 조회
+    assert await loader.load(2) == "v2"
+    assert batch.calls == [[2], [2]]
+
+
+async def test_cancelled_batch_cancels_waiters():
+    started = asyncio.Event()
+
+    async def slow(keys):
+        started.set()
+        await asyncio.sleep(10)
+        return {}
+
+    loader = DataLoader(slow)
+    pending = loader.load(1)
+    await started.wait()
+    for task in list(loader._tasks):
+        task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(pending, timeout=1)
@@ -0,0 +1,123 @@
+"""RetryRunner backoff / 재시도 판정 단위 테스트 (DB 불필요)"""
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from src.infrastructure.database.retry import (
+    RetryableConflict,
+    RetryPolicy,
+    RetryRunner,
+    is_retryable,
+)
+
+pytestmark = pytest.mark.asyncio
+
+# 테스트 시간을 줄이기 위해 backoff를 아주 짧게
+FAST = RetryPolicy(max_attempts=5, base_ms=0.01, cap_ms=0.05, deadline_ms=1000)
+
+
+class Attempts:
+    """처음 conflicts번은 충돌, 이후 성공하는 attempt + rollback 호출 기록"""
+
+    def __init__(self, conflicts: int):
+        self.conflicts = conflicts
+        self.calls = 0
+        self.rollbacks = 0
+
+    async def attempt(self) -> str:
+        self.calls += 1
+        if self.calls <= self.conflicts:
+            raise RetryableConflict("Version mismatch")
+        return "ok"
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+def _dbapi_error(sqlstate: str | None) -> DBAPIError:
+    class Orig(Exception):
+        pass
+
+    orig = Orig()
+    orig.sqlstate = sqlstate
+    return DBAPIError("UPDATE ...", {}, orig)
+
+
+async def test_backoff_is_full_jitter_within_cap():
+    policy = RetryPolicy(base_ms=2, cap_ms=100)
+    for retry in range(10):
+        upper = min(100, 2 * 2**retry)
+        delays = [policy.backoff_ms(retry) for _ in range(200)]
+        assert all(0 <= d <= upper for d in delays)
+    # jitter -> 같은 재시도 횟수에서도 값이 분산
+    assert len({policy.backoff_ms(5) for _ in range(20)}) > 1
+
+
+async def test_succeeds_after_conflicts():
+    runner = RetryRunner()
+    attempts = Attempts(conflicts=2)
+    outcome = await runner.run("optimistic", attempts.attempt, attempts.rollback, FAST)
+
+    assert outcome.value == "ok"
+    assert outcome.retries == 2
+    assert outcome.error is None
+    assert attempts.rollbacks == 2  # 충돌마다 대기 전에 rollback
+
+    stats = runner.to_dict()["optimistic"]
+    assert stats["calls"] == 1
+    assert stats["attempts"] == 3
+    assert stats["conflicts"] == 2
+    assert stats["gave_up"] == 0
+    assert stats["abort_rate"] == round(2 / 3, 4)
+
+
+async def test_gives_up_after_max_attempts():
+    runner = RetryRunner()
+    attempts = Attempts(conflicts=100)
+    outcome = await runner.run("optimistic", attempts.attempt, attempts.rollback, FAST)
+
+    assert outcome.value is None
+    assert attempts.calls == FAST.max_attempts
+    assert outcome.retries == FAST.max_attempts - 1
+    assert outcome.error == "Max retries exceeded: Version mismatch"
+    assert runner.stats["optimistic"].gave_up == 1
+
+
+async def test_gives_up_when_deadline_would_pass():
+    runner = RetryRunner()
+    attempts = Attempts(conflicts=100)
+    policy = RetryPolicy(max_attempts=100, base_ms=50, cap_ms=50, deadline_ms=0)
+    outcome = await runner.run("serializable", attempts.attempt, attempts.rollback, policy)
+
+    # backoff 대기가 deadline을 넘음 -> 대기 없이 바로 포기
+    assert attempts.calls == 1
+    assert outcome.error.startswith("Retry deadline exceeded")
+
+
+async def test_other_errors_are_not_retried():
+    runner = RetryRunner()
+
+    async def attempt():
+        raise ValueError("bug")
+
+    async def rollback():
+        raise AssertionError("rollback은 충돌일 때만 호출")
+
+    with pytest.raises(ValueError):
+        await runner.run("optimistic", attempt, rollback, FAST)
+    assert runner.stats["optimistic"].attempts == 1
+
+
+async def test_is_retryable_sqlstates():
+    assert is_retryable(_dbapi_error("40001"))  # serialization_failure
+    assert is_retryable(_dbapi_error("40P01"))  # deadlock_detected
+    assert not is_retryable(_dbapi_error("23505"))  # unique_violation
+    assert not is_retryable(_dbapi_error(None))
+
+
+async def test_reset_clears_stats():
+    runner = RetryRunner()
+    attempts = Attempts(conflicts=0)
+    await runner.run("optimistic", attempts.attempt, attempts.rollback, FAST)
+    runner.reset()
+    assert runner.to_dict() == {}
@@ -437,4 +437,137 @@ SELECT
     0,
     NOW()
 FROM generate_series(1, 10) AS g
-ON CONFLICT DO NOTHING;
\ No newline at end of file
+ON CONFLICT DO NOTHING;
+
+-- product_stock_shards 테이블 (Sharded 전략: 상품 재고를 N개 행으로 분산)
+-- 재고 = SUM(stock), 차감은 잠기지 않은 shard 1개만 (FOR UPDATE SKIP LOCKED)
+CREATE TABLE IF NOT EXISTS product_stock_shards (
+    product_id INTEGER NOT NULL REFERENCES products(id) ON DELETE CASCADE,
+    shard INTEGER NOT NULL,
+    stock INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (product_id, shard)
+);
+
+-- 상품별 8개 shard로 재고 1000개 분배 (125개씩)
+INSERT INTO product_stock_shards (product_id, shard, stock)
+SELECT p.id, s, 125
+FROM products p, generate_series(0, 7) AS s
+ON CONFLICT DO NOTHING;
+
+-- ============================================
+-- 18-aggregation: 증분 롤업 테이블 (/aggregation/stats/.../rollup)
+-- ============================================
+-- 쓰기 시 트리거가 delta 행을 추가 (append-only -> 롤업 행 락 경합 없음)
+-- 백그라운드 applier가 delta를 모아 롤업에 반영 후 삭제
+-- 트리거는 비활성 상태로 생성 (롤업 미사용 시 쓰기마다 트리거 비용/delta 누적 없음)
+-- -> ROLLUP_APPLIER=true 워커가 시작 시 ENABLE + 전체 재계산
+-- 조회는 롤업만 읽음 (users_wide / posts 전체 스캔 없음)
+
+-- 1. 국가별 롤업 (users_wide)
+CREATE TABLE IF NOT EXISTS country_stats_rollup (
+    country VARCHAR(100) PRIMARY KEY, -- NULL 국가는 ''
+    user_count BIGINT NOT NULL DEFAULT 0,
+    total_logins BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS country_stats_delta (
+    id BIGSERIAL PRIMARY KEY,
+    country VARCHAR(100) NOT NULL,
+    user_count INTEGER NOT NULL,
+    total_logins BIGINT NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT clock_timestamp()
+);
+
+CREATE OR REPLACE FUNCTION users_wide_stats_delta() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO country_stats_delta (country, user_count, total_logins)
+        VALUES (COALESCE(OLD.country, ''), -1, -COALESCE(OLD.login_count, 0));
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO country_stats_delta (country, user_count, total_logins)
+        VALUES (COALESCE(NEW.country, ''), 1, COALESCE(NEW.login_count, 0));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_users_wide_stats_delta ON users_wide;
+CREATE TRIGGER trg_users_wide_stats_delta
+    AFTER INSERT OR DELETE ON users_wide
+    FOR EACH ROW EXECUTE FUNCTION users_wide_stats_delta();
+
+-- 집계 컬럼이 실제로 바뀐 UPDATE만
+DROP TRIGGER IF EXISTS trg_users_wide_stats_delta_update ON users_wide;
+CREATE TRIGGER trg_users_wide_stats_delta_update
+    AFTER UPDATE OF country, login_count ON users_wide
+    FOR EACH ROW
+    WHEN (OLD.country IS DISTINCT FROM NEW.country
+          OR OLD.login_count IS DISTINCT FROM NEW.login_count)
+    EXECUTE FUNCTION users_wide_stats_delta();
+
+ALTER TABLE users_wide
+    DISABLE TRIGGER trg_users_wide_stats_delta,
+    DISABLE TRIGGER trg_users_wide_stats_delta_update;
+
+-- 2. 작가별 롤업 (posts, 작가 이름은 조회 시 authors와 PK JOIN)
+CREATE TABLE IF NOT EXISTS author_stats_rollup (
+    author_id INTEGER PRIMARY KEY REFERENCES authors(id),
+    post_count BIGINT NOT NULL DEFAULT 0,
+    total_views BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS author_stats_delta (
+    id BIGSERIAL PRIMARY KEY,
+    author_id INTEGER NOT NULL,
+    post_count INTEGER NOT NULL,
+    total_views BIGINT NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT clock_timestamp()
+);
+
+CREATE OR REPLACE FUNCTION posts_stats_delta() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO author_stats_delta (author_id, post_count, total_views)
+        VALUES (OLD.author_id, -1, -COALESCE(OLD.view_count, 0));
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO author_stats_delta (author_id, post_count, total_views)
+        VALUES (NEW.author_id, 1, COALESCE(NEW.view_count, 0));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_posts_stats_delta ON posts;
+CREATE TRIGGER trg_posts_stats_delta
+    AFTER INSERT OR DELETE ON posts
+    FOR EACH ROW EXECUTE FUNCTION posts_stats_delta();
+
+DROP TRIGGER IF EXISTS trg_posts_stats_delta_update ON posts;
+CREATE TRIGGER trg_posts_stats_delta_update
+    AFTER UPDATE OF author_id, view_count ON posts
+    FOR EACH ROW
+    WHEN (OLD.author_id IS DISTINCT FROM NEW.author_id
+          OR OLD.view_count IS DISTINCT FROM NEW.view_count)
+    EXECUTE FUNCTION posts_stats_delta();
+
+ALTER TABLE posts
+    DISABLE TRIGGER trg_posts_stats_delta,
+    DISABLE TRIGGER trg_posts_stats_delta_update;
+
+-- 3. 초기 롤업 (전체 재계산 - POST /aggregation/stats/rollup/rebuild 와 동일)
+TRUNCATE country_stats_delta, author_stats_delta;
+DELETE FROM country_stats_rollup;
+INSERT INTO country_stats_rollup (country, user_count, total_logins)
+SELECT COALESCE(country, ''), COUNT(*), COALESCE(SUM(login_count), 0)
+FROM users_wide
+GROUP BY COALESCE(country, '');
+
+DELETE FROM author_stats_rollup;
+INSERT INTO author_stats_rollup (author_id, post_count, total_views)
+SELECT author_id, COUNT(*), COALESCE(SUM(view_count), 0)
+FROM posts
+GROUP BY author_id;
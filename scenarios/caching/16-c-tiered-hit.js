@@ -0,0 +1,62 @@
+// scenarios/caching/16-c-tiered-hit.js
+// 100% 캐시 히트 - Redis 단독(L2) vs L1(프로세스 메모리) + L2 2단 캐시 비교
+// Redis 필요: docker-compose에서 redis 서비스 실행 필수
+import http from "k6/http";
+import { check, group } from "k6";
+import { BASE_URL, defaultOptions } from "../config.js";
+
+const MAX_USER_ID = 1000;
+
+export const options = {
+  ...defaultOptions,
+  thresholds: {
+    "group_duration{group:::A. Redis Only (L2)}": ["p(95)<10"],
+    "group_duration{group:::B. Tiered (L1 + L2)}": ["p(95)<10"],
+  },
+};
+
+export function setup() {
+  console.log("=== 16-c. Tiered Cache Hit Scenario ===");
+
+  // 1. 캐시 초기화 (Redis + L1)
+  http.del(`${BASE_URL}/cache/flush`);
+
+  // 2. 전체 사용자 Redis 워밍업 (1~1000 전부)
+  // L1은 tiered 첫 조회 시 L2에서 채워짐 (source: l2 -> 이후 l1)
+  const warmupRes = http.post(`${BASE_URL}/cache/warmup?count=${MAX_USER_ID}`);
+  console.log(`Warmup: ${warmupRes.json().warmed_count} users cached in Redis`);
+
+  return {};
+}
+
+export default function () {
+  const userId = Math.floor(Math.random() * MAX_USER_ID) + 1;
+
+  // ============================================
+  // A. Redis Only: 매 요청 Redis GET (네트워크 왕복)
+  // ============================================
+  group("A. Redis Only (L2)", function () {
+    const res = http.get(`${BASE_URL}/cache/users/${userId}/cached`);
+    check(res, {
+      "redis status 200": (r) => r.status === 200,
+      "redis source is cache": (r) => r.json().source === "cache",
+    });
+  });
+
+  // ============================================
+  // B. Tiered: L1 히트 시 Redis 왕복 생략
+  // ============================================
+  group("B. Tiered (L1 + L2)", function () {
+    const res = http.get(`${BASE_URL}/cache/users/${userId}/tiered`);
+    check(res, {
+      "tiered status 200": (r) => r.status === 200,
+      "tiered source is l1 or l2": (r) =>
+        ["l1", "l2"].includes(r.json().source),
+    });
+  });
+}
+
+export function teardown() {
+  http.del(`${BASE_URL}/cache/flush`);
+  console.log("Cache flushed after test");
+}
@@ -0,0 +1,103 @@
+// scenarios/caching/16-d-stampede.js
+// Cold-start Stampede - 캐시 flush 직후 동일 키에 동시 미스 집중 (thundering herd)
+// 기존 캐시(cached) vs 요청 병합(coalesced) 비교
+// Redis 필요: docker-compose에서 redis 서비스 실행 필수
+import http from "k6/http";
+import { check } from "k6";
+import { Counter } from "k6/metrics";
+import { BASE_URL } from "../config.js";
+
+// 소수의 핫 키에 트래픽 집중
+const HOT_KEYS = 10;
+const VUS = 100;
+const DURATION = "30s";
+// 멀티 워커 환경에서 워커 간 병합까지 확인하려면 DISTRIBUTED=true
+const DISTRIBUTED = __ENV.DISTRIBUTED === "true";
+
+// DB까지 내려간 요청 수 (병합 시 대부분 coalesced로 흡수되어야 함)
+const dbLoads = new Counter("db_loads");
+const coalescedLoads = new Counter("coalesced_loads");
+
+export const options = {
+  summaryTrendStats: ["avg", "min", "med", "max", "p(90)", "p(95)", "p(99)"],
+  scenarios: {
+    // 1초마다 핫 키 삭제 -> 매번 cold-start 재현
+    flusher: {
+      executor: "constant-arrival-rate",
+      exec: "flushHotKeys",
+      rate: 1,
+      timeUnit: "1s",
+      duration: "65s",
+      preAllocatedVUs: 1,
+    },
+    cached: {
+      executor: "constant-vus",
+      exec: "hitCached",
+      vus: VUS,
+      duration: DURATION,
+    },
+    coalesced: {
+      executor: "constant-vus",
+      exec: "hitCoalesced",
+      vus: VUS,
+      duration: DURATION,
+      startTime: "35s",
+    },
+  },
+  thresholds: {
+    "http_req_duration{scenario:cached}": ["p(99)<500"],
+    "http_req_duration{scenario:coalesced}": ["p(99)<200"],
+  },
+};
+
+export function setup() {
+  console.log("=== 16-d. Cold-start Stampede Scenario ===");
+  console.log(`Hot keys: ${HOT_KEYS}, VUs: ${VUS}, distributed: ${DISTRIBUTED}`);
+  http.del(`${BASE_URL}/cache/flush`);
+  return {};
+}
+
+function hotUserId() {
+  return Math.floor(Math.random() * HOT_KEYS) + 1;
+}
+
+function recordSource(res) {
+  const source = res.json().source;
+  if (source === "database") dbLoads.add(1);
+  if (source === "coalesced") coalescedLoads.add(1);
+}
+
+export function flushHotKeys() {
+  for (let userId = 1; userId <= HOT_KEYS; userId++) {
+    http.del(`${BASE_URL}/cache/users/${userId}`);
+  }
+}
+
+// ============================================
+// A. Cached: 동시 미스가 각자 DB 조회 + SETEX
+// ============================================
+export function hitCached() {
+  const res = http.get(`${BASE_URL}/cache/users/${hotUserId()}/cached`);
+  check(res, {
+    "cached status 200": (r) => r.status === 200,
+  });
+  recordSource(res);
+}
+
+// ============================================
+// B. Coalesced: 키당 DB 조회 1회를 동시 미스가 공유
+// ============================================
+export function hitCoalesced() {
+  const res = http.get(
+    `${BASE_URL}/cache/users/${hotUserId()}/coalesced?distributed=${DISTRIBUTED}`
+  );
+  check(res, {
+    "coalesced status 200": (r) => r.status === 200,
+  });
+  recordSource(res);
+}
+
+export function teardown() {
+  http.del(`${BASE_URL}/cache/flush`);
+  console.log("Cache flushed after test");
+}
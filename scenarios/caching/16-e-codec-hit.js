@@ -0,0 +1,67 @@
+// scenarios/caching/16-e-codec-hit.js
+// 100% 캐시 히트 - 캐시 값 직렬화 codec 비교 (json / orjson / msgpack / pickle / struct)
+// Redis 필요: docker-compose에서 redis 서비스 실행 필수
+import http from "k6/http";
+import { check, group } from "k6";
+import { Trend } from "k6/metrics";
+import { BASE_URL, defaultOptions } from "../config.js";
+
+const MAX_USER_ID = 1000;
+const CODECS = ["json", "orjson", "msgpack", "pickle", "struct"];
+
+// 서버에서 측정한 역직렬화 시간 / 값 크기 (codec 태그로 구분)
+const decodeMs = new Trend("codec_decode_ms");
+const encodedSize = new Trend("codec_encoded_size");
+
+const thresholds = {};
+for (const codec of CODECS) {
+  thresholds[`group_duration{group:::${codec}}`] = ["p(95)<10"];
+}
+
+export const options = {
+  ...defaultOptions,
+  thresholds,
+};
+
+export function setup() {
+  console.log("=== 16-e. Codec Hit Scenario ===");
+
+  // 1. 캐시 초기화
+  http.del(`${BASE_URL}/cache/flush`);
+
+  // 2. codec별 전체 사용자 워밍업 (1~1000 전부)
+  for (const codec of CODECS) {
+    const res = http.post(
+      `${BASE_URL}/cache/warmup/pipeline?count=${MAX_USER_ID}&codec=${codec}`
+    );
+    console.log(`Warmup [${codec}]: ${res.json().warmed_count} users cached`);
+  }
+
+  return {};
+}
+
+export default function () {
+  const userId = Math.floor(Math.random() * MAX_USER_ID) + 1;
+
+  for (const codec of CODECS) {
+    group(codec, function () {
+      const res = http.get(
+        `${BASE_URL}/cache/users/${userId}/codec?codec=${codec}`
+      );
+      const ok = check(res, {
+        [`${codec} status 200`]: (r) => r.status === 200,
+        [`${codec} source is cache`]: (r) => r.json().source === "cache",
+      });
+      if (ok) {
+        const body = res.json();
+        decodeMs.add(body.decode_ms, { codec });
+        encodedSize.add(body.encoded_size, { codec });
+      }
+    });
+  }
+}
+
+export function teardown() {
+  http.del(`${BASE_URL}/cache/flush`);
+  console.log("Cache flushed after test");
+}
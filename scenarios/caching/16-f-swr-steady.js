@@ -0,0 +1,56 @@
+// scenarios/caching/16-f-swr-steady.js
+// 정상 부하 장시간 유지 - 고정 TTL(cached) vs Stale-While-Revalidate(swr) 비교
+// CACHE_TTL(300초) 만료 시점의 지연 급증(latency cliff)을 보기 위해 TTL보다 길게 실행
+// Redis 필요: docker-compose에서 redis 서비스 실행 필수
+import http from "k6/http";
+import { check, group } from "k6";
+import { BASE_URL, defaultOptions } from "../config.js";
+
+const MAX_USER_ID = 1000;
+
+export const options = {
+  ...defaultOptions,
+  duration: __ENV.DURATION || "6m",
+  thresholds: {
+    "group_duration{group:::A. Fixed TTL}": ["p(99)<100"],
+    "group_duration{group:::B. SWR}": ["p(99)<20"],
+  },
+};
+
+export function setup() {
+  console.log("=== 16-f. SWR Steady Load Scenario ===");
+  http.del(`${BASE_URL}/cache/flush`);
+  return {};
+}
+
+export default function () {
+  const userId = Math.floor(Math.random() * MAX_USER_ID) + 1;
+
+  // ============================================
+  // A. Fixed TTL: 만료 후 첫 요청이 DB 지연을 그대로 부담
+  // ============================================
+  group("A. Fixed TTL", function () {
+    const res = http.get(`${BASE_URL}/cache/users/${userId}/cached`);
+    check(res, {
+      "cached status 200": (r) => r.status === 200,
+    });
+  });
+
+  // ============================================
+  // B. SWR: 만료 후에도 stale 즉시 반환 + 백그라운드 갱신
+  // ============================================
+  group("B. SWR", function () {
+    const res = http.get(`${BASE_URL}/cache/users/${userId}/swr`);
+    check(res, {
+      "swr status 200": (r) => r.status === 200,
+      "swr has valid source": (r) =>
+        ["cache", "stale", "database"].includes(r.json().source),
+    });
+  });
+}
+
+export function teardown() {
+  const stats = http.get(`${BASE_URL}/cache/swr/stats`).json();
+  console.log(`SWR stats (one worker): ${JSON.stringify(stats)}`);
+  http.del(`${BASE_URL}/cache/flush`);
+}
@@ -0,0 +1,68 @@
+// scenarios/caching/16-g-near-cache.js
+// 100% 캐시 히트 + 소량 쓰기 - Redis 직접 조회 vs near-cache(CLIENT TRACKING) 비교
+// 실행: REDIS_CLIENT_TRACKING=true docker compose --profile cache --profile fastapi-pragmatic up -d
+import http from "k6/http";
+import { check, group } from "k6";
+import { BASE_URL, defaultOptions } from "../config.js";
+
+const MAX_USER_ID = 1000;
+// 일부 요청은 캐시 키 삭제 (다른 워커의 쓰기 시뮬레이션 -> 무효화 메시지 발생)
+const INVALIDATE_RATIO = 0.01;
+
+export const options = {
+  ...defaultOptions,
+  thresholds: {
+    "group_duration{group:::A. Redis Only}": ["p(95)<10"],
+    "group_duration{group:::B. Near Cache}": ["p(95)<10"],
+  },
+};
+
+export function setup() {
+  console.log("=== 16-g. Near Cache (Client Tracking) Scenario ===");
+
+  // near-cache 비활성화 시 503 -> 시작 전 확인
+  const probe = http.get(`${BASE_URL}/cache/users/1/near`);
+  if (probe.status === 503) {
+    throw new Error("Set REDIS_CLIENT_TRACKING=true on the server first");
+  }
+
+  http.del(`${BASE_URL}/cache/flush`);
+  const warmupRes = http.post(`${BASE_URL}/cache/warmup?count=${MAX_USER_ID}`);
+  console.log(`Warmup: ${warmupRes.json().warmed_count} users cached in Redis`);
+  return {};
+}
+
+export default function () {
+  const userId = Math.floor(Math.random() * MAX_USER_ID) + 1;
+
+  if (Math.random() < INVALIDATE_RATIO) {
+    http.del(`${BASE_URL}/cache/users/${userId}`);
+  }
+
+  // ============================================
+  // A. Redis Only: 매 요청 Redis GET
+  // ============================================
+  group("A. Redis Only", function () {
+    const res = http.get(`${BASE_URL}/cache/users/${userId}/cached`);
+    check(res, {
+      "redis status 200": (r) => r.status === 200,
+    });
+  });
+
+  // ============================================
+  // B. Near Cache: 로컬 히트 시 Redis 왕복 생략, 무효화는 서버가 push
+  // ============================================
+  group("B. Near Cache", function () {
+    const res = http.get(`${BASE_URL}/cache/users/${userId}/near`);
+    check(res, {
+      "near status 200": (r) => r.status === 200,
+      "near has valid source": (r) =>
+        ["near", "l2", "database"].includes(r.json().source),
+    });
+  });
+}
+
+export function teardown() {
+  http.del(`${BASE_URL}/cache/flush`);
+  console.log("Cache flushed after test");
+}
@@ -0,0 +1,59 @@
+// scenarios/caching/16-h-absent-ids.js
+// 존재하지 않는 사용자 ID 반복 조회 - 캐시 우회(DB 직행) 여부 측정
+// A. cached: 음성 캐시(짧은 TTL)로 같은 ID 재조회 시 DB 미접근
+// B. users API: USER_BLOOM_FILTER=true일 때만 DB 없이 404 (false면 매번 DB 조회)
+//    Bloom 필터는 워커 간 전파에 무효화 버스 필요 -> CACHE_INVALIDATION_BUS=postgres 함께 설정
+// Redis 필요: docker-compose에서 redis 서비스 실행 필수
+import http from "k6/http";
+import { check, group } from "k6";
+import { BASE_URL, defaultOptions } from "../config.js";
+
+// 04 시나리오 등으로 생성될 수 있는 ID와 겹치지 않도록 충분히 큰 범위 사용
+const ABSENT_ID_START = 1000000;
+const ABSENT_ID_SPACE = parseInt(__ENV.ABSENT_ID_SPACE || "1000");
+
+export const options = {
+  ...defaultOptions,
+  thresholds: {
+    "group_duration{group:::A. Cached (negative cache)}": ["p(95)<20"],
+    "group_duration{group:::B. Users API}": ["p(95)<50"],
+  },
+};
+
+export function setup() {
+  console.log("=== 16-h. Absent IDs Scenario ===");
+  http.del(`${BASE_URL}/cache/flush`);
+  return {};
+}
+
+export default function () {
+  const userId = ABSENT_ID_START + Math.floor(Math.random() * ABSENT_ID_SPACE);
+
+  // ============================================
+  // A. Cached: 첫 조회만 DB, 이후 TTL 동안 음성 캐시로 404
+  // ============================================
+  group("A. Cached (negative cache)", function () {
+    const res = http.get(`${BASE_URL}/cache/users/${userId}/cached`, {
+      responseCallback: http.expectedStatuses(404),
+    });
+    check(res, {
+      "cached status 404": (r) => r.status === 404,
+    });
+  });
+
+  // ============================================
+  // B. Users API: Bloom 필터로 DB 조회 없이 404
+  // ============================================
+  group("B. Users API", function () {
+    const res = http.get(`${BASE_URL}/users/${userId}`, {
+      responseCallback: http.expectedStatuses(404),
+    });
+    check(res, {
+      "users status 404": (r) => r.status === 404,
+    });
+  });
+}
+
+export function teardown() {
+  http.del(`${BASE_URL}/cache/flush`);
+}
@@ -16,6 +16,10 @@ export const options = {
     "group_duration{group:::B. Eager Loading (JOIN)}": ["p(95)<100"],
     // Subquery (IN)도 빠를 것으로 예상
     "group_duration{group:::C. Subquery Loading (IN)}": ["p(95)<100"],
+    // DB에서 JSON 조립 (json_agg) - ORM/Pydantic 변환 없음
+    "group_duration{group:::D. JSON Aggregation (json_agg)}": ["p(95)<50"],
+    // DataLoader: lazy와 같은 author별 코드, 배치 쿼리 (ANY)
+    "group_duration{group:::E. DataLoader (ANY)}": ["p(95)<100"],
   },
 };
 
@@ -62,4 +66,30 @@ export default function () {
       "subquery has posts": (r) => r.json()[0].posts.length > 0,
     });
   });
+  // ============================================
+  // D. JSON Aggregation (json_agg + json_build_object)
+  // ============================================
+  group("D. JSON Aggregation (json_agg)", function () {
+    const res = http.get(
+      `${BASE_URL}/n-plus-one/json-agg?limit=${LIMIT}&offset=${randomOffset}`
+    );
+    check(res, {
+      "json-agg status 200": (r) => r.status === 200,
+      "json-agg has authors": (r) => r.json().length > 0,
+      "json-agg has posts": (r) => r.json()[0].posts.length > 0,
+    });
+  });
+  // ============================================
+  // E. DataLoader (같은 tick의 load() 호출 -> WHERE author_id = ANY($1))
+  // ============================================
+  group("E. DataLoader (ANY)", function () {
+    const res = http.get(
+      `${BASE_URL}/n-plus-one/dataloader?limit=${LIMIT}&offset=${randomOffset}`
+    );
+    check(res, {
+      "dataloader status 200": (r) => r.status === 200,
+      "dataloader has authors": (r) => r.json().length > 0,
+      "dataloader has posts": (r) => r.json()[0].posts.length > 0,
+    });
+  });
 }
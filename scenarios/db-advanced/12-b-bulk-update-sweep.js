@@ -0,0 +1,68 @@
+// scenarios/db-advanced/12-b-bulk-update-sweep.js
+// Bulk UPDATE 방식 비교 - 건수별(1k / 10k / 100k) 1회씩 측정
+// CASE WHEN (SQL 문자열 생성, 매번 파싱) vs UNNEST (배열 바인드, prepared statement 재사용) vs UPSERT
+// CASE WHEN 100k는 수 분 걸릴 수 있음 -> 요청 타임아웃을 길게 설정
+import http from "k6/http";
+import { check, group } from "k6";
+import { Trend } from "k6/metrics";
+import { BASE_URL } from "../config.js";
+
+// 예: k6 run -e SIZES=1000,10000 (CASE WHEN 100k 제외)
+const SIZES = (__ENV.SIZES || "1000,10000,100000").split(",").map(Number);
+const MAX_SIZE = Math.max(...SIZES);
+const REQUEST_TIMEOUT = "600s";
+
+const MODES = [
+  { name: "CASE WHEN", path: "update-bulk" },
+  { name: "UNNEST", path: "update-unnest" },
+  { name: "UPSERT", path: "upsert" },
+];
+
+// 서버 측 elapsed_ms (mode, size 태그)
+const serverElapsed = new Trend("bulk_update_server_ms", true);
+
+export const options = {
+  summaryTrendStats: ["avg", "min", "med", "max", "p(90)", "p(95)", "p(99)"],
+  vus: 1,
+  iterations: 1,
+};
+
+export function setup() {
+  console.log("=== 12-b. Bulk UPDATE Sweep Scenario ===");
+
+  // UPDATE 대상 행 준비 (COPY로 빠르게 적재)
+  http.del(`${BASE_URL}/bulk-operations/cleanup`);
+  http.post(`${BASE_URL}/bulk-operations/insert-copy?count=${MAX_SIZE}`, null, {
+    timeout: REQUEST_TIMEOUT,
+  });
+  return {};
+}
+
+export default function () {
+  for (const size of SIZES) {
+    for (const mode of MODES) {
+      // ============================================
+      // 예: "UNNEST 10000"
+      // ============================================
+      group(`${mode.name} ${size}`, function () {
+        const res = http.post(
+          `${BASE_URL}/bulk-operations/${mode.path}?count=${size}`,
+          null,
+          { timeout: REQUEST_TIMEOUT }
+        );
+        const ok = check(res, {
+          [`${mode.path} status 200`]: (r) => r.status === 200,
+        });
+        if (ok) {
+          const elapsed = res.json().elapsed_ms;
+          serverElapsed.add(elapsed, { mode: mode.path, size: `${size}` });
+          console.log(`${mode.name.padEnd(9)} ${size}: ${elapsed.toFixed(1)} ms`);
+        }
+      });
+    }
+  }
+}
+
+export function teardown() {
+  http.del(`${BASE_URL}/bulk-operations/cleanup`);
+}
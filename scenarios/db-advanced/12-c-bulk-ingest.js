@@ -0,0 +1,85 @@
+// scenarios/db-advanced/12-c-bulk-ingest.js
+// 대용량 요청 본문 스트리밍 ingest - NDJSON / CSV 본문(50~500MB)을 청크 COPY로 적재
+// 서버 메모리 증가량(rss_growth_mb, 요청 중 RSS 최대 - 시작)이 본문 크기와 무관하게 유지되는지 확인
+// k6 클라이언트도 본문 전체를 메모리에 만들므로 SIZE_MB만큼 여유 메모리 필요
+import http from "k6/http";
+import { check, group } from "k6";
+import { Trend } from "k6/metrics";
+import { BASE_URL } from "../config.js";
+
+// 예: k6 run -e SIZE_MB=500 -e FORMAT=csv
+const SIZE_MB = parseInt(__ENV.SIZE_MB || "50");
+const FORMAT = __ENV.FORMAT || "ndjson"; // ndjson | csv
+const CHUNK_ROWS = parseInt(__ENV.CHUNK_ROWS || "5000");
+const REQUEST_TIMEOUT = "600s";
+
+const BLOCK_ROWS = 10000;
+
+// 서버 측 측정값
+const rowsPerSec = new Trend("ingest_rows_per_sec");
+const rssGrowthMb = new Trend("ingest_rss_growth_mb");
+
+export const options = {
+  summaryTrendStats: ["avg", "min", "med", "max", "p(90)", "p(95)", "p(99)"],
+  vus: 1,
+  iterations: parseInt(__ENV.ITERATIONS || "3"),
+};
+
+// 블록(10,000행)을 반복해 SIZE_MB 크기의 본문 생성 (VU init 시 1회)
+function buildBody() {
+  let block = "";
+  for (let i = 0; i < BLOCK_ROWS; i++) {
+    block +=
+      FORMAT === "csv"
+        ? `item_${i},${i}\n`
+        : `{"name":"item_${i}","value":${i}}\n`;
+  }
+  const repeat = Math.max(1, Math.ceil((SIZE_MB * 1024 * 1024) / block.length));
+  const header = FORMAT === "csv" ? "name,value\n" : "";
+  return { body: header + block.repeat(repeat), rows: BLOCK_ROWS * repeat };
+}
+
+const { body, rows } = buildBody();
+
+export function setup() {
+  console.log(
+    `=== 12-c. Bulk Ingest Scenario (${FORMAT}, ${SIZE_MB}MB, ${rows} rows) ===`
+  );
+  http.del(`${BASE_URL}/bulk-operations/cleanup`);
+  return {};
+}
+
+export default function () {
+  // ============================================
+  // 스트리밍 ingest (본문 전송 -> 서버는 청크마다 COPY)
+  // ============================================
+  group(`Ingest ${FORMAT}`, function () {
+    http.del(`${BASE_URL}/bulk-operations/cleanup`);
+
+    const res = http.post(
+      `${BASE_URL}/bulk-operations/ingest?format=${FORMAT}&chunk_rows=${CHUNK_ROWS}`,
+      body,
+      {
+        headers: {
+          "Content-Type": FORMAT === "csv" ? "text/csv" : "application/x-ndjson",
+        },
+        timeout: REQUEST_TIMEOUT,
+      }
+    );
+    const ok = check(res, {
+      "ingest status 200": (r) => r.status === 200,
+      "ingest count match": (r) => r.json().count === rows,
+    });
+    if (ok) {
+      const result = res.json();
+      rowsPerSec.add(result.rows_per_sec);
+      if (result.rss_growth_mb !== null) {
+        rssGrowthMb.add(result.rss_growth_mb);
+      }
+    }
+  });
+}
+
+export function teardown() {
+  http.del(`${BASE_URL}/bulk-operations/cleanup`);
+}
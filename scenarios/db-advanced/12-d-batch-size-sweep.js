@@ -0,0 +1,80 @@
+// scenarios/db-advanced/12-d-batch-size-sweep.js
+// commit 단위(batch_size) 스윕 - 1건마다 commit(fsync 병목) ~ 한 번에 commit(긴 트랜잭션) 사이 최적점 탐색
+// individual: 문장은 1건씩 그대로, commit 빈도만 변화 / batch·unnest: N건 문장 + commit
+import http from "k6/http";
+import { check, group } from "k6";
+import { Trend } from "k6/metrics";
+import { BASE_URL } from "../config.js";
+
+const COUNT = parseInt(__ENV.COUNT || "10000");
+// 예: k6 run -e BATCH_SIZES=1,100,10000
+const BATCH_SIZES = (__ENV.BATCH_SIZES || "1,10,100,1000,10000")
+  .split(",")
+  .map(Number);
+const REQUEST_TIMEOUT = "600s";
+
+const MODES = [
+  { name: "Individual INSERT", path: "insert-individual", needsRows: false },
+  { name: "Batch INSERT", path: "insert-batch", needsRows: false },
+  { name: "Individual UPDATE", path: "update-individual", needsRows: true },
+  { name: "UNNEST UPDATE", path: "update-unnest", needsRows: true },
+];
+
+// 서버 측 측정값 (mode, batch_size 태그)
+const totalMs = new Trend("batch_total_ms", true);
+const chunkMs = new Trend("batch_chunk_ms", true);
+
+export const options = {
+  summaryTrendStats: ["avg", "min", "med", "max", "p(90)", "p(95)", "p(99)"],
+  vus: 1,
+  iterations: 1,
+};
+
+export function setup() {
+  console.log(`=== 12-d. Batch Size Sweep Scenario (${COUNT} rows) ===`);
+  return {};
+}
+
+export default function () {
+  for (const mode of MODES) {
+    for (const batchSize of BATCH_SIZES) {
+      // ============================================
+      // 예: "Batch INSERT batch=100"
+      // ============================================
+      group(`${mode.name} batch=${batchSize}`, function () {
+        http.del(`${BASE_URL}/bulk-operations/cleanup`);
+        if (mode.needsRows) {
+          http.post(`${BASE_URL}/bulk-operations/insert-copy?count=${COUNT}`);
+        }
+
+        const res = http.post(
+          `${BASE_URL}/bulk-operations/${mode.path}?count=${COUNT}&batch_size=${batchSize}`,
+          null,
+          { timeout: REQUEST_TIMEOUT }
+        );
+        const ok = check(res, {
+          [`${mode.path} status 200`]: (r) => r.status === 200,
+          [`${mode.path} commits match`]: (r) =>
+            r.json().commits === Math.ceil(COUNT / batchSize),
+        });
+        if (!ok) return;
+
+        const result = res.json();
+        const tags = { mode: mode.path, batch_size: `${batchSize}` };
+        totalMs.add(result.elapsed_ms, tags);
+        for (const ms of result.chunk_ms) {
+          chunkMs.add(ms, tags);
+        }
+        const perRow = result.elapsed_ms / COUNT;
+        console.log(
+          `${mode.name.padEnd(17)} batch=${`${batchSize}`.padStart(5)}: ` +
+            `${result.elapsed_ms.toFixed(1)} ms total, ${perRow.toFixed(3)} ms/row`
+        );
+      });
+    }
+  }
+}
+
+export function teardown() {
+  http.del(`${BASE_URL}/bulk-operations/cleanup`);
+}
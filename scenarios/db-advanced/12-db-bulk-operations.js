@@ -4,6 +4,10 @@ import { check, group } from "k6";
 import { BASE_URL, defaultOptions } from "../config.js";
 
 const COUNT = 1000; // 벌크 작업 건수
+// COPY 모드 건수 (최대 1,000,000) - 예: k6 run -e COPY_COUNT=1000000
+const COPY_COUNT = parseInt(__ENV.COPY_COUNT || `${COUNT}`);
+// COPY 그룹 p95 상한: 건수에 비례 (행당 5µs, 최소 500ms) - 1M행이면 5s
+const COPY_P95_MS = Math.max(500, Math.ceil(COPY_COUNT / 200));
 
 export const options = {
   ...defaultOptions,
@@ -13,6 +17,10 @@ export const options = {
     "group_duration{group:::C. Raw INSERT}": ["p(95)<500"],
     "group_duration{group:::D. Individual UPDATE}": ["p(95)<30000"],
     "group_duration{group:::E. Bulk UPDATE}": ["p(95)<1000"],
+    "group_duration{group:::F. COPY INSERT}": [`p(95)<${COPY_P95_MS}`],
+    "group_duration{group:::G. Binary COPY INSERT}": [`p(95)<${COPY_P95_MS}`],
+    "group_duration{group:::H. UNNEST UPDATE}": ["p(95)<1000"],
+    "group_duration{group:::I. UPSERT}": ["p(95)<1000"],
   },
 };
 
@@ -94,4 +102,64 @@ export default function () {
       "bulk update status 200": (r) => r.status === 200,
     });
   });
+
+  // ============================================
+  // F. COPY INSERT (copy_records_to_table)
+  // ============================================
+  group("F. COPY INSERT", function () {
+    http.del(`${BASE_URL}/bulk-operations/cleanup`);
+
+    const res = http.post(
+      `${BASE_URL}/bulk-operations/insert-copy?count=${COPY_COUNT}`
+    );
+    check(res, {
+      "copy insert status 200": (r) => r.status === 200,
+      "copy insert count match": (r) => r.json().count === COPY_COUNT,
+    });
+  });
+
+  // ============================================
+  // G. Binary COPY INSERT (PGCOPY 스트림 직접 생성)
+  // ============================================
+  group("G. Binary COPY INSERT", function () {
+    http.del(`${BASE_URL}/bulk-operations/cleanup`);
+
+    const res = http.post(
+      `${BASE_URL}/bulk-operations/insert-copy-binary?count=${COPY_COUNT}`
+    );
+    check(res, {
+      "binary copy insert status 200": (r) => r.status === 200,
+      "binary copy insert count match": (r) => r.json().count === COPY_COUNT,
+    });
+  });
+
+  // ============================================
+  // H. UNNEST UPDATE (배열 바인드 파라미터)
+  // 건수별 비교는 12-b-bulk-update-sweep.js
+  // ============================================
+  group("H. UNNEST UPDATE", function () {
+    http.del(`${BASE_URL}/bulk-operations/cleanup`);
+    http.post(`${BASE_URL}/bulk-operations/insert-raw?count=${COUNT}`);
+
+    const res = http.post(
+      `${BASE_URL}/bulk-operations/update-unnest?count=${COUNT}`
+    );
+    check(res, {
+      "unnest update status 200": (r) => r.status === 200,
+    });
+  });
+
+  // ============================================
+  // I. UPSERT (INSERT ... ON CONFLICT DO UPDATE)
+  // ============================================
+  group("I. UPSERT", function () {
+    // 절반만 미리 삽입 -> 절반 UPDATE + 절반 INSERT
+    http.del(`${BASE_URL}/bulk-operations/cleanup`);
+    http.post(`${BASE_URL}/bulk-operations/insert-raw?count=${COUNT / 2}`);
+
+    const res = http.post(`${BASE_URL}/bulk-operations/upsert?count=${COUNT}`);
+    check(res, {
+      "upsert status 200": (r) => r.status === 200,
+    });
+  });
 }
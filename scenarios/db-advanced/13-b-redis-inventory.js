@@ -0,0 +1,79 @@
+// scenarios/db-advanced/13-b-redis-inventory.js
+// Redis 재고 (Lua 원자 차감 + 스트림 -> Postgres 비동기 반영) vs Atomic UPDATE
+// 요청 경로에서 DB 행 락이 빠졌을 때 지연시간 비교 + 종료 시 Redis/Postgres 정합성 확인
+// 서버 실행 시 REDIS_INVENTORY=true 필요
+import http from "k6/http";
+import { check, group, sleep } from "k6";
+import { BASE_URL, defaultOptions } from "../config.js";
+
+const PRODUCTS = {
+  atomic: 5, // Product 5: Atomic UPDATE (비교 기준)
+  redis: 7, // Product 7: Redis 재고
+};
+
+export const options = {
+  ...defaultOptions,
+  thresholds: {
+    "group_duration{group:::A. Atomic UPDATE}": ["p(95)<500"],
+    "group_duration{group:::B. Redis Inventory}": ["p(95)<200"],
+  },
+};
+
+export function setup() {
+  // Postgres 재고 리셋 -> Redis로 로드 (미반영 차감 폐기)
+  http.post(`${BASE_URL}/transactions/reset`);
+  const res = http.post(`${BASE_URL}/transactions/redis/load`);
+  if (res.status !== 200) {
+    throw new Error("Redis inventory disabled - start server with REDIS_INVENTORY=true");
+  }
+  console.log(`Loaded ${res.json().products} products into Redis (stock=1000)`);
+}
+
+export function teardown() {
+  // write-back consumer가 스트림을 비울 때까지 대기 후 정합성 확인
+  console.log("\n========== Redis / Postgres Reconcile ==========");
+  let report = null;
+  for (let i = 0; i < 30; i++) {
+    report = http.get(`${BASE_URL}/transactions/redis/reconcile`).json();
+    if (report.stream_length === 0) break;
+    sleep(1);
+  }
+
+  for (const p of report.products) {
+    if (p.product_id !== PRODUCTS.redis && p.drift === 0) continue;
+    console.log(
+      `Product ${p.product_id}: redis=${p.redis_stock}, pending=${p.pending}, ` +
+        `postgres=${p.postgres_stock}, drift=${p.drift}`
+    );
+  }
+  console.log(`in_sync=${report.in_sync}, stream_length=${report.stream_length}`);
+  console.log("================================================\n");
+}
+
+export default function () {
+  // ============================================
+  // A. Atomic UPDATE (요청마다 Postgres 행 락)
+  // ============================================
+  group("A. Atomic UPDATE", function () {
+    const res = http.post(
+      `${BASE_URL}/transactions/decrement/atomic?product_id=${PRODUCTS.atomic}&quantity=1`
+    );
+    check(res, {
+      "atomic status 200": (r) => r.status === 200,
+      "atomic never oversold": (r) => r.json().new_stock >= 0,
+    });
+  });
+
+  // ============================================
+  // B. Redis Inventory (Lua 차감, Postgres는 백그라운드 반영)
+  // ============================================
+  group("B. Redis Inventory", function () {
+    const res = http.post(
+      `${BASE_URL}/transactions/decrement/redis?product_id=${PRODUCTS.redis}&quantity=1`
+    );
+    check(res, {
+      "redis status 200": (r) => r.status === 200,
+      "redis never oversold": (r) => r.json().new_stock >= 0,
+    });
+  });
+}
@@ -0,0 +1,78 @@
+// scenarios/db-advanced/13-c-hot-row-contention.js
+// 핫 상품 1개에 동시 차감 집중 - VU 수(10~200)별 락 전략 비교
+// pessimistic(행 락) / advisory(pg_advisory_xact_lock) / sharded(N개 행 + SKIP LOCKED)
+// 전략 x VU 조합을 순서대로 실행 (서로 간섭 없음), 결과는 strategy/vus 태그별 http_req_duration
+import http from "k6/http";
+import { check } from "k6";
+import { BASE_URL } from "../config.js";
+
+// 예: k6 run -e VUS=10,50,200 -e STRATEGIES=pessimistic,sharded -e SHARDS=16
+const VUS = (__ENV.VUS || "10,50,100,200").split(",").map(Number);
+const STRATEGIES = (__ENV.STRATEGIES || "pessimistic,advisory,sharded").split(",");
+const STAGE_SECONDS = parseInt(__ENV.STAGE_SECONDS || "20");
+const SHARDS = parseInt(__ENV.SHARDS || "8");
+const PRODUCT_ID = 1;
+// 테스트 도중 재고가 소진되지 않도록 충분히
+const INITIAL_STOCK = 10000000;
+
+function buildScenarios() {
+  const scenarios = {};
+  const thresholds = {};
+  let offset = 0;
+  for (const strategy of STRATEGIES) {
+    for (const vus of VUS) {
+      scenarios[`${strategy}_${vus}`] = {
+        executor: "constant-vus",
+        vus: vus,
+        duration: `${STAGE_SECONDS}s`,
+        startTime: `${offset}s`,
+        gracefulStop: "5s",
+        env: { STRATEGY: strategy },
+        tags: { strategy: strategy, vus: `${vus}` },
+      };
+      // 태그별 지표가 summary에 나오도록 (값은 느슨하게)
+      thresholds[`http_req_duration{strategy:${strategy},vus:${vus}}`] = ["p(95)<10000"];
+      thresholds[`checks{strategy:${strategy},vus:${vus}}`] = ["rate>0.99"];
+      offset += STAGE_SECONDS + 5;
+    }
+  }
+  return { scenarios, thresholds };
+}
+
+const { scenarios, thresholds } = buildScenarios();
+
+export const options = {
+  summaryTrendStats: ["avg", "min", "med", "max", "p(90)", "p(95)", "p(99)"],
+  scenarios: scenarios,
+  thresholds: thresholds,
+};
+
+export function setup() {
+  console.log(
+    `=== 13-c. Hot Row Contention (${STRATEGIES.join(", ")} x VUs ${VUS.join(", ")}, ${SHARDS} shards) ===`
+  );
+  http.post(`${BASE_URL}/transactions/reset?stock=${INITIAL_STOCK}&shards=${SHARDS}`);
+}
+
+export default function () {
+  const strategy = __ENV.STRATEGY;
+  const res = http.post(
+    `${BASE_URL}/transactions/decrement/${strategy}?product_id=${PRODUCT_ID}&quantity=1`
+  );
+  check(res, {
+    [`${strategy} status 200`]: (r) => r.status === 200,
+    [`${strategy} success`]: (r) => r.json().success === true,
+  });
+}
+
+export function teardown() {
+  // 차감 합계 확인: products.stock(pessimistic + advisory) / shard 합계(sharded)
+  const product = http.get(`${BASE_URL}/transactions/products/${PRODUCT_ID}`).json();
+  const sharded = http.get(`${BASE_URL}/transactions/products/${PRODUCT_ID}/shards`).json();
+  console.log("\n========== Final Stock Results ==========");
+  console.log(`products.stock: ${INITIAL_STOCK - product.stock} decremented`);
+  console.log(
+    `shards: ${INITIAL_STOCK - sharded.stock} decremented, per shard=[${sharded.shards.join(", ")}]`
+  );
+  console.log("==========================================\n");
+}
@@ -9,6 +9,10 @@ const PRODUCTS = {
   pessimistic: 2,  // Product 2: Pessimistic Lock 테스트용
   optimistic: 3,   // Product 3: Optimistic Lock 테스트용
   serializable: 4, // Product 4: Serializable 테스트용
+  atomic: 5,       // Product 5: Atomic UPDATE 테스트용
+  combined: 6,     // Product 6: 요청 병합(Combined) 테스트용
+  advisory: 8,     // Product 8: Advisory Lock 테스트용
+  sharded: 9,      // Product 9: Sharded (SKIP LOCKED) 테스트용 - 재고는 shard 합계
 };
 
 export const options = {
@@ -18,12 +22,17 @@ export const options = {
     "group_duration{group:::B. Pessimistic Lock}": ["p(95)<1000"],
     "group_duration{group:::C. Optimistic Lock}": ["p(95)<1000"],
     "group_duration{group:::D. Serializable}": ["p(95)<1000"],
+    "group_duration{group:::E. Atomic UPDATE}": ["p(95)<500"],
+    "group_duration{group:::F. Combined}": ["p(95)<500"],
+    "group_duration{group:::G. Advisory Lock}": ["p(95)<1000"],
+    "group_duration{group:::H. Sharded}": ["p(95)<1000"],
   },
 };
 
 export function setup() {
   // 테스트 전 모든 상품 재고 리셋
   http.post(`${BASE_URL}/transactions/reset`);
+  http.del(`${BASE_URL}/transactions/retry/stats`);
   console.log("All products reset to stock=1000, version=0");
 }
 
@@ -36,6 +45,17 @@ export function teardown() {
     const data = res.json();
     console.log(`[${strategy}] Product ${productId}: stock=${data.stock}, version=${data.version}`);
   }
+  const sharded = http.get(`${BASE_URL}/transactions/products/${PRODUCTS.sharded}/shards`).json();
+  console.log(`[sharded] Product ${PRODUCTS.sharded}: shard total=${sharded.stock}, shards=[${sharded.shards.join(", ")}]`);
+
+  // 재시도 통계 (워커별 - 여러 워커면 응답한 워커 기준)
+  const stats = http.get(`${BASE_URL}/transactions/retry/stats`).json();
+  for (const [method, s] of Object.entries(stats)) {
+    console.log(
+      `[${method} retry] abort_rate=${s.abort_rate}, avg_retries=${s.avg_retries}, ` +
+        `gave_up=${s.gave_up}, wasted_ms=${s.wasted_ms}`
+    );
+  }
 
   console.log("==========================================\n");
 }
@@ -92,4 +112,59 @@ export default function () {
       "serializable success": (r) => r.json().success === true,
     });
   });
+
+  // ============================================
+  // E. Atomic UPDATE (조건부 UPDATE ... RETURNING 1문장)
+  // 재고 소진 후에는 success=false (Insufficient stock), 음수 재고 없음
+  // ============================================
+  group("E. Atomic UPDATE", function () {
+    const res = http.post(
+      `${BASE_URL}/transactions/decrement/atomic?product_id=${PRODUCTS.atomic}&quantity=1`
+    );
+    check(res, {
+      "atomic status 200": (r) => r.status === 200,
+      "atomic never oversold": (r) => r.json().new_stock >= 0,
+    });
+  });
+
+  // ============================================
+  // F. Combined (동시 차감 병합 -> 조건부 UPDATE 1회)
+  // batch_size = 함께 처리된 요청 수 (VU가 많을수록 커짐)
+  // ============================================
+  group("F. Combined", function () {
+    const res = http.post(
+      `${BASE_URL}/transactions/decrement/combined?product_id=${PRODUCTS.combined}&quantity=1`
+    );
+    check(res, {
+      "combined status 200": (r) => r.status === 200,
+      "combined never oversold": (r) => r.json().new_stock >= 0,
+    });
+  });
+
+  // ============================================
+  // G. Advisory Lock (pg_advisory_xact_lock)
+  // ============================================
+  group("G. Advisory Lock", function () {
+    const res = http.post(
+      `${BASE_URL}/transactions/decrement/advisory?product_id=${PRODUCTS.advisory}&quantity=1`
+    );
+    check(res, {
+      "advisory status 200": (r) => r.status === 200,
+      "advisory success": (r) => r.json().success === true,
+    });
+  });
+
+  // ============================================
+  // H. Sharded (재고를 N개 행으로 분산 + FOR UPDATE SKIP LOCKED)
+  // 재고 소진 후에는 success=false (Insufficient stock)
+  // ============================================
+  group("H. Sharded", function () {
+    const res = http.post(
+      `${BASE_URL}/transactions/decrement/sharded?product_id=${PRODUCTS.sharded}&quantity=1`
+    );
+    check(res, {
+      "sharded status 200": (r) => r.status === 200,
+      "sharded never oversold": (r) => r.json().new_stock >= 0,
+    });
+  });
 }
@@ -1,6 +1,8 @@
 // scenarios/real-world/18-aggregation.js
+// G/H/I (롤업) 측정 시 서버 실행에 ROLLUP_APPLIER=true 필요 (끄면 delta 트리거도 꺼져 롤업이 rebuild 시점 값으로 고정)
 import http from "k6/http";
 import { check, group } from "k6";
+import { Trend } from "k6/metrics";
 import { BASE_URL, defaultOptions } from "../config.js";
 
 export const options = {
@@ -14,9 +16,40 @@ export const options = {
     "group_duration{group:::D. Country Stats Raw}": ["p(95)<250"],
     "group_duration{group:::E. Author Stats ORM}": ["p(95)<150"],
     "group_duration{group:::F. Author Stats Raw}": ["p(95)<150"],
+    // 롤업: 원본 스캔 없이 요약 테이블만 조회
+    "group_duration{group:::G. Country Stats Rollup}": ["p(95)<100"],
+    "group_duration{group:::H. Author Stats Rollup}": ["p(95)<100"],
+    "group_duration{group:::I. Mixed Writes}": ["p(95)<200"],
+    // 독립 쿼리 동시 실행 (별도 연결 + asyncio.gather) vs 같은 세션 직렬
+    "group_duration{group:::J. Count Concurrent}": ["p(95)<300"],
+    "group_duration{group:::K. Dashboard Concurrent}": ["p(95)<500"],
+    "group_duration{group:::L. Dashboard Serial}": ["p(95)<700"],
+    // 근사 집계: reltuples + HyperLogLog (메모리) / TABLESAMPLE 1%
+    "group_duration{group:::M. Count Approx}": ["p(95)<50"],
+    "group_duration{group:::N. Country Stats Approx}": ["p(95)<100"],
   },
 };
 
+// 쓰기 대상 범위 (init_db.sql 시드: users_wide 100,000명, posts 약 10,000건)
+const USER_WIDE_COUNT = 100000;
+const POST_COUNT = parseInt(__ENV.POST_COUNT || "10000");
+
+// 롤업 최신성 (미반영 delta의 나이)
+const rollupStalenessMs = new Trend("rollup_staleness_ms");
+// 서버 측 wall-clock (mode 태그: concurrent | serial)
+const dashboardWallMs = new Trend("dashboard_wall_ms", true);
+// 근사값 상대 오차 범위 (error_bound / 값)
+const approxRelativeError = new Trend("approx_relative_error");
+
+export function setup() {
+  // 롤업을 원본과 일치시킨 뒤 시작
+  http.post(`${BASE_URL}/aggregation/stats/rollup/rebuild`);
+  const res = http.get(`${BASE_URL}/aggregation/stats/country/rollup?limit=1`);
+  if (res.status === 200 && !res.json().rollup.applier_running) {
+    console.warn("Rollup applier disabled - start server with ROLLUP_APPLIER=true");
+  }
+}
+
 export default function () {
   // ============================================
   // A. COUNT 비교 - ORM
@@ -82,4 +115,112 @@ export default function () {
       "author raw has post_count": (r) => r.json()[0].post_count > 0,
     });
   });
+  // ============================================
+  // G. 국가별 통계 - 롤업 (트리거 delta + 백그라운드 반영)
+  // ============================================
+  group("G. Country Stats Rollup", function () {
+    const res = http.get(`${BASE_URL}/aggregation/stats/country/rollup?limit=10`);
+    check(res, {
+      "country rollup status 200": (r) => r.status === 200,
+      "country rollup has results": (r) => r.json().items.length > 0,
+    });
+    if (res.status === 200) {
+      rollupStalenessMs.add(res.json().rollup.staleness_ms);
+    }
+  });
+  // ============================================
+  // H. 작가별 통계 - 롤업
+  // ============================================
+  group("H. Author Stats Rollup", function () {
+    const res = http.get(`${BASE_URL}/aggregation/stats/author/rollup?limit=10`);
+    check(res, {
+      "author rollup status 200": (r) => r.status === 200,
+      "author rollup has results": (r) => r.json().items.length > 0,
+    });
+    if (res.status === 200) {
+      rollupStalenessMs.add(res.json().rollup.staleness_ms);
+    }
+  });
+  // ============================================
+  // I. 쓰기 혼합 - 로그인/조회수 증가 (롤업 delta 발생)
+  // 위 집계 조회와 같은 테이블에 쓰기 -> raw는 잠금/스캔 비용, 롤업은 staleness로 확인
+  // ============================================
+  group("I. Mixed Writes", function () {
+    const userId = Math.floor(Math.random() * USER_WIDE_COUNT) + 1;
+    const postId = Math.floor(Math.random() * POST_COUNT) + 1;
+    const login = http.post(`${BASE_URL}/aggregation/writes/login?user_id=${userId}`);
+    const view = http.post(`${BASE_URL}/aggregation/writes/view?post_id=${postId}`);
+    check(login, { "write login status 200": (r) => r.status === 200 });
+    check(view, { "write view status 200": (r) => r.status === 200 });
+  });
+  // ============================================
+  // J. COUNT 3개 동시 실행 (A. Count ORM과 비교)
+  // ============================================
+  group("J. Count Concurrent", function () {
+    const res = http.get(`${BASE_URL}/aggregation/count/concurrent`);
+    check(res, {
+      "count concurrent status 200": (r) => r.status === 200,
+      "count concurrent has count_star": (r) => r.json().count_star > 0,
+    });
+  });
+  // ============================================
+  // K. 대시보드 - 서브쿼리 5개 동시 실행
+  // 요청 1건 = 연결 5개 -> 워커당 동시 사용 연결은 COMPOSITE_MAX_CONNECTIONS(기본 5, 풀 기본 5+10)로 제한
+  // VU가 많으면 subqueries 시간에 상한 대기가 포함됨 (풀 소진 대신 순서 대기)
+  // ============================================
+  group("K. Dashboard Concurrent", function () {
+    const res = http.get(`${BASE_URL}/aggregation/dashboard?limit=10`);
+    check(res, {
+      "dashboard concurrent status 200": (r) => r.status === 200,
+      "dashboard concurrent has stats": (r) => r.json().country_stats.length > 0,
+    });
+    if (res.status === 200) {
+      dashboardWallMs.add(res.json().timings.wall_ms, { mode: "concurrent" });
+    }
+  });
+  // ============================================
+  // L. 대시보드 - 같은 세션에서 직렬 실행 (비교 기준)
+  // ============================================
+  group("L. Dashboard Serial", function () {
+    const res = http.get(`${BASE_URL}/aggregation/dashboard?limit=10&serial=true`);
+    check(res, {
+      "dashboard serial status 200": (r) => r.status === 200,
+      "dashboard serial has stats": (r) => r.json().country_stats.length > 0,
+    });
+    if (res.status === 200) {
+      dashboardWallMs.add(res.json().timings.wall_ms, { mode: "serial" });
+    }
+  });  // ============================================
+  // M. COUNT 근사 (B. Count Raw와 비교)
+  // ============================================
+  group("M. Count Approx", function () {
+    const res = http.get(`${BASE_URL}/aggregation/count/raw?accuracy=approx`);
+    check(res, {
+      "count approx status 200": (r) => r.status === 200,
+      "count approx has error_bounds": (r) => r.json().error_bounds !== null,
+    });
+    if (res.status === 200) {
+      const body = res.json();
+      approxRelativeError.add(body.error_bounds.count_star / body.count_star, {
+        field: "count_star",
+      });
+    }
+  });
+  // ============================================
+  // N. 국가별 통계 근사 - TABLESAMPLE SYSTEM 1% (D. Country Stats Raw와 비교)
+  // ============================================
+  group("N. Country Stats Approx", function () {
+    const res = http.get(
+      `${BASE_URL}/aggregation/stats/country/raw?limit=10&accuracy=approx&sample_percent=1`
+    );
+    check(res, {
+      "country approx status 200": (r) => r.status === 200,
+    });
+    if (res.status === 200 && res.json().length > 0) {
+      const top = res.json()[0];
+      approxRelativeError.add(top.error_bound / top.user_count, {
+        field: "country_user_count",
+      });
+    }
+  });
 }